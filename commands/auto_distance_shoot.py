@@ -5,6 +5,7 @@ from commands2 import cmd
 from wpilib import SmartDashboard
 from subsystems.SS_Kraken import SS_Kraken
 from subsystems.SS_SwerveDrive import SS_SwerveDrive
+from subsystems.DashboardPublisher import DashboardPublisher
 
 class CMD_AutoDistanceShoot(commands2.Command):
     def __init__(self, shooter: SS_Kraken, swerve: SS_SwerveDrive):
@@ -13,18 +14,17 @@ class CMD_AutoDistanceShoot(commands2.Command):
         self.swerve = swerve
 
         self.addRequirements(self.shooter)
+        self._pub_required_speed = DashboardPublisher.number("SS_Telemetry/Shooter/Shooter Auto Distance Speed", epsilon=0.05)
 
     def get_required_shooter_speed_raw(self) -> float:
-        distance = max(self.swerve.range_to_target, 0.1)
-        # y=2.25x^{3}-19.78x^{2}+57.88x-18.38
-        return (2.25 * distance**3) - (19.78 * distance**2) + (57.88 * distance) - 18.38
+        return self.swerve.shot_solution.shooter_rps # same solution the padlock heading aims with
 
     def get_required_shooter_speed(self) -> float:
         return max(min(self.get_required_shooter_speed_raw(), 65), -65)
 
     def update_and_get_required_shooter_speed(self) -> float:
         required_speed = self.get_required_shooter_speed()
-        SmartDashboard.putNumber("SS_Telemetry/Shooter/Shooter Auto Distance Speed", required_speed)
+        self._pub_required_speed.set(required_speed)
         return required_speed
 
     def apply_required_shooter_speed(self) -> float:
@@ -7,6 +7,7 @@ from subsystems.SS_Kraken import SS_Kraken
 from subsystems.SS_SwerveDrive import SS_SwerveDrive
 from subsystems.SS_CANdleLight import SS_CANdleLight
 from commands.auto_distance_shoot import CMD_AutoDistanceShoot
+from subsystems.DashboardPublisher import DashboardPublisher
 
 
 def SEQ_shoot(shooter: SS_Kraken, feeder: SS_Kraken):
@@ -59,14 +60,15 @@ class CMD_ComboShoot(commands2.Command):
         self.addRequirements(self.ss_shooter, self.ss_feeder, self.ss_swerve)
         self._joystick = joystick
         self._auto_distance_shoot = CMD_AutoDistanceShoot(self.ss_shooter, self.ss_swerve)
+        self._pub_shooter_setpoint = DashboardPublisher.number("Shooter Setpoint", epsilon=0.05)
 
     def initialize(self):
         shooter_setpoint = self._auto_distance_shoot.apply_required_shooter_speed()
-        SmartDashboard.putNumber("Shooter Setpoint", shooter_setpoint)
+        self._pub_shooter_setpoint.set(shooter_setpoint)
 
     def execute(self):
         shooter_setpoint = self._auto_distance_shoot.apply_required_shooter_speed()
-        SmartDashboard.putNumber("Shooter Setpoint", shooter_setpoint)
+        self._pub_shooter_setpoint.set(shooter_setpoint)
         velocity_x = 0.0
         velocity_y = 0.0
         if self._joystick is not None:
@@ -77,7 +79,7 @@ class CMD_ComboShoot(commands2.Command):
             velocity_y,
         )
 
-        if self.ss_shooter.is_at_velocity():
+        if self.ss_shooter.will_be_at_velocity(): # feed as soon as the shot will leave at speed
             feeder_setpoint = self.ss_feeder.set_velocity_setpoint(
                 self.ss_feeder.get_dashboard_velocity_setpoint(),
                 publish_dashboard=False,
@@ -3,11 +3,16 @@ from __future__ import annotations
 import math
 from typing import Any, TYPE_CHECKING, cast
 
+import commands2
+import wpilib
 from pyfrc.physics.core import PhysicsInterface
 from pyfrc.physics.drivetrains import four_motor_swerve_drivetrain
+from wpimath.geometry import Pose2d, Transform2d, Twist2d
 from wpimath.units import metersToFeet
 
 from generated.tuner_constants_2026_GF import TunerConstants
+from subsystems.DashboardPublisher import DashboardPublisher
+from subsystems.TunableParameters import TunableNumber
 
 if TYPE_CHECKING:
     from phoenix6.hardware import TalonFX
@@ -205,12 +210,25 @@ class _PositionKrakenSim(_KrakenSim):
 
 class PhysicsEngine:
     """pyfrc physics engine that mirrors CTRE swerve module states in sim."""
+    _CONVERGED_M = 0.05 # pose error under which vision has pulled a kicked pose estimate back
 
     def __init__(self, physics_controller: PhysicsInterface, robot: Any):
         self.physics_controller = physics_controller
         self.robot = robot
 
-        self._drivetrain = None
+        self._swerve_subsystem = None
+        self._camera_pose_subsystem = None
+        self._vision_truth_pose = Pose2d()
+        self._vision_truth_pose_reset_time = -1.0
+        # Odometry errors for vision to correct, since the simulated wheels never slip on their own
+        self._tunable_odometry_slip = TunableNumber("Sim/Odometry Slip (fraction)", 0.0)
+        self._tunable_odometry_kick = TunableNumber("Sim/Odometry Kick (m)", 0.5)
+        wpilib.SmartDashboard.putData("Commands/Sim/Kick Odometry",
+                                      commands2.cmd.runOnce(self.kick_odometry).ignoringDisable(True))
+        self._kick_time: float | None = None
+        self._pub_pose_error = DashboardPublisher.number("Sim/Pose Error (m)", epsilon=0.005)
+        self._pub_convergence_time = DashboardPublisher.number("Sim/Vision Convergence Time (s)")
+        self.convergence_time: float | None = None
 
         # pyfrc expects wheelbase dimensions in feet.
         self._x_wheelbase_ft = metersToFeet(
@@ -229,26 +247,70 @@ class PhysicsEngine:
         self._intake_sim = _KrakenSim("ss_intake", default_max_rps=60.0, time_constant_s=0.15)
         self._extend_sim = _PositionKrakenSim("ss_extend", default_vmax_rps=2.0, default_amax_rps2=2.0)
 
-    def _try_get_drivetrain(self):
-        if self._drivetrain is not None:
-            return self._drivetrain
+    def _try_get_swerve_subsystem(self):
+        if self._swerve_subsystem is not None:
+            return self._swerve_subsystem
 
         container = getattr(self.robot, "container", None)
         if container is None:
             return None
 
-        swerve_subsystem = getattr(container, "ss_swerve_drive", None)
-        if swerve_subsystem is None:
+        self._swerve_subsystem = getattr(container, "ss_swerve_drive", None)
+        return self._swerve_subsystem
+
+    def _try_get_camera_pose_subsystem(self):
+        if self._camera_pose_subsystem is not None:
+            return self._camera_pose_subsystem
+
+        container = getattr(self.robot, "container", None)
+        if container is None:
             return None
 
-        self._drivetrain = getattr(swerve_subsystem, "drivetrain", None)
-        return self._drivetrain
+        self._camera_pose_subsystem = getattr(container, "ss_camera_pose_right", None)
+        return self._camera_pose_subsystem
+
+    def kick_odometry(self) -> None:
+        """Shift the pose estimate (not the robot) by the kick distance, like a collision, and time vision pulling it back."""
+        swerve_subsystem = self._try_get_swerve_subsystem()
+        if swerve_subsystem is None:
+            return
+        # The CTRE drivetrain's reset_pose, so SS_SwerveDrive doesn't treat it as a placement and move the truth too
+        swerve_subsystem.drivetrain.reset_pose(
+            swerve_subsystem.drive_state.pose.transformBy(Transform2d(self._tunable_odometry_kick.value, 0.0, 0.0)))
+        self._kick_time = wpilib.Timer.getFPGATimestamp()
+        self.convergence_time = None
+
+    def _update_vision_sim(self, swerve_subsystem, now: float, tm_diff: float) -> None:
+        camera_pose_subsystem = self._try_get_camera_pose_subsystem()
+        if camera_pose_subsystem is None:
+            return
+
+        # The simulated cameras need a ground truth apart from the pose estimate they correct, or vision
+        # would only ever agree with itself: integrate the simulated module speeds, less any wheel slip
+        # (the gyro doesn't slip), and jump only when the robot is placed (reset_pose at auto start).
+        drive_state = swerve_subsystem.drive_state
+        if swerve_subsystem.last_pose_reset_time != self._vision_truth_pose_reset_time:
+            self._vision_truth_pose = drive_state.pose
+            self._vision_truth_pose_reset_time = swerve_subsystem.last_pose_reset_time
+        else:
+            speeds = drive_state.speeds
+            traction = 1.0 - self._tunable_odometry_slip.value
+            self._vision_truth_pose = self._vision_truth_pose.exp(
+                Twist2d(speeds.vx * traction * tm_diff, speeds.vy * traction * tm_diff, speeds.omega * tm_diff))
+        camera_pose_subsystem.update_sim(self._vision_truth_pose)
+
+        pose_error = drive_state.pose.translation().distance(self._vision_truth_pose.translation())
+        self._pub_pose_error.set(round(pose_error, 3))
+        if self._kick_time is not None and pose_error < self._CONVERGED_M:
+            self.convergence_time = now - self._kick_time
+            self._pub_convergence_time.set(round(self.convergence_time, 2))
+            self._kick_time = None
 
     def update_sim(self, now: float, tm_diff: float) -> None:
-        drivetrain = self._try_get_drivetrain()
-        if drivetrain is not None:
-            state = drivetrain.get_state()
-            module_states = getattr(state, "module_states", None) if state is not None else None
+        swerve_subsystem = self._try_get_swerve_subsystem()
+        if swerve_subsystem is not None:
+            # Reuse the snapshot SS_SwerveDrive captured this loop instead of reading the drivetrain again
+            module_states = swerve_subsystem.drive_state.module_states
 
             if module_states and len(module_states) >= 4 and self._max_module_speed_mps != 0:
                 # Tuner constants create modules in this order: LF, RF, LB, RB.
@@ -275,6 +337,8 @@ class PhysicsEngine:
 
                 self.physics_controller.drive(speeds, tm_diff)
 
+            self._update_vision_sim(swerve_subsystem, now, tm_diff)
+
         # Update non-drivetrain TalonFX mechanisms.
         self._shooter_sim.update(self.robot, tm_diff)
         self._feeder_sim.update(self.robot, tm_diff)
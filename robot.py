@@ -1,15 +1,26 @@
+import time
 import wpilib
 import commands2
 from commands2 import cmd
-from commands2.button import Trigger
 from wpilib import Color8Bit, SmartDashboard, Timer, DriverStation
 from phoenix6 import HootAutoReplay
-from pathplannerlib.auto import AutoBuilder, NamedCommands
+from pathplannerlib.auto import NamedCommands
 from commands2.button import CommandXboxController
 from subsystems.ShiftTimer import ShiftTimer
 from generated.tuner_constants_2026_GF import TunerConstants
 from subsystems.SS_SwerveDrive import SS_SwerveDrive, PathfindPOVTarget
 from subsystems.SS_Kraken import SS_Kraken
+from subsystems.KrakenSignals import KrakenSignalRegistry
+from subsystems.DashboardPublisher import DashboardPublisher
+from subsystems.TunableParameters import TunableParameters
+from subsystems.DeviceStartup import DeviceStartup
+from subsystems.LoopTimer import LoopTimer
+from subsystems.GCPolicy import GCPolicy
+from subsystems.ShotTable import ShotTable
+from subsystems.AutoCache import AutoCache
+from subsystems.LazyCommands import LazyCommands
+from subsystems.FieldGeometry import FieldGeometry
+from subsystems.DriverInput import DriverInput
 from subsystems.SS_CANdleLight import SS_CANdleLight
 from subsystems.SS_CameraPose_left_old import SS_CameraPose_Left
 from subsystems.SS_CameraPose_right_old import SS_CameraPose_Right
@@ -20,16 +31,26 @@ class RobotContainer:
     def __init__(self) -> None:
         self.gamepad = None or CommandXboxController(0)
         DriverStation.silenceJoystickConnectionWarning(True)
+        self.driver_input = DriverInput(self.gamepad)
         self.canbus = TunerConstants.canbus
-        self.ss_shooter = None or SS_Kraken(3, self.canbus, "Shooter", inverted=True, max_rps=100, velocity_setpoint=40, kp=0.08, ki=0.0, kd=0.0, kv=0.012, ks=0.0)
-        self.ss_feeder = None or SS_Kraken(1, self.canbus, "Feeder", kp=1.0, velocity_setpoint=10, percent_power_setpoint=0.5)
-        self.ss_intake = None or SS_Kraken(4, self.canbus, "Intake", max_rps=120, percent_power_setpoint=0.9)
-        #self.ss_extend = None or SS_Kraken(6, self.canbus, "Extension", inverted=True, brake_mode=True, kp=5, ki=0.5, vmax=.5, amax=.5, jerk=2.5)
-        self.ss_candle_light_left = None or SS_CANdleLight(2, self.canbus, "Left")
-        self.ss_candle_light_right = None or SS_CANdleLight(5, self.canbus, "Right")
-        self.ss_swerve_drive = None or SS_SwerveDrive(self.gamepad)
+        # Device configs are deferred and applied in parallel by DeviceStartup while the drivetrain is built
+        self.device_startup = DeviceStartup()
+        self.ss_shooter = None or SS_Kraken(3, self.canbus, "Shooter", inverted=True, max_rps=100, velocity_setpoint=40, kp=0.08, ki=0.0, kd=0.0, kv=0.012, ks=0.0, observer_kv=0.144, observer_ka=0.065, identify_feedforward=True, defer_configuration=True)
+        self.ss_feeder = None or SS_Kraken(1, self.canbus, "Feeder", kp=1.0, velocity_setpoint=10, percent_power_setpoint=0.5, defer_configuration=True)
+        self.ss_intake = None or SS_Kraken(4, self.canbus, "Intake", max_rps=120, percent_power_setpoint=0.9, defer_configuration=True)
+        #self.ss_extend = None or SS_Kraken(6, self.canbus, "Extension", inverted=True, brake_mode=True, kp=5, ki=0.5, vmax=.5, amax=.5, jerk=2.5, defer_configuration=True)
+        self.ss_candle_light_left = None or SS_CANdleLight(2, self.canbus, "Left", defer_configuration=True)
+        self.ss_candle_light_right = None or SS_CANdleLight(5, self.canbus, "Right", defer_configuration=True)
+        for device in (self.ss_shooter, self.ss_feeder, self.ss_intake):
+            if device:
+                self.device_startup.add(device.dashboard_name, device.configure_hardware)
+        for device in (self.ss_candle_light_left, self.ss_candle_light_right):
+            if device:
+                self.device_startup.add(f"CANdle {device.dashboard_name}", device.configure_hardware)
+        self.ss_swerve_drive = None or self.device_startup.run_inline("Drivetrain", lambda: SS_SwerveDrive(self.gamepad, self.driver_input))
         #self.ss_camera_pose_left = None or SS_CameraPose_Left(self.ss_swerve_drive)
         self.ss_camera_pose_right = None or SS_CameraPose_Right(self.ss_swerve_drive)
+        self.device_startup.wait_all()
 
         self.auto_distance_shoot_command = CMD_AutoDistanceShoot(self.ss_shooter, self.ss_swerve_drive)
         self.right_bumper_auto_distance_shoot_command = CMD_AutoDistanceShoot(self.ss_shooter, self.ss_swerve_drive)
@@ -71,16 +92,16 @@ class RobotContainer:
             self.gamepad.y().onTrue(self.ss_swerve_drive.drive_mode_non_smoothed())
             self.gamepad.y().onFalse(self.defaultdrivemode)
 
-            Trigger(lambda: self.gamepad.getHID().getPOV() == PathfindPOVTarget.TOP_RIGHT).onTrue(
+            self.driver_input.pov_trigger(PathfindPOVTarget.TOP_RIGHT).onTrue(
                 self.ss_swerve_drive.pathfind_to_pov_zone(PathfindPOVTarget.TOP_RIGHT)
             )
-            Trigger(lambda: self.gamepad.getHID().getPOV() == PathfindPOVTarget.BOTTOM_RIGHT).onTrue(
+            self.driver_input.pov_trigger(PathfindPOVTarget.BOTTOM_RIGHT).onTrue(
                 self.ss_swerve_drive.pathfind_to_pov_zone(PathfindPOVTarget.BOTTOM_RIGHT)
             )
-            Trigger(lambda: self.gamepad.getHID().getPOV() == PathfindPOVTarget.BOTTOM_LEFT).onTrue(
+            self.driver_input.pov_trigger(PathfindPOVTarget.BOTTOM_LEFT).onTrue(
                 self.ss_swerve_drive.pathfind_to_pov_zone(PathfindPOVTarget.BOTTOM_LEFT)
             )
-            Trigger(lambda: self.gamepad.getHID().getPOV() == PathfindPOVTarget.TOP_LEFT).onTrue(
+            self.driver_input.pov_trigger(PathfindPOVTarget.TOP_LEFT).onTrue(
                 self.ss_swerve_drive.pathfind_to_pov_zone(PathfindPOVTarget.TOP_LEFT)
             )
 
@@ -114,8 +135,8 @@ class RobotContainer:
         SmartDashboard.putData("Commands/Unload", self.unload)
         NamedCommands.registerCommand("Unload", self.unload)
         
-        self.auto_chooser = AutoBuilder.buildAutoChooser("None") # must be defined after SS's and all registered commands
-        SmartDashboard.putData("Auto Chooser", self.auto_chooser)
+        self.auto_cache = AutoCache("None") # must be defined after SS's and all registered commands
+        SmartDashboard.putData("Auto Chooser", self.auto_cache.chooser)
 
     def _setup_simulated_mechanism2d(self):
         self.mech2d = wpilib.Mechanism2d(10, 10)  # Width, Height
@@ -131,7 +152,7 @@ class RobotContainer:
         wpilib.SmartDashboard.putData("Mechanism", self.mech2d)
 
     def get_autonomous_command(self) -> commands2.Command:
-        return self.auto_chooser.getSelected()
+        return self.auto_cache.get_selected()
 
 
 class MyRobot(commands2.TimedCommandRobot):
@@ -149,12 +170,26 @@ class MyRobot(commands2.TimedCommandRobot):
         """
         self.autonomousCommand = None
         self.container = RobotContainer()
+        if self.container.ss_shooter:
+            LazyCommands.measure_sample(self.container.ss_shooter.spin_up_and_wait_command) # for the savings estimate
+        self.loop_timer = LoopTimer()
+        self.loop_timer.instrument_subsystems(
+            self.container.ss_shooter, self.container.ss_feeder, self.container.ss_intake,
+            self.container.ss_candle_light_left, self.container.ss_candle_light_right,
+            self.container.ss_swerve_drive, self.container.ss_swerve_drive.drivetrain,
+            self.container.ss_camera_pose_right,
+        )
         self.localMatchTimer = Timer()
+        self._periodic_counter = 0
+        self._pub_match_time = DashboardPublisher.number("Match Time", epsilon=0.05)
+        self._pub_battery_voltage = DashboardPublisher.number("Battery Voltage", epsilon=0.05)
         # self._time_and_driver_replay = (HootAutoReplay().with_timestamp_replay().with_driver_replay() )
         if self.container.ss_candle_light_right:
             self.container.ss_candle_light_right.set_all_leds_RGBW(0, 255, 0) # Set front CANdle to green
         if self.container.ss_candle_light_left:
             self.container.ss_candle_light_left.set_all_leds_RGBW(255, 165, 0) # Set rear CANdle to orange
+        self.gc_policy = GCPolicy()
+        self.gc_policy.finish_startup() # keep last: freezes everything robotInit built
 
     def robotPeriodic(self) -> None:
         """
@@ -169,11 +204,18 @@ class MyRobot(commands2.TimedCommandRobot):
         and running subsystem periodic() methods.  This must be called from the robot's periodic
         block in order for anything in the Command-based framework to work.
         """
+        robot_periodic_start = time.perf_counter()
+        self.loop_timer.start_cycle()
+        self.gc_policy.periodic() # the only place the collector runs while enabled
         # self._time_and_driver_replay.update() # using HootAutoReplay to log and replay timestamp and driver data
+        FieldGeometry.update() # sample the alliance once; subsystems and commands read the cached value
+        self.container.driver_input.update() # sample the gamepad once and run deadband/shaping/slew for this loop
+        KrakenSignalRegistry.refresh_all() # one batched CAN refresh for every SS_Kraken before the scheduler runs
+        TunableParameters.drain() # apply dashboard edits queued by NT listeners since the last loop
         match_time_from_driver_station = Timer.getMatchTime()
-        SmartDashboard.putNumber("Match Time", self.localMatchTimer.get() if match_time_from_driver_station < 0 else match_time_from_driver_station)
+        self._pub_match_time.set(self.localMatchTimer.get() if match_time_from_driver_station < 0 else match_time_from_driver_station)
         voltage = wpilib.RobotController.getBatteryVoltage()
-        SmartDashboard.putNumber("Battery Voltage", voltage)
+        self._pub_battery_voltage.set(voltage)
         if self.container.ss_intake:
             self.container.intake2d.setLength(-self.container.ss_intake.velocity_actual/10)
         if self.container.ss_feeder:
@@ -182,8 +224,16 @@ class MyRobot(commands2.TimedCommandRobot):
             self.container.shooter2d.setLength(self.container.ss_shooter.velocity_actual/10)
         #if self.container.ss_extend:
         #    self.container.extend2d.setAngle(90 - self.container.ss_extend.position_actual*90/2)
-        calculated_shooter_speed = self.container.auto_distance_shoot_command.get_required_shooter_speed()
-        SmartDashboard.putNumber("SS_Telemetry/Shooter/Shooter Auto Distance Speed", calculated_shooter_speed)
+        self.container.auto_distance_shoot_command.update_and_get_required_shooter_speed()
+
+        self._periodic_counter += 1
+        if self._periodic_counter % 50 == 0:  # Every 1s
+            DashboardPublisher.publish_stats()
+            LazyCommands.publish_stats()
+            if self.container.ss_camera_pose_right:
+                self.container.ss_camera_pose_right.publish_stats()
+            ShotTable.reload_changed() # pick up shot table edits made on the roboRIO
+        self.loop_timer.record("robotPeriodic", robot_periodic_start)
 
 
     def teleopInit(self) -> None:
@@ -193,6 +243,7 @@ class MyRobot(commands2.TimedCommandRobot):
         continue until interrupted by another command, remove
         this line or comment it out. 
         """
+        self.gc_policy.enter_enabled()
         self.container.ss_swerve_drive.setDefaultCommand(
             self.container.defaultdrivemode
         )
@@ -200,12 +251,12 @@ class MyRobot(commands2.TimedCommandRobot):
         self.localMatchTimer.reset()
         self.localMatchTimer.start()
         self.shift_timer = ShiftTimer(self.localMatchTimer)
-        if DriverStation.getAlliance() == DriverStation.Alliance.kRed:
+        if FieldGeometry.is_red:
             if self.container.ss_candle_light_right:
                 self.container.ss_candle_light_right.set_all_leds_RGBW(255, 0, 0)
             if self.container.ss_candle_light_left:
                 self.container.ss_candle_light_left.set_all_leds_RGBW(255, 0, 0)
-        elif DriverStation.getAlliance() == DriverStation.Alliance.kBlue:
+        elif FieldGeometry.is_blue:
             if self.container.ss_candle_light_right:
                 self.container.ss_candle_light_right.set_all_leds_RGBW(0, 0, 255)
             if self.container.ss_candle_light_left:
@@ -221,6 +272,7 @@ class MyRobot(commands2.TimedCommandRobot):
         This function is run once when the robot enters autonomous mode.
         Gets the selected autonomous command from the chooser and schedules it.
         """
+        self.gc_policy.enter_enabled()
         self.container.ss_swerve_drive.removeDefaultCommand()
         self.localMatchTimer.reset()
         self.localMatchTimer.start()
@@ -237,18 +289,23 @@ class MyRobot(commands2.TimedCommandRobot):
         """This function is called periodically during autonomous"""
         pass
 
+    def autonomousExit(self) -> None:
+        """This function is called once when exiting autonomous mode."""
+        self.gc_policy.collect_now() # clean up after auto before teleop starts
+
 
     def disabledInit(self) -> None:
         """This function is called once each time the robot enters Disabled mode."""
-        pass
+        self.gc_policy.enter_disabled()
 
     def disabledPeriodic(self) -> None:
         """This function is called periodically when disabled"""
-        pass
+        self.container.auto_cache.step() # build one auto per loop once the paths are preloaded
 
 
     def testInit(self) -> None:
         """Cancels all running commands at the start of test mode"""
+        self.gc_policy.enter_enabled()
         commands2.CommandScheduler.getInstance().cancelAll()
         self.container.ss_swerve_drive.drive_mode_padlocked()
         ''' # Example test code for manually testing subsystems during test mode, using the mechanism2d for visualization. Uncomment and modify as needed for testing.
@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+import wpilib
+from wpilib import DriverStation, SendableChooser
+from commands2 import Command, cmd
+from pathplannerlib.auto import AutoBuilder
+from pathplannerlib.config import RobotConfig
+from pathplannerlib.path import PathPlannerPath
+from subsystems.DashboardPublisher import DashboardPublisher
+
+
+class AutoCache:
+    """
+    Replaces AutoBuilder.buildAutoChooser(), which parses every path and builds every auto inside
+    RobotContainer.__init__. The chooser is filled right away from the .auto file names. A background
+    thread, which only runs while disabled, loads every .path with PathPlannerPath.fromPathFile and
+    primes its ideal trajectory; flipping a path for red reuses that trajectory. Autos are composed by
+    AutoBuilder.buildAuto (PathPlannerAuto) on the main thread while disabled: the selected auto as soon
+    as the chooser changes, the rest one per disabled loop once the paths are loaded. Every boot still
+    parses every .path file and generates its ideal trajectory, just off the main thread.
+    """
+    NONE_AUTO = "None"
+
+    def __init__(self, default_auto_name: str = NONE_AUTO) -> None:
+        self._pathplanner_directory = os.path.join(wpilib.getDeployDirectory(), "pathplanner")
+        self._autos: dict[str, Command | None] = {}
+        self.chooser = SendableChooser()
+        self.chooser.setDefaultOption(self.NONE_AUTO, self.NONE_AUTO)
+        for auto_name in sorted(self._list_files("autos", ".auto")):
+            self._autos[auto_name] = None
+            if auto_name == default_auto_name:
+                self.chooser.setDefaultOption(auto_name, auto_name)
+            else:
+                self.chooser.addOption(auto_name, auto_name)
+        self._last_selected = None
+        self._pub_paths_preloaded = DashboardPublisher.number("Autos/Paths Preloaded")
+        self._pub_autos_built = DashboardPublisher.number("Autos/Autos Built")
+        self._paths_preloaded = 0
+        self._preload_done = threading.Event()
+        threading.Thread(target=self._preload_paths, name="AutoCache", daemon=True).start()
+
+    def step(self) -> None:
+        """Call every disabled loop: builds the selected auto when the chooser changes, otherwise at most one other auto."""
+        self._pub_paths_preloaded.set(self._paths_preloaded)
+        selected = self.chooser.getSelected()
+        if selected != self._last_selected:
+            self._last_selected = selected
+            if self._autos.get(selected, False) is None:
+                self._build(selected) # loads any path the preload thread hasn't reached yet
+            return
+        if not self._preload_done.is_set():
+            return
+        pending = [name for name, auto in self._autos.items() if auto is None]
+        if pending:
+            self._build(pending[0])
+
+    def get_selected(self) -> Command:
+        selected = self.chooser.getSelected()
+        if selected not in self._autos:
+            return cmd.none()
+        if self._autos[selected] is None:
+            # Only when autonomous starts without a disabled loop since the selection changed
+            wpilib.reportError(f"Auto {selected} was not built while disabled; building it now delays the start of auto", False)
+            return self._build(selected)
+        return self._autos[selected]
+
+    # -------------------------
+    # Main thread
+    # -------------------------
+    def _build(self, auto_name: str) -> Command:
+        start = time.perf_counter()
+        try:
+            auto = AutoBuilder.buildAuto(auto_name)
+        except Exception as error: # a bad .auto file shouldn't take the robot down
+            wpilib.reportError(f"Auto {auto_name} failed to build: {error}", False)
+            auto = cmd.none()
+        self._autos[auto_name] = auto
+        self._pub_autos_built.set(sum(auto is not None for auto in self._autos.values()))
+        wpilib.reportWarning(f"Auto {auto_name} built in {(time.perf_counter() - start) * 1000:.0f} ms", printTrace=False)
+        return auto
+
+    # -------------------------
+    # Preload thread
+    # -------------------------
+    def _preload_paths(self) -> None:
+        start = time.perf_counter()
+        robot_config = RobotConfig.fromGUISettings()
+        for path_name in self._list_files("paths", ".path"):
+            while not DriverStation.isDisabled():
+                time.sleep(0.1) # don't compete with the main loop for the GIL while enabled
+            try:
+                # Both are cached by PathPlanner, so a build on the main thread finds them ready
+                path = PathPlannerPath.fromPathFile(path_name)
+                path.getIdealTrajectory(robot_config)
+            except Exception as error: # PathPlanner reports it again if an auto uses this path
+                wpilib.reportWarning(f"Path {path_name} not preloaded: {error}", printTrace=False)
+                continue
+            self._paths_preloaded += 1
+        self._preload_done.set()
+        wpilib.reportWarning(f"Preloaded {self._paths_preloaded} paths in {(time.perf_counter() - start) * 1000:.0f} ms",
+                             printTrace=False)
+
+    def _list_files(self, folder: str, extension: str) -> list[str]:
+        directory = os.path.join(self._pathplanner_directory, folder)
+        if not os.path.isdir(directory):
+            return []
+        return [file_name.removesuffix(extension) for file_name in os.listdir(directory) if file_name.endswith(extension)]
@@ -0,0 +1,57 @@
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import phoenix6
+from phoenix6 import StatusCode
+
+
+class TalonFXConfigApplier:
+    """
+    Applies TalonFX configs for one motor. apply() sends the whole configuration and blocks;
+    submit() runs on a shared background worker and only sends the config groups that changed
+    since the last successful apply, so live tuning never blocks the robot loop. Both hold the
+    applier's lock, so a startup apply() still running on a DeviceStartup thread (after wait_all()
+    timed out) finishes before a tuning change is diffed and sent to the same motor.
+    """
+    DELTA_GROUPS = ("slot0", "motion_magic", "current_limits") # groups that are edited after startup
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TalonFXConfig") # one worker keeps CAN config calls in order
+
+    def __init__(self, motor: phoenix6.hardware.TalonFX, timeout_seconds: float = 0.1) -> None:
+        self._motor = motor
+        self._timeout_seconds = timeout_seconds
+        self._applied_groups: dict[str, str] | None = None # group name -> str() of the last applied group
+        self._lock = threading.Lock()
+
+    def apply(self, config: phoenix6.configs.TalonFXConfiguration) -> StatusCode:
+        with self._lock:
+            return self._apply_all(config)
+
+    def submit(self, config: phoenix6.configs.TalonFXConfiguration) -> Future:
+        # Copy so the main loop can keep editing its config while the worker applies this one
+        return self._executor.submit(self._apply_changed_groups, copy.deepcopy(config))
+
+    def _apply_all(self, config: phoenix6.configs.TalonFXConfiguration) -> StatusCode:
+        # Described before sending: the main loop may edit a config that apply() was handed while it is sent,
+        # and such an edit must still look changed to the next submit()
+        groups = self._describe_groups(config)
+        status = self._motor.configurator.apply(config, self._timeout_seconds)
+        if status.is_ok():
+            self._applied_groups = groups
+        return status
+
+    def _apply_changed_groups(self, config: phoenix6.configs.TalonFXConfiguration) -> StatusCode:
+        with self._lock:
+            if self._applied_groups is None: # nothing applied yet, so there is no baseline to diff against
+                return self._apply_all(config)
+            status = StatusCode.OK
+            for group_name, description in self._describe_groups(config).items():
+                if description == self._applied_groups[group_name]:
+                    continue
+                status = self._motor.configurator.apply(getattr(config, group_name), self._timeout_seconds)
+                if not status.is_ok():
+                    return status
+                self._applied_groups[group_name] = description
+            return status
+
+    def _describe_groups(self, config: phoenix6.configs.TalonFXConfiguration) -> dict[str, str]:
+        return {group_name: str(getattr(config, group_name)) for group_name in self.DELTA_GROUPS}
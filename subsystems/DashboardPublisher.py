@@ -0,0 +1,69 @@
+import threading
+from ntcore import NetworkTableInstance
+
+
+class _ChangePublisher:
+    """Typed NT publisher for one SmartDashboard key that skips writes when the value has not changed."""
+
+    def __init__(self, publisher, epsilon: float = 0.0) -> None:
+        self._publisher = publisher
+        self._epsilon = epsilon
+        self._last_value = None
+
+    def set(self, value) -> None:
+        with DashboardPublisher._lock: # DeviceStartup threads publish config status too
+            if self._last_value is not None and self._is_unchanged(value):
+                DashboardPublisher.skipped_writes += 1
+                return
+            self._last_value = value
+            self._publisher.set(value)
+            DashboardPublisher.published_writes += 1
+
+    def _is_unchanged(self, value) -> bool:
+        if self._epsilon > 0.0:
+            return abs(value - self._last_value) <= self._epsilon
+        return value == self._last_value
+
+
+class DashboardPublisher:
+    """
+    Creates change-detecting publishers once per SmartDashboard key. Subsystems build their
+    publishers in __init__ and call .set() in periodic, so keys are never re-formatted per loop.
+    Publishers may be set from any thread.
+    """
+    _table = None
+    _publishers: dict[str, _ChangePublisher] = {}
+    _lock = threading.Lock()
+    skipped_writes = 0
+    published_writes = 0
+
+    @classmethod
+    def _get_table(cls):
+        if cls._table is None:
+            cls._table = NetworkTableInstance.getDefault().getTable("SmartDashboard")
+        return cls._table
+
+    @classmethod
+    def number(cls, key: str, epsilon: float = 0.0) -> _ChangePublisher:
+        if key not in cls._publishers:
+            cls._publishers[key] = _ChangePublisher(cls._get_table().getDoubleTopic(key).publish(), epsilon)
+        elif cls._publishers[key]._epsilon != epsilon:
+            raise ValueError(f"Dashboard key {key} already has epsilon {cls._publishers[key]._epsilon}, not {epsilon}")
+        return cls._publishers[key]
+
+    @classmethod
+    def boolean(cls, key: str) -> _ChangePublisher:
+        if key not in cls._publishers:
+            cls._publishers[key] = _ChangePublisher(cls._get_table().getBooleanTopic(key).publish())
+        return cls._publishers[key]
+
+    @classmethod
+    def string(cls, key: str) -> _ChangePublisher:
+        if key not in cls._publishers:
+            cls._publishers[key] = _ChangePublisher(cls._get_table().getStringTopic(key).publish())
+        return cls._publishers[key]
+
+    @classmethod
+    def publish_stats(cls) -> None:
+        cls.number("Telemetry/NT Writes Skipped").set(cls.skipped_writes)
+        cls.number("Telemetry/NT Writes Published").set(cls.published_writes)
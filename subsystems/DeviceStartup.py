@@ -0,0 +1,77 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable
+import wpilib
+from phoenix6 import StatusCode
+from subsystems.DashboardPublisher import DashboardPublisher
+
+
+class DeviceStartup:
+    """
+    Runs the blocking configuration of every device at once on a thread pool during robotInit,
+    retrying failed configs, then waits for all of them together and logs how long each took.
+    A configure() that raises counts as a failed attempt, so one bad device can't abort robotInit.
+    A job that outlasts wait_all()'s timeout keeps running; TalonFXConfigApplier makes later tuning
+    applies to that motor wait for it.
+    """
+
+    def __init__(self, max_workers: int = 8, retries: int = 2) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="DeviceStartup")
+        self._retries = retries
+        self._jobs = {} # device name -> Future of (status, seconds, attempts)
+        self._start_time = time.monotonic()
+
+    def add(self, device_name: str, configure: Callable[[], StatusCode]) -> None:
+        self._jobs[device_name] = self._executor.submit(self._configure_with_retries, configure)
+
+    def run_inline(self, device_name: str, build: Callable):
+        """Time work that has to stay on the main thread (e.g. the drivetrain) while the pool runs."""
+        start = time.monotonic()
+        result = build()
+        self._log_device(device_name, StatusCode.OK, time.monotonic() - start, 1)
+        return result
+
+    def wait_all(self, timeout_seconds: float = 10.0) -> bool:
+        done, _ = wait(self._jobs.values(), timeout=timeout_seconds)
+        all_ok = True
+        for device_name, job in self._jobs.items():
+            if job not in done:
+                wpilib.reportError(f"{device_name} configuration did not finish within {timeout_seconds} s", False)
+                all_ok = False
+                continue
+            status, seconds, attempts = job.result()
+            self._log_device(device_name, status, seconds, attempts)
+            all_ok = all_ok and self._is_ok(status)
+        total_ms = (time.monotonic() - self._start_time) * 1000
+        wpilib.reportWarning(f"Device startup finished in {total_ms:.0f} ms", printTrace=False)
+        DashboardPublisher.number("Startup/Total Config Time (ms)").set(round(total_ms))
+        self._executor.shutdown(wait=False)
+        return all_ok
+
+    def _configure_with_retries(self, configure: Callable[[], StatusCode]) -> tuple:
+        start = time.monotonic()
+        attempts = 0
+        status = StatusCode.OK
+        while attempts <= self._retries:
+            attempts += 1
+            try:
+                status = configure()
+            except Exception as error: # reported as this device's failure by wait_all()
+                status = error
+                continue
+            if status.is_ok():
+                break
+        return status, time.monotonic() - start, attempts
+
+    @staticmethod
+    def _is_ok(status: StatusCode | Exception) -> bool:
+        return isinstance(status, StatusCode) and status.is_ok()
+
+    def _log_device(self, device_name: str, status: StatusCode | Exception, seconds: float, attempts: int) -> None:
+        config_ms = seconds * 1000
+        DashboardPublisher.number(f"Startup/{device_name} Config Time (ms)").set(round(config_ms))
+        if self._is_ok(status):
+            wpilib.reportWarning(f"{device_name} configured in {config_ms:.0f} ms ({attempts} attempt{'s' if attempts > 1 else ''})", printTrace=False)
+        else:
+            reason = status if isinstance(status, StatusCode) else repr(status) # an exception's str() can be empty
+            wpilib.reportError(f"{device_name} configuration failed after {attempts} attempts: {reason}", False)
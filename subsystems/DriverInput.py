@@ -0,0 +1,54 @@
+from commands2.button import CommandXboxController, Trigger
+from wpimath import applyDeadband
+from wpimath.filter import SlewRateLimiter
+
+
+class DriverInput:
+    """
+    Reads the driver gamepad once per loop (DriverInput.update() in robotPeriodic) and runs
+    deadband, squaring and slew limiting exactly once, so every drive mode, command and POV
+    trigger in that loop sees the same values and the slew limiters advance once per loop.
+    Translation is in driver terms: +x is stick forward, +y is stick left, +rotation is counterclockwise.
+    """
+
+    def __init__(self, joystick: CommandXboxController, deadband: float = 0.12) -> None:
+        self._hid = joystick.getHID()
+        self._deadband = deadband
+        self._translation_x_limiter = SlewRateLimiter(2.0)
+        self._translation_y_limiter = SlewRateLimiter(2.0)
+        self._pov_triggers: dict[int, Trigger] = {}
+        # Raw axes
+        self.left_x = 0.0
+        self.left_y = 0.0
+        self.right_x = 0.0
+        self.right_y = 0.0
+        self.pov = -1
+        # Shaped outputs, -1..1
+        self.translation_x = 0.0 # deadband + squared + slew limited
+        self.translation_y = 0.0
+        self.translation_x_unsmoothed = 0.0 # squared only
+        self.translation_y_unsmoothed = 0.0
+        self.rotation = 0.0 # squared only
+
+    def update(self) -> None:
+        self.left_x = self._hid.getLeftX()
+        self.left_y = self._hid.getLeftY()
+        self.right_x = self._hid.getRightX()
+        self.right_y = self._hid.getRightY()
+        self.pov = self._hid.getPOV()
+
+        self.translation_x = self._translation_x_limiter.calculate(self._shaped(-self.left_y))
+        self.translation_y = self._translation_y_limiter.calculate(self._shaped(-self.left_x))
+        self.translation_x_unsmoothed = -self.left_y * abs(self.left_y)
+        self.translation_y_unsmoothed = -self.left_x * abs(self.left_x)
+        self.rotation = -self.right_x * abs(self.right_x)
+
+    def pov_trigger(self, angle: int) -> Trigger:
+        """Trigger on the POV angle sampled this loop; one shared Trigger per angle."""
+        if angle not in self._pov_triggers:
+            self._pov_triggers[angle] = Trigger(lambda: self.pov == angle)
+        return self._pov_triggers[angle]
+
+    def _shaped(self, axis: float) -> float:
+        axis = applyDeadband(axis, self._deadband)
+        return axis * abs(axis)
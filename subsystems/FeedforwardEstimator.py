@@ -0,0 +1,75 @@
+import math
+
+
+class FeedforwardEstimator:
+    """
+    Recursive least squares fit of volts = kS * sign(v) + kV * v + kA * a over samples taken while
+    a mechanism runs. The forgetting factor lets the fit follow battery and wear drift. Covariance
+    growth is capped so long steady-speed stretches (no new information) can't wind the fit up.
+    Gains are in volts per rps and volts per rps/s.
+
+    kS multiplies sign(v), so a mechanism that only ever spins one way can't tell it apart from any other
+    constant offset; ks_identifiable says whether both directions have been seen. kV and kA need the speed
+    to actually change, which velocity_spread (standard deviation of the fitted velocities, rps) measures.
+    """
+
+    def __init__(self, forgetting_factor: float = 0.998, min_velocity: float = 2.0, min_volts: float = 0.5,
+                 initial_covariance: float = 100.0, max_covariance_trace: float = 1000.0) -> None:
+        self._forgetting_factor = forgetting_factor
+        self._min_velocity = min_velocity
+        self._min_volts = min_volts
+        self._max_covariance_trace = max_covariance_trace
+        self._theta = [0.0, 0.0, 0.0] # kS, kV, kA
+        self._covariance = [[initial_covariance if row == column else 0.0 for column in range(3)] for row in range(3)]
+        self.samples = 0
+        self._velocity_mean = 0.0
+        self._velocity_m2 = 0.0
+        self._saw_forward = False
+        self._saw_reverse = False
+
+    @property
+    def ks(self) -> float:
+        return self._theta[0]
+
+    @property
+    def kv(self) -> float:
+        return self._theta[1]
+
+    @property
+    def ka(self) -> float:
+        return self._theta[2]
+
+    @property
+    def ks_identifiable(self) -> bool:
+        return self._saw_forward and self._saw_reverse
+
+    @property
+    def velocity_spread(self) -> float:
+        return math.sqrt(self._velocity_m2 / self.samples) if self.samples else 0.0
+
+    def add_sample(self, volts: float, velocity: float, acceleration: float) -> bool:
+        """Returns False for samples that don't fit the model: near standstill (static friction) or coasting."""
+        if abs(velocity) < self._min_velocity or abs(volts) < self._min_volts:
+            return False
+        x = (math.copysign(1.0, velocity), velocity, acceleration)
+        p = self._covariance
+        px = [p[row][0] * x[0] + p[row][1] * x[1] + p[row][2] * x[2] for row in range(3)]
+        denominator = self._forgetting_factor + x[0] * px[0] + x[1] * px[1] + x[2] * px[2]
+        gain = [value / denominator for value in px]
+        error = volts - (self._theta[0] * x[0] + self._theta[1] * x[1] + self._theta[2] * x[2])
+        for row in range(3):
+            self._theta[row] += gain[row] * error
+        # P is symmetric, so x'P == (Px)'
+        forgetting = self._forgetting_factor if p[0][0] + p[1][1] + p[2][2] < self._max_covariance_trace else 1.0
+        for row in range(3):
+            for column in range(3):
+                p[row][column] = (p[row][column] - gain[row] * px[column]) / forgetting
+        self.samples += 1
+        delta = velocity - self._velocity_mean # Welford's running variance
+        self._velocity_mean += delta / self.samples
+        self._velocity_m2 += delta * (velocity - self._velocity_mean)
+        if velocity > 0.0:
+            self._saw_forward = True
+        else:
+            self._saw_reverse = True
+        return True
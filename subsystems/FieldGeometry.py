@@ -0,0 +1,62 @@
+from typing import Callable
+from wpilib import DriverStation
+from wpimath.geometry import Translation2d
+from pathplannerlib.util import FlippingUtil
+
+
+class FieldGeometry:
+    """
+    Alliance and alliance-dependent field positions, sampled once per loop by FieldGeometry.update()
+    at the start of robotPeriodic. Code that only cares when the alliance changes subscribes with
+    on_alliance_change() instead of asking the DriverStation every loop.
+    """
+    BLUE_TARGET = (4.6, 4.0)
+    RED_TARGET = (11.94, 4.0)
+    BLUE_TOP_ZONE = (4.0, 6.0)
+    BLUE_BOTTOM_ZONE = (4.0, 2.0)
+    RED_TOP_ZONE = (12.6, 6.0)
+    RED_BOTTOM_ZONE = (12.6, 2.0)
+
+    alliance: DriverStation.Alliance | None = None
+    is_red = False
+    is_blue = False
+    target: tuple | None = None # our alliance's target, None until the DS reports an alliance
+    pov_zone_goals: dict[int, Translation2d] = {} # POV angle -> zone goal in our alliance's field coordinates
+    _blue_pov_zones: dict[int, tuple] = {}
+    _callbacks: list[Callable] = []
+    _sampled = False
+
+    @classmethod
+    def update(cls) -> None:
+        alliance = DriverStation.getAlliance()
+        if cls._sampled and alliance == cls.alliance:
+            return
+        cls._sampled = True
+        cls.alliance = alliance
+        cls.is_red = alliance == DriverStation.Alliance.kRed
+        cls.is_blue = alliance == DriverStation.Alliance.kBlue
+        cls.target = cls.RED_TARGET if cls.is_red else cls.BLUE_TARGET if cls.is_blue else None
+        cls._flip_pov_zones()
+        for callback in cls._callbacks:
+            callback(alliance)
+
+    @classmethod
+    def on_alliance_change(cls, callback: Callable[[DriverStation.Alliance | None], None]) -> None:
+        """Call callback(alliance) now and again whenever the alliance changes."""
+        if not cls._sampled:
+            cls.update()
+        cls._callbacks.append(callback)
+        callback(cls.alliance)
+
+    @classmethod
+    def set_pov_zones(cls, blue_zones: dict[int, tuple]) -> None:
+        """Set the POV pathfind zones, POV angle -> blue-origin (x, y); pov_zone_goals follows the alliance."""
+        cls._blue_pov_zones = dict(blue_zones)
+        cls._flip_pov_zones()
+
+    @classmethod
+    def _flip_pov_zones(cls) -> None:
+        goals = {pov: Translation2d(x, y) for pov, (x, y) in cls._blue_pov_zones.items()}
+        if cls.is_red:
+            goals = {pov: FlippingUtil.flipFieldPosition(goal) for pov, goal in goals.items()}
+        cls.pov_zone_goals = goals
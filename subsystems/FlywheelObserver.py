@@ -0,0 +1,54 @@
+import math
+from wpimath.estimator import KalmanFilter_1_1_1
+from wpimath.system.plant import LinearSystemId
+
+
+class FlywheelObserver:
+    """
+    Kalman-filtered flywheel velocity from wpimath's first-order kV/kA model, driven by the applied
+    motor voltage. Gives a filtered velocity, the model's acceleration, and where the flywheel is heading
+    if the voltage holds: predicted_velocity(lookahead) and time_to_setpoint(). kv_volts is volts per rps,
+    ka_volts volts per rps/s. wpimath's KalmanFilter supplies the steady-state gain at the nominal loop
+    period, so update() is a few float operations instead of a matrix discretization per loop.
+    """
+
+    def __init__(self, kv_volts: float, ka_volts: float, model_std_rps: float = 3.0,
+                 measurement_std_rps: float = 0.5, period_seconds: float = 0.02) -> None:
+        plant = LinearSystemId.identifyVelocitySystemMeters(kv_volts, ka_volts)
+        kalman = KalmanFilter_1_1_1(plant, (model_std_rps,), (measurement_std_rps,), period_seconds)
+        prior_variance = kalman.P(0, 0) # the steady-state a priori covariance it solved for
+        self._gain = prior_variance / (prior_variance + measurement_std_rps ** 2 / period_seconds) # wpimath discretizes R as R / dt
+        self._a = plant.A(0, 0) # -kV / kA
+        self._b = plant.B(0, 0) # 1 / kA
+        self._kv_volts = kv_volts
+        self._volts = 0.0
+        self.velocity = 0.0 # rps
+        self.acceleration = 0.0 # rps/s
+
+    def reset(self, velocity: float) -> None:
+        self.velocity = velocity
+        self.acceleration = 0.0
+
+    def update(self, applied_volts: float, measured_velocity: float, dt: float) -> None:
+        decay = math.exp(self._a * dt)
+        predicted = decay * self.velocity + (decay - 1.0) / self._a * self._b * applied_volts
+        self.velocity = predicted + self._gain * (measured_velocity - predicted)
+        self._volts = applied_volts
+        self.acceleration = self._a * self.velocity + self._b * applied_volts
+
+    def predicted_velocity(self, lookahead_seconds: float) -> float:
+        steady_state = self._volts / self._kv_volts
+        return steady_state + (self.velocity - steady_state) * math.exp(self._a * lookahead_seconds)
+
+    def time_to_setpoint(self, setpoint: float, tolerance: float) -> float:
+        """Seconds until the velocity enters setpoint +/- tolerance at the current voltage; inf if it never will."""
+        if abs(self.velocity - setpoint) <= tolerance:
+            return 0.0
+        near_edge = setpoint - tolerance if self.velocity < setpoint else setpoint + tolerance
+        steady_state = self._volts / self._kv_volts
+        remaining = abs(self.velocity - steady_state)
+        edge_to_steady_state = abs(near_edge - steady_state)
+        heading_past_edge = (near_edge - self.velocity) * (steady_state - self.velocity) > 0 and remaining > edge_to_steady_state
+        if not heading_past_edge or edge_to_steady_state == 0.0:
+            return math.inf
+        return math.log(remaining / edge_to_steady_state) / -self._a
@@ -0,0 +1,76 @@
+import gc
+import time
+import wpilib
+from subsystems.DashboardPublisher import DashboardPublisher
+
+
+class GCPolicy:
+    """
+    Keeps Python's garbage collector out of enabled loops. Startup objects are frozen after
+    robotInit, automatic collection is off while enabled (only cheap young-generation passes run,
+    at a fixed point at the top of robotPeriodic), and full collections happen while disabled and
+    when autonomous ends. Every collector pause is timed and published under GC/.
+    """
+
+    def __init__(self, young_collection_threshold: int = 5000, disabled_collect_every_n_loops: int = 250) -> None:
+        self._young_collection_threshold = young_collection_threshold # gen-0 allocations allowed before a forced young pass
+        self._disabled_collect_every_n_loops = disabled_collect_every_n_loops
+        self._enabled = False
+        self._disabled_loop_counter = 0
+        self._pause_start = 0.0
+        self.collections = 0
+        self.last_pause_ms = 0.0
+        self.max_enabled_pause_ms = 0.0
+        self._pub_last_pause = DashboardPublisher.number("GC/Last Pause (ms)", epsilon=0.01)
+        self._pub_max_enabled_pause = DashboardPublisher.number("GC/Max Enabled Pause (ms)", epsilon=0.01)
+        self._pub_collections = DashboardPublisher.number("GC/Collections")
+        self._pub_frozen_objects = DashboardPublisher.number("GC/Frozen Objects")
+        self._pub_automatic = DashboardPublisher.boolean("GC/Automatic Collection")
+        gc.callbacks.append(self._time_collection)
+
+    def finish_startup(self) -> None:
+        """Called at the end of robotInit: collect once, then move everything left into the permanent generation."""
+        gc.collect()
+        gc.freeze()
+        self._pub_frozen_objects.set(gc.get_freeze_count())
+        wpilib.reportWarning(f"GC: froze {gc.get_freeze_count()} startup objects", printTrace=False)
+
+    def enter_enabled(self) -> None:
+        self._enabled = True
+        self.max_enabled_pause_ms = 0.0
+        gc.disable()
+        self._pub_automatic.set(False)
+
+    def enter_disabled(self) -> None:
+        self._enabled = False
+        self._disabled_loop_counter = 0
+        gc.enable()
+        self._pub_automatic.set(True)
+        self.collect_now()
+
+    def collect_now(self) -> None:
+        """Full collection at a moment we choose (disabled, or between autonomous and teleop)."""
+        gc.collect()
+
+    def periodic(self) -> None:
+        if self._enabled:
+            # Automatic collection is off, so young objects pile up; clear them here in a short, predictable pass
+            if gc.get_count()[0] > self._young_collection_threshold:
+                gc.collect(0)
+        else:
+            self._disabled_loop_counter += 1
+            if self._disabled_loop_counter % self._disabled_collect_every_n_loops == 0:
+                self.collect_now()
+        self._pub_last_pause.set(round(self.last_pause_ms, 2))
+        self._pub_max_enabled_pause.set(round(self.max_enabled_pause_ms, 2))
+        self._pub_collections.set(self.collections)
+
+    def _time_collection(self, phase: str, info: dict) -> None:
+        # gc.callbacks hook: called with "start" and "stop" around every collection, automatic or explicit
+        if phase == "start":
+            self._pause_start = time.perf_counter()
+            return
+        self.last_pause_ms = (time.perf_counter() - self._pause_start) * 1000
+        self.collections += 1
+        if self._enabled:
+            self.max_enabled_pause_ms = max(self.max_enabled_pause_ms, self.last_pause_ms)
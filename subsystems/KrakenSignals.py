@@ -0,0 +1,62 @@
+import phoenix6
+from phoenix6 import BaseStatusSignal
+from wpilib import Timer
+
+
+class KrakenSignals:
+    """Cached status signal values for one TalonFX, filled in by KrakenSignalRegistry.refresh_all()."""
+
+    def __init__(self, motor: phoenix6.hardware.TalonFX) -> None:
+        # refresh=False hands back the signal objects without a blocking fetch
+        self._position_signal = motor.get_position(refresh=False)
+        self._velocity_signal = motor.get_velocity(refresh=False)
+        self._stator_current_signal = motor.get_stator_current(refresh=False)
+        self._temperature_signal = motor.get_device_temp(refresh=False)
+        self._motor_voltage_signal = motor.get_motor_voltage(refresh=False)
+        self.position = 0.0
+        self.velocity = 0.0
+        self.stator_current = 0.0
+        self.temperature = 0.0
+        self.motor_voltage = 0.0
+        self.timestamp = 0.0
+        self.velocity_timestamp = 0.0 # when the velocity frame was sampled; unchanged while the frame is stale
+
+    def signals(self) -> list:
+        return [self._position_signal, self._velocity_signal,
+                self._stator_current_signal, self._temperature_signal, self._motor_voltage_signal]
+
+    def _cache_values(self, timestamp: float) -> None:
+        self.position = self._position_signal.value
+        self.velocity = self._velocity_signal.value
+        self.stator_current = self._stator_current_signal.value
+        self.temperature = self._temperature_signal.value
+        self.motor_voltage = self._motor_voltage_signal.value
+        self.timestamp = timestamp
+        self.velocity_timestamp = self._velocity_signal.timestamp.time
+
+
+class KrakenSignalRegistry:
+    """
+    Shared registry of every SS_Kraken's status signals. refresh_all() is called once at the
+    top of each robot loop so all mechanisms read values fetched in a single batched call.
+    """
+    _registered: list[KrakenSignals] = []
+    _all_signals: list = []
+    timestamp = 0.0
+    status = None
+
+    @classmethod
+    def register(cls, motor: phoenix6.hardware.TalonFX) -> KrakenSignals:
+        kraken_signals = KrakenSignals(motor)
+        cls._registered.append(kraken_signals)
+        cls._all_signals.extend(kraken_signals.signals())
+        return kraken_signals
+
+    @classmethod
+    def refresh_all(cls) -> None:
+        if not cls._all_signals:
+            return
+        cls.status = BaseStatusSignal.refresh_all(cls._all_signals)
+        cls.timestamp = Timer.getFPGATimestamp()
+        for kraken_signals in cls._registered:
+            kraken_signals._cache_values(cls.timestamp)
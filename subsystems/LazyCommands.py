@@ -0,0 +1,118 @@
+import time
+import tracemalloc
+from typing import Callable
+import wpiutil
+from commands2 import Command, DeferredCommand, Subsystem
+from wpilib import SmartDashboard
+from pathplannerlib.auto import NamedCommands
+from subsystems.DashboardPublisher import DashboardPublisher
+
+
+class LazyCommand:
+    """
+    A command built by factory() the first time an auto or the dashboard asks for it. get() is the one
+    instance the dashboard button schedules; build() makes a new one each time, since a command can only
+    be composed once and PathPlanner composes every named command it runs.
+    """
+    __slots__ = ("name", "requirements", "_factory", "_command", "_built")
+
+    def __init__(self, name: str, factory: Callable[[], Command], requirements: tuple[Subsystem, ...] = ()) -> None:
+        self.name = name
+        self.requirements = requirements
+        self._factory = factory
+        self._command: Command | None = None
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def get(self) -> Command:
+        if self._command is None:
+            self._command = self.build()
+        return self._command
+
+    def build(self) -> Command:
+        """A new command from factory()."""
+        self._built = True
+        return self._factory()
+
+
+class _LazyCommandButton(wpiutil.Sendable):
+    """The dashboard side of a LazyCommand: the same widget as a Command's, building it on the first press."""
+
+    def __init__(self, lazy_command: LazyCommand) -> None:
+        super().__init__()
+        self._lazy_command = lazy_command
+
+    def initSendable(self, builder: wpiutil.SendableBuilder) -> None:
+        builder.setSmartDashboardType("Command")
+        builder.addStringProperty(".name", lambda: self._lazy_command.name, lambda _: None)
+        builder.addBooleanProperty("running", self._is_running, self._set_running)
+        builder.addBooleanProperty(".isParented", lambda: False, lambda _: None)
+
+    def _is_running(self) -> bool:
+        return self._lazy_command.is_built and self._lazy_command.get().isScheduled()
+
+    def _set_running(self, value: bool) -> None:
+        if value and not self._is_running():
+            self._lazy_command.get().schedule()
+        elif not value and self._is_running():
+            self._lazy_command.get().cancel()
+
+
+class LazyCommands:
+    """
+    Registers command names with NamedCommands and the dashboard at startup, and builds each command
+    on first use. measure_sample() times one representative build at startup, and publish_stats()
+    estimates the time and memory saved on the commands still unbuilt from that sample. The estimate
+    covers construction only, not the Command's own dashboard entries.
+    """
+    _commands: list[LazyCommand] = []
+    _sample_seconds = 0.0
+    _sample_bytes = 0
+
+    @classmethod
+    def register(cls, factory: Callable[[], Command], named_command: str | None = None,
+                 dashboard_key: str | None = None, requirements: tuple[Subsystem, ...] = ()) -> LazyCommand:
+        """
+        requirements must be the subsystems the built command requires: PathPlanner sees the DeferredCommand
+        standing in for it, and needs them before the command exists.
+        """
+        if named_command is None and dashboard_key is None:
+            raise ValueError("LazyCommands.register needs a named_command, a dashboard_key or both")
+        lazy_command = LazyCommand(named_command or dashboard_key.rsplit("/", 1)[-1], factory, requirements)
+        cls._commands.append(lazy_command)
+        if named_command is not None:
+            NamedCommands.registerCommand(named_command, DeferredCommand(lazy_command.build, *requirements))
+        if dashboard_key is not None:
+            SmartDashboard.putData(dashboard_key, _LazyCommandButton(lazy_command))
+        return lazy_command
+
+    @classmethod
+    def measure_sample(cls, lazy_command: LazyCommand) -> None:
+        """
+        Call once from robotInit: builds lazy_command's factory twice and throws both away, once timed and
+        once under tracemalloc, so tracing never slows a build the robot uses or the timed one.
+        """
+        start = time.perf_counter()
+        lazy_command._factory()
+        cls._sample_seconds = time.perf_counter() - start
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        command = lazy_command._factory() # still referenced, so its memory is still traced
+        cls._sample_bytes = tracemalloc.get_traced_memory()[0] - memory_before
+        del command
+        if not already_tracing:
+            tracemalloc.stop()
+
+    @classmethod
+    def publish_stats(cls) -> None:
+        built = sum(lazy_command.is_built for lazy_command in cls._commands)
+        deferred = len(cls._commands) - built
+        DashboardPublisher.number("LazyCommands/Registered").set(len(cls._commands))
+        DashboardPublisher.number("LazyCommands/Built").set(built)
+        DashboardPublisher.number("LazyCommands/Est Time Saved (ms)").set(round(cls._sample_seconds * deferred * 1000, 2))
+        DashboardPublisher.number("LazyCommands/Est Memory Saved (KB)").set(round(cls._sample_bytes * deferred / 1024, 1))
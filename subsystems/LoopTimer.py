@@ -0,0 +1,131 @@
+import time
+from collections import deque
+import commands2
+import wpilib
+from phoenix6 import SignalLogger
+from wpilib.event import EventLoop
+from subsystems.DashboardPublisher import DashboardPublisher
+
+
+class RollingHistogram:
+    """Keeps the most recent samples of one measurement (a loop phase's milliseconds, a camera's latency)."""
+
+    def __init__(self, window: int = 250) -> None:
+        self._samples = deque(maxlen=window)
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+
+    def percentiles(self) -> list[float]:
+        ordered = sorted(self._samples)
+        if not ordered:
+            return [0.0, 0.0, 0.0, 0.0]
+        last = len(ordered) - 1
+        return [ordered[int(last * 0.50)], ordered[int(last * 0.95)], ordered[int(last * 0.99)], ordered[last]]
+
+
+class _TimedButtonLoop(EventLoop):
+    """Stands in for the scheduler's active button loop so Trigger polling gets timed."""
+
+    def __init__(self, button_loop: EventLoop, loop_timer: "LoopTimer") -> None:
+        super().__init__()
+        self._button_loop = button_loop
+        self._loop_timer = loop_timer
+
+    def poll(self) -> None:
+        start = time.perf_counter()
+        self._button_loop.poll()
+        self._loop_timer.record("Trigger polling", start)
+
+
+class LoopTimer:
+    """
+    Times robotPeriodic, every subsystem periodic, Trigger polling and every scheduled command's
+    execute. Rolling p50/p95/p99/max per phase are published to NT and SignalLogger about once a
+    second. A loop runs over budget when the time from its start_cycle() to the next one does, so
+    untimed work counts too; the phase times only name the worst offender.
+    """
+    _OVERRUN_TOLERANCE_MS = 1.0 # TimedRobot's scheduling jitter
+
+    def __init__(self, loop_budget_ms: float = 20.0, publish_every_n_loops: int = 50) -> None:
+        self._loop_budget_ms = loop_budget_ms
+        self._publish_every_n_loops = publish_every_n_loops
+        self._histograms: dict[str, RollingHistogram] = {}
+        self._cycle_times: dict[str, float] = {}
+        self._loop_counter = 0
+        self._cycle_start = None
+        self._last_overrun_report = 0.0
+        self.overruns = 0
+        self._pub_overruns = DashboardPublisher.number("LoopTimer/Overruns")
+        self._pub_worst_offender = DashboardPublisher.string("LoopTimer/Worst Offender")
+
+        scheduler = commands2.CommandScheduler.getInstance()
+        scheduler.setActiveButtonLoop(_TimedButtonLoop(scheduler.getActiveButtonLoop(), self))
+        scheduler.onCommandInitialize(self._instrument_command)
+
+    def instrument_subsystems(self, *subsystems) -> None:
+        for subsystem in subsystems:
+            if subsystem is None:
+                continue
+            name = subsystem.getName()
+            if hasattr(subsystem, "dashboard_name"):
+                name = f"{name} {subsystem.dashboard_name}" # SS_Kraken/SS_CANdleLight share a class name
+            subsystem.periodic = self._timed(f"{name}.periodic", subsystem.periodic)
+
+    def _instrument_command(self, command: commands2.Command) -> None:
+        if getattr(command, "_loop_timer_instrumented", False):
+            return
+        command.execute = self._timed(f"{command.getName()}.execute", command.execute)
+        command._loop_timer_instrumented = True
+
+    def _timed(self, phase_name: str, function):
+        def timed_function():
+            start = time.perf_counter()
+            function()
+            self.record(phase_name, start)
+        return timed_function
+
+    def record(self, phase_name: str, start: float) -> None:
+        milliseconds = (time.perf_counter() - start) * 1000
+        self._cycle_times[phase_name] = self._cycle_times.get(phase_name, 0.0) + milliseconds
+
+    def start_cycle(self) -> None:
+        """Called at the top of robotPeriodic: closes out the previous loop's measurements."""
+        now = wpilib.Timer.getFPGATimestamp() # the clock TimedRobot schedules loops with; simulated time in tests
+        if self._cycle_start is not None:
+            loop_ms = (now - self._cycle_start) * 1000
+            if loop_ms > self._loop_budget_ms + self._OVERRUN_TOLERANCE_MS:
+                self._report_overrun(loop_ms)
+        self._cycle_start = now
+        for phase_name, milliseconds in self._cycle_times.items():
+            if phase_name not in self._histograms:
+                self._histograms[phase_name] = RollingHistogram()
+            self._histograms[phase_name].add(milliseconds)
+        self._cycle_times = {}
+
+        self._loop_counter += 1
+        if self._loop_counter % self._publish_every_n_loops == 0:
+            self._publish_histograms()
+
+    def _report_overrun(self, loop_ms: float) -> None:
+        self.overruns += 1
+        if self._cycle_times:
+            worst_phase = max(self._cycle_times, key=self._cycle_times.get)
+            worst = f"{worst_phase} {self._cycle_times[worst_phase]:.1f} ms"
+        else:
+            worst = "untimed work"
+        self._pub_overruns.set(self.overruns)
+        self._pub_worst_offender.set(worst)
+        now = time.monotonic()
+        if now - self._last_overrun_report > 1.0: # don't flood the DS console during a bad stretch
+            self._last_overrun_report = now
+            wpilib.reportWarning(f"Loop overrun: {loop_ms:.1f} ms, worst offender {worst}", printTrace=False)
+
+    def _publish_histograms(self) -> None:
+        for phase_name, histogram in self._histograms.items():
+            p50, p95, p99, worst = histogram.percentiles()
+            DashboardPublisher.number(f"LoopTimer/{phase_name} p50 (ms)", epsilon=0.01).set(round(p50, 2))
+            DashboardPublisher.number(f"LoopTimer/{phase_name} p95 (ms)", epsilon=0.01).set(round(p95, 2))
+            DashboardPublisher.number(f"LoopTimer/{phase_name} p99 (ms)", epsilon=0.01).set(round(p99, 2))
+            DashboardPublisher.number(f"LoopTimer/{phase_name} max (ms)", epsilon=0.01).set(round(worst, 2))
+            SignalLogger.write_double_array(f"LoopTimer/{phase_name}", [p50, p95, p99, worst], "ms")
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import math
+import os
+import struct
+from array import array
+import wpilib
+from wpimath.geometry import Translation2d
+
+
+class NavGrid:
+    """
+    PathPlanner's navgrid.json compiled into a packed obstacle bitset plus a Euclidean distance
+    transform, so is_free(x, y) and clearance(x, y) are O(1) lookups in field meters. It is
+    compiled at startup, or read from a binary sidecar made at deploy time with
+    `python subsystems/NavGrid.py`. The sidecar is only used while it matches the JSON's hash.
+    Clearance is measured from the cell center to the nearest obstacle cell center.
+    """
+    _SIDECAR_HEADER = struct.Struct("<4sHIIfff20s") # magic, version, columns, rows, node size, field length, field width, sha1
+    _SIDECAR_MAGIC = b"NAVG"
+    _SIDECAR_VERSION = 1
+    _loaded: "NavGrid | None" = None
+
+    @classmethod
+    def load(cls) -> "NavGrid":
+        if cls._loaded is None:
+            json_path = os.path.join(wpilib.getDeployDirectory(), "pathplanner", "navgrid.json")
+            with open(json_path, "rb") as file:
+                source = file.read()
+            source_hash = hashlib.sha1(source).digest()
+            cls._loaded = cls._read_sidecar(cls.sidecar_path(json_path), source_hash) or cls.compile(json.loads(source))
+        return cls._loaded
+
+    @staticmethod
+    def sidecar_path(json_path: str) -> str:
+        return os.path.splitext(json_path)[0] + ".bin"
+
+    @classmethod
+    def compile(cls, navgrid: dict) -> "NavGrid":
+        grid = navgrid["grid"]
+        rows, columns = len(grid), len(grid[0])
+        blocked = bytearray((rows * columns + 7) // 8)
+        for row in range(rows):
+            for column in range(columns):
+                if grid[row][column]:
+                    index = row * columns + column
+                    blocked[index >> 3] |= 1 << (index & 7)
+        node_size = float(navgrid["nodeSizeMeters"])
+        squared_cells = cls._squared_distance_transform(grid, rows, columns)
+        clearance = array("f", (math.sqrt(squared) * node_size for squared in squared_cells))
+        return NavGrid(columns, rows, node_size, navgrid["field_size"]["x"], navgrid["field_size"]["y"], blocked, clearance)
+
+    def __init__(self, columns: int, rows: int, node_size: float, field_length: float, field_width: float,
+                 blocked: bytearray, clearance: array) -> None:
+        self.columns = columns
+        self.rows = rows
+        self.node_size = node_size
+        self.field_length = field_length
+        self.field_width = field_width
+        self._blocked = blocked
+        self._clearance = clearance
+
+    def is_free(self, x: float, y: float) -> bool:
+        index = self._cell_index(x, y)
+        return index >= 0 and not (self._blocked[index >> 3] >> (index & 7)) & 1
+
+    def clearance(self, x: float, y: float) -> float:
+        """Meters from (x, y)'s cell to the nearest obstacle; 0.0 inside an obstacle or off the field."""
+        index = self._cell_index(x, y)
+        return self._clearance[index] if index >= 0 else 0.0
+
+    def segment_is_free(self, start: Translation2d, end: Translation2d) -> bool:
+        """True when every cell along the straight line from start to end is free, sampled every half cell."""
+        length = (end - start).norm()
+        steps = max(1, math.ceil(length / (self.node_size * 0.5)))
+        for step in range(steps + 1):
+            t = step / steps
+            if not self.is_free(start.X() + (end.X() - start.X()) * t, start.Y() + (end.Y() - start.Y()) * t):
+                return False
+        return True
+
+    def write_sidecar(self, path: str, source_hash: bytes) -> None:
+        with open(path, "wb") as file:
+            file.write(self._SIDECAR_HEADER.pack(self._SIDECAR_MAGIC, self._SIDECAR_VERSION, self.columns, self.rows,
+                                                 self.node_size, self.field_length, self.field_width, source_hash))
+            file.write(self._blocked)
+            file.write(self._clearance.tobytes())
+
+    def _cell_index(self, x: float, y: float) -> int:
+        column = int(x / self.node_size)
+        row = int(y / self.node_size)
+        if x < 0.0 or y < 0.0 or column >= self.columns or row >= self.rows:
+            return -1
+        return row * self.columns + column
+
+    @classmethod
+    def _read_sidecar(cls, path: str, source_hash: bytes) -> "NavGrid | None":
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < cls._SIDECAR_HEADER.size:
+            return None
+        magic, version, columns, rows, node_size, field_length, field_width, sidecar_hash = cls._SIDECAR_HEADER.unpack_from(data)
+        if magic != cls._SIDECAR_MAGIC or version != cls._SIDECAR_VERSION or sidecar_hash != source_hash:
+            return None # stale: navgrid.json was edited after the sidecar was built
+        offset = cls._SIDECAR_HEADER.size
+        bitset_size = (rows * columns + 7) // 8
+        blocked = bytearray(data[offset:offset + bitset_size])
+        clearance = array("f")
+        clearance.frombytes(data[offset + bitset_size:])
+        if len(clearance) != rows * columns:
+            return None
+        return NavGrid(columns, rows, node_size, field_length, field_width, blocked, clearance)
+
+    @staticmethod
+    def _squared_distance_transform(grid: list, rows: int, columns: int) -> list[float]:
+        # Felzenszwalb-Huttenlocher exact EDT: a 1D lower-envelope pass down each column, then along each row
+        infinity = float(rows * rows + columns * columns)
+        columns_pass = [0.0] * (rows * columns)
+        for column in range(columns):
+            distances = NavGrid._distance_transform_1d([0.0 if grid[row][column] else infinity for row in range(rows)])
+            for row in range(rows):
+                columns_pass[row * columns + column] = distances[row]
+        squared = []
+        for row in range(rows):
+            squared.extend(NavGrid._distance_transform_1d(columns_pass[row * columns:(row + 1) * columns]))
+        return squared
+
+    @staticmethod
+    def _distance_transform_1d(values: list[float]) -> list[float]:
+        count = len(values)
+        vertices = [0] * count
+        boundaries = [0.0] * (count + 1)
+        boundaries[0], boundaries[1] = -math.inf, math.inf
+        hull = 0
+        for q in range(1, count):
+            while True:
+                p = vertices[hull]
+                s = ((values[q] + q * q) - (values[p] + p * p)) / (2 * q - 2 * p)
+                if s > boundaries[hull]:
+                    break
+                hull -= 1
+            hull += 1
+            vertices[hull] = q
+            boundaries[hull] = s
+            boundaries[hull + 1] = math.inf
+        distances = [0.0] * count
+        hull = 0
+        for q in range(count):
+            while boundaries[hull + 1] < q:
+                hull += 1
+            p = vertices[hull]
+            distances[q] = (q - p) * (q - p) + values[p]
+        return distances
+
+
+if __name__ == "__main__":
+    # Deploy-time step: write deploy/pathplanner/navgrid.bin so the robot skips compiling at startup
+    json_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "deploy", "pathplanner", "navgrid.json")
+    with open(json_path, "rb") as source_file:
+        source = source_file.read()
+    NavGrid.compile(json.loads(source)).write_sidecar(NavGrid.sidecar_path(json_path), hashlib.sha1(source).digest())
+    print(f"Wrote {NavGrid.sidecar_path(json_path)}")
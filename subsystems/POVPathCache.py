@@ -0,0 +1,166 @@
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from wpilib import DriverStation
+from pathplannerlib.config import RobotConfig
+from pathplannerlib.path import GoalEndState, IdealStartingState, PathConstraints, PathPlannerPath
+from pathplannerlib.pathfinding import Pathfinding
+from wpimath.geometry import Pose2d, Rotation2d, Translation2d
+from subsystems.NavGrid import NavGrid
+
+
+class POVPathCache:
+    """
+    Pre-plans the POV pathfind zones while disabled, so a press during the match can follow a
+    ready path right away instead of waiting for the pathfinder. PathPlanner's pathfinder plans
+    from a coarse grid of start points to each zone, in field coordinates for the current
+    alliance. Planning is a small state machine stepped once per disabled loop. The pathfinder
+    searches on its own thread; a worker thread then builds the finished paths, one per start
+    heading, and generates their ideal trajectories, so following one costs nothing at the press.
+    Paths are cached per key (alliance + dashboard lane values + constraints).
+    """
+    START_XS = (2.0, 7.0, 8.25, 9.5, 14.5) # the open areas of the navgrid: both alliance zones and the neutral zone
+    START_YS = (1.5, 4.0, 6.5)
+    START_RADIUS_M = 1.25 # a cached path is used when the robot is this close to its start point
+    # PathPlanner follows a path's ideal trajectory when the robot heading is within 30 degrees of its ideal start
+    HEADINGS = tuple(Rotation2d.fromDegrees(degrees) for degrees in range(0, 360, 60))
+    SETTLE_SECONDS = 0.25 # let the pathfinder refine its first path for this long before taking it
+    TIMEOUT_SECONDS = 3.0
+    MAX_ATTEMPTS = 3 # a job that times out or finds no path is retried after the others, up to this many times
+    _MIN_LEAD_IN_M = 0.05 # closer than this to the start point the robot follows the cached path directly
+    _PLANNING_CONSTRAINTS = PathConstraints(1.0, 1.0, math.pi, math.pi) # only the waypoints are kept
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="POVPathCache")
+
+    def __init__(self, navgrid: NavGrid, robot_config: RobotConfig) -> None:
+        self._navgrid = navgrid
+        self._robot_config = robot_config
+        Pathfinding.ensureInitialized() # load navgrid.json and start the planner thread now, not on the first press
+        self._plans: dict[tuple, dict[tuple, list[PathPlannerPath]]] = {} # key -> {(pov, start_x, start_y): path per heading}
+        self._key = None
+        self._goals: dict[int, Translation2d] = {}
+        self._constraints: PathConstraints | None = None
+        self._jobs: list[tuple] = []
+        self._job = None
+        self._job_started = 0.0
+        self._job_path_available = 0.0 # when the pathfinder first reported a path for this job
+        self._job_fetch: Future | None = None
+        self._attempts: dict[tuple, int] = {}
+        self.failed_plans = 0 # jobs that used up their attempts, for the current key
+
+    def planned_count(self, key: tuple) -> int:
+        return len(self._plans.get(key, {}))
+
+    def plan_step(self, key: tuple, goals: dict[int, Translation2d], constraints: PathConstraints) -> None:
+        """
+        Advance pre-planning by one disabled loop. goals maps each POV angle to its field-coordinate goal;
+        constraints are the ones the paths will be followed with, so key has to include them.
+        """
+        if key != self._key:
+            self._key = key
+            self._goals = goals
+            self._constraints = constraints
+            self._attempts = {}
+            self.failed_plans = 0
+            plans = self._plans.setdefault(key, {})
+            self._jobs = [(pov, x, y) for pov in goals for x in self.START_XS for y in self.START_YS
+                          if (pov, x, y) not in plans and self._navgrid.is_free(x, y)] # the robot can't start inside an obstacle
+            self._job = None
+
+        if self._job is None:
+            if self._jobs:
+                self._start_job(self._jobs.pop(0))
+            return
+
+        if self._job_fetch is not None:
+            if self._job_fetch.done():
+                paths = self._job_fetch.result()
+                if paths is None:
+                    self._retry_or_fail()
+                else:
+                    self._plans[self._key][self._job] = paths
+                    self._job = None
+            return
+
+        now = time.monotonic()
+        if not self._job_path_available and Pathfinding.isNewPathAvailable():
+            self._job_path_available = now
+        if self._job_path_available and now - self._job_path_available > self.SETTLE_SECONDS:
+            self._job_fetch = self._executor.submit(self._build_paths, self._constraints)
+        elif now - self._job_started > self.TIMEOUT_SECONDS:
+            self._retry_or_fail()
+
+    def interrupt(self) -> None:
+        """Stop using the pathfinder (robot enabled); the unfinished job is retried on the next disabled loop."""
+        if self._job is not None:
+            self._jobs.insert(0, self._job)
+            self._job = None # a fetch still in flight is discarded
+
+    def find(self, key: tuple, pov: int, pose: Pose2d) -> list[PathPlannerPath] | None:
+        """
+        The paths to follow from pose: a straight lead-in to the nearest cached start point, when the robot isn't
+        already on it, then the cached path for the nearest start heading. None when there is no cached path close
+        enough or the lead-in is blocked.
+        """
+        plans = self._plans.get(key)
+        if not plans:
+            return None
+        position = pose.translation()
+        best_paths, best_start, best_distance = None, None, self.START_RADIUS_M
+        for (plan_pov, start_x, start_y), paths in plans.items():
+            if plan_pov != pov:
+                continue
+            distance = math.hypot(position.X() - start_x, position.Y() - start_y)
+            if distance <= best_distance:
+                best_paths, best_start, best_distance = paths, Translation2d(start_x, start_y), distance
+        if best_paths is None:
+            return None
+
+        path = best_paths[round(pose.rotation().degrees() / 60.0) % len(self.HEADINGS)]
+        if best_distance < self._MIN_LEAD_IN_M:
+            return [path]
+        if not self._navgrid.segment_is_free(position, best_start):
+            return None
+        # A two-point lead-in is cheap to build and generate; it stops on the start point so the cached path's
+        # ideal (standing start) trajectory applies
+        leg_direction = (best_start - position).angle()
+        lead_in = PathPlannerPath(
+            PathPlannerPath.waypointsFromPoses([Pose2d(position, leg_direction), Pose2d(best_start, leg_direction)]),
+            path.getGlobalConstraints(), None, GoalEndState(0.0, pose.rotation()),
+        )
+        lead_in.preventFlipping = True # already in this alliance's field coordinates
+        return [lead_in, path]
+
+    def _retry_or_fail(self) -> None:
+        attempts = self._attempts.get(self._job, 0) + 1
+        self._attempts[self._job] = attempts
+        if attempts < self.MAX_ATTEMPTS:
+            self._jobs.append(self._job)
+        else:
+            self.failed_plans += 1
+        self._job = None
+
+    def _start_job(self, job: tuple) -> None:
+        pov, start_x, start_y = job
+        self._job = job
+        self._job_started = time.monotonic()
+        self._job_path_available = 0.0
+        self._job_fetch = None
+        Pathfinding.setStartPosition(Translation2d(start_x, start_y))
+        Pathfinding.setGoalPosition(self._goals[pov])
+
+    def _build_paths(self, constraints: PathConstraints) -> list[PathPlannerPath] | None:
+        if not DriverStation.isDisabled(): # the pathfinder now belongs to a live PathfindingCommand
+            return None
+        planned = Pathfinding.getCurrentPath(self._PLANNING_CONSTRAINTS, GoalEndState(0.0, Rotation2d()))
+        if planned is None:
+            return None
+        paths = []
+        for heading in self.HEADINGS:
+            if not DriverStation.isDisabled(): # don't compete with the main loop for the GIL while enabled
+                return None
+            path = PathPlannerPath(planned.getWaypoints(), constraints, IdealStartingState(0.0, heading),
+                                   GoalEndState(0.0, heading))
+            path.preventFlipping = True # planned in this alliance's field coordinates
+            path.getIdealTrajectory(self._robot_config) # cached on the path for FollowPathCommand
+            paths.append(path)
+        return paths
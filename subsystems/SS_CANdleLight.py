@@ -6,36 +6,25 @@ from phoenix6.configs.config_groups import CANdleFeaturesConfigs
 from phoenix6.signals import StripTypeValue, RGBWColor
 from phoenix6.controls import FireAnimation, SingleFadeAnimation, TwinkleAnimation, LarsonAnimation  
 from phoenix6.controls import TwinkleOffAnimation, SolidColor, ColorFlowAnimation
+from subsystems.FieldGeometry import FieldGeometry
 
 class SS_CANdleLight(commands2.Subsystem):
-    def __init__(self, CANdle_channel: int, canbus, dashboard_name: str) -> None:
+    def __init__(self, CANdle_channel: int, canbus, dashboard_name: str, defer_configuration: bool = False) -> None:
         self.supply_battery_voltage = 0.0
         self.number_of_leds_to_light = 8
         self.candle = CANdle(CANdle_channel, canbus)
         self.dashboard_name = dashboard_name
-        configs = CANdleConfiguration()
-        configs.led.with_strip_type(StripTypeValue.RGB).with_brightness_scalar(0.5)
+        self._configs = CANdleConfiguration()
+        self._configs.led.with_strip_type(StripTypeValue.RGB).with_brightness_scalar(0.5)
         self._periodic_counter = 0
 
-        configs.candle_features = CANdleFeaturesConfigs()
-        #configs.candle_features.with_enable5_v_rail(True)
-        self.candle.configurator.apply(configs)
+        self._configs.candle_features = CANdleFeaturesConfigs()
+        #self._configs.candle_features.with_enable5_v_rail(True)
+        if not defer_configuration: # otherwise DeviceStartup calls configure_hardware() alongside the other devices
+            self.configure_hardware()
         self.rgb_white = 0
-        if wpilib.DriverStation.getAlliance() == wpilib.DriverStation.Alliance.kRed:
-            self.rgb_red = 255
-            self.rgb_green = 0
-            self.rgb_blue = 0
-            alliance_color_solid = lambda: self.set_all_leds_RGBW(red=self.rgb_red, green=self.rgb_green, blue=self.rgb_blue)
-        elif wpilib.DriverStation.getAlliance() == wpilib.DriverStation.Alliance.kBlue:
-            self.rgb_red = 0
-            self.rgb_green = 0
-            self.rgb_blue = 255
-            alliance_color_solid = lambda: self.set_all_leds_RGBW(red=self.rgb_red, green=self.rgb_green, blue=self.rgb_blue)
-        else:
-            self.rgb_red = 255
-            self.rgb_green = 255
-            self.rgb_blue = 255
-            alliance_color_solid = lambda: self.set_all_leds_RGBW(red=self.rgb_red, green=self.rgb_green, blue=self.rgb_blue)
+        FieldGeometry.on_alliance_change(self._on_alliance_change) # sets rgb_red/green/blue
+        alliance_color_solid = lambda: self.set_all_leds_RGBW(red=self.rgb_red, green=self.rgb_green, blue=self.rgb_blue)
         self._color_chooser = wpilib.SendableChooser()
         self._color_chooser.setDefaultOption("Alliance Color Solid", alliance_color_solid) # Choose a target based on alliance and position
         self._color_chooser.addOption("Fire", self.set_animation_fire)
@@ -47,6 +36,17 @@ class SS_CANdleLight(commands2.Subsystem):
         wpilib.SmartDashboard.putData(f"SS_Telemetry/CANDle {self.dashboard_name}/{self.dashboard_name} CANDle Animation", self._color_chooser)
         self.selected_animation = alliance_color_solid
 
+    def _on_alliance_change(self, alliance) -> None:
+        if alliance == wpilib.DriverStation.Alliance.kRed:
+            self.rgb_red, self.rgb_green, self.rgb_blue = 255, 0, 0
+        elif alliance == wpilib.DriverStation.Alliance.kBlue:
+            self.rgb_red, self.rgb_green, self.rgb_blue = 0, 0, 255
+        else:
+            self.rgb_red, self.rgb_green, self.rgb_blue = 255, 255, 255
+
+    def configure_hardware(self):
+        return self.candle.configurator.apply(self._configs)
+
     def periodic(self):
         self._periodic_counter += 1
         if self._periodic_counter % 5 == 0:  # Every 100ms instead of every 20ms
@@ -4,6 +4,7 @@ from subsystems.SS_SwerveDrive import SS_SwerveDrive
 from wpimath.geometry import Pose3d, Pose2d, Transform3d, Translation3d, Rotation3d
 from wpilib import SmartDashboard, Timer
 from subsystems.command_swerve_drivetrain import CommandSwerveDrivetrain
+from subsystems.DashboardPublisher import DashboardPublisher
 from photonlibpy import PhotonCamera, PhotonPoseEstimator
 from robotpy_apriltag import AprilTagField, AprilTagFieldLayout
 
@@ -21,6 +22,9 @@ class SS_CameraPose_Left(commands2.Subsystem):
             return
         # load load field and dashboard toggle
         SmartDashboard.putBoolean("Vision/Enable Left Camera", True)
+        self._pub_vision_x = DashboardPublisher.number("Vision/Vision X left", epsilon=0.005)
+        self._pub_vision_y = DashboardPublisher.number("Vision/Vision Y left", epsilon=0.005)
+        self._pub_vision_heading = DashboardPublisher.number("Vision/Vision Heading left", epsilon=0.05)
         self.field_layout = AprilTagFieldLayout.loadField(AprilTagField.kDefaultField)
 
         # set camera
@@ -76,7 +80,6 @@ class SS_CameraPose_Left(commands2.Subsystem):
 
         # Dashboard
         pose = est.estimatedPose
-        SmartDashboard.putNumber("Vision/Vision X left", pose.X())
-        SmartDashboard.putNumber("Vision/Vision Y left", pose.Y())
-        SmartDashboard.putNumber("Vision/Vision Heading left",
-                                 pose.rotation().toRotation2d().degrees())
\ No newline at end of file
+        self._pub_vision_x.set(pose.X())
+        self._pub_vision_y.set(pose.Y())
+        self._pub_vision_heading.set(pose.rotation().toRotation2d().degrees())
\ No newline at end of file
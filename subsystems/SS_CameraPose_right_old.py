@@ -2,30 +2,42 @@ import commands2
 import wpilib
 from subsystems.SS_SwerveDrive import SS_SwerveDrive
 from wpimath.geometry import Pose3d, Pose2d, Transform3d, Translation3d, Rotation3d
-from wpilib import SmartDashboard, Timer
+from wpilib import DriverStation, SmartDashboard, Timer
 from subsystems.command_swerve_drivetrain import CommandSwerveDrivetrain
-from photonlibpy import PhotonCamera, PhotonPoseEstimator
+from subsystems.DashboardPublisher import DashboardPublisher
+from subsystems.TunableParameters import TunableBoolean
+from subsystems.VisionTelemetry import VisionTelemetry
+from subsystems.VisionWeighting import VisionMeasurementWeighting
+from subsystems.VisionWorker import VisionQueue, VisionWorker
+from photonlibpy.simulation import PhotonCameraSim, SimCameraProperties, VisionSystemSim
 from robotpy_apriltag import AprilTagField, AprilTagFieldLayout
 
 class SS_CameraPose_Right(commands2.Subsystem):
-
+    """
+    Vision pose fusion. Each camera has a VisionWorker thread that reads PhotonVision results and
+    estimates the robot pose; periodic() only drains their shared queue into the drivetrain's pose
+    estimator, so adding a camera doesn't add main-loop time. VisionMeasurementWeighting sets each
+    estimate's std devs from its tags and the robot's speed, and rejects outliers. In simulation each
+    camera is backed by a PhotonCameraSim, fed by physics.py through update_sim().
+    """
 
     def __init__(self, swerve_drive: SS_SwerveDrive):
         super().__init__()
         self.swerve_drive = swerve_drive
-        if not wpilib.RobotBase.isReal():
-            print("PhotonVision disabled in simulation")
-            self.rightcam = None
-            self.leftcam = None
-            self.estimator = None
-            return
-        # load load field and dashboard toggle
-        SmartDashboard.putBoolean("Vision/Enable Right Camera", True)
+        self.workers: list[VisionWorker] = []
+        # load load field (kDefaultField is the 2026 welded field)
         self.field_layout = AprilTagFieldLayout.loadField(AprilTagField.kDefaultField)
-
-        # set camera
-        self.rightcam = PhotonCamera("RightCamera") # Left=rightcam, not time to fix
-        #self.leftcam = PhotonCamera("LeftCamera") # unused for now, but we can add it later if we want
+        self.vision_sim = None
+        if not wpilib.RobotBase.isReal():
+            self.vision_sim = VisionSystemSim("main")
+            self.vision_sim.addAprilTags(self.field_layout)
+        self.vision_queue = VisionQueue()
+        self.weighting = VisionMeasurementWeighting()
+        self._tunable_enables: dict[str, TunableBoolean] = {}
+        self._pub_vision_pose: dict[str, tuple] = {}
+        self._pub_frame_counts: dict[str, tuple] = {}
+        self._workers_by_camera: dict[str, VisionWorker] = {}
+        self._telemetry: dict[str, VisionTelemetry] = {}
 
         # we need to measure this 
         #self.robot_to_leftcam = Transform3d(
@@ -37,46 +49,87 @@ class SS_CameraPose_Right(commands2.Subsystem):
             Rotation3d(0.0, 0.0, 3.14) # radians roll, pitch, yaw from robot forward
         )
 
-        # pos estimation
-        self.estimator = PhotonPoseEstimator(
-            self.field_layout,
-            self.robot_to_rightcam,
-            #self.robot_to_leftcam
-        )
+        # set cams, one worker thread each
+        self._add_camera("Right", "RightCamera", self.robot_to_rightcam) # Left=rightcam, not time to fix
+        #self._add_camera("Left", "LeftCamera", self.robot_to_leftcam) # unused for now, but we can add it later if we want
 
-    def periodic(self):
-        # grab cams 
-        if self.rightcam is None:
-            return
-        # Dashboard toggle
-        if not SmartDashboard.getBoolean("Vision/Enable Right Camera", True):
-            return
-        results = self.rightcam.getAllUnreadResults()
-        if not results:
-            return
+    def _add_camera(self, label: str, camera_name: str, robot_to_camera: Transform3d) -> None:
+        self._pub_vision_pose[camera_name] = (
+            DashboardPublisher.number(f"Vision/Vision X {label.lower()}", epsilon=0.005),
+            DashboardPublisher.number(f"Vision/Vision Y {label.lower()}", epsilon=0.005),
+            DashboardPublisher.number(f"Vision/Vision Heading {label.lower()}", epsilon=0.05),
+        )
+        self._pub_frame_counts[camera_name] = (
+            DashboardPublisher.number(f"Vision/{label} Frames Received"),
+            DashboardPublisher.number(f"Vision/{label} Frames Used"),
+            DashboardPublisher.number(f"Vision/{label} Frames Dropped"),
+            DashboardPublisher.number(f"Vision/{label} Frames Rejected"),
+        )
+        self._telemetry[camera_name] = VisionTelemetry(label)
+        worker = VisionWorker(camera_name, robot_to_camera, self.field_layout, self.vision_queue)
+        self._workers_by_camera[camera_name] = worker
+        # Toggled from the dashboard; the workers never touch SmartDashboard themselves
+        self._tunable_enables[camera_name] = TunableBoolean(f"Vision/Enable {label} Camera", True,
+                                                            lambda enabled: setattr(worker, "enabled", enabled))
+        self.workers.append(worker)
+        if self.vision_sim is not None:
+            # Arducam OV9281 at 640x480: calibration, pixel noise, 30 fps and 60 +/- 20 ms latency
+            camera_sim = PhotonCameraSim(worker.camera, SimCameraProperties.OV9281_640_480(), self.field_layout)
+            self.vision_sim.addCamera(camera_sim, robot_to_camera)
 
-        result = results[-1]
-        if not result.hasTargets():
-            return
+    def update_sim(self, robot_pose: Pose2d) -> None:
+        """Called by physics.py with the simulated ground-truth pose; publishes any frames the sim cameras are due."""
+        if self.vision_sim is not None:
+            self.vision_sim.update(robot_pose)
 
-        # calculate pos based on cams (use one of these)
-        #est = self.estimator.estimatePnpDistanceTrigSolvePose(result)
-        #est = self.estimator.estimateCoprocMultiTagPose(result)
-        est = self.estimator.estimateLowestAmbiguityPose(result)
+    def publish_stats(self) -> None:
+        for telemetry in self._telemetry.values():
+            telemetry.publish()
 
-        if est is None:
+    def periodic(self):
+        if not self.workers:
             return
+        drive_state = self.swerve_drive.drive_state
+        gate_outliers = not DriverStation.isDisabled() # let vision place the robot freely before the match
+        # every frame since the last loop, oldest first, each at its own capture time
+        for estimate in self.vision_queue.drain():
+            worker = self._workers_by_camera[estimate.camera_name]
+            if estimate.timestamp < self.swerve_drive.last_pose_reset_time:
+                worker.frames_rejected += 1 # captured before the robot was placed: it would drag the pose back
+                continue
+            pose_before = self.swerve_drive.drivetrain.sample_pose_at(estimate.timestamp) or drive_state.pose
+            std_devs = self.weighting.std_devs(estimate, drive_state.speeds, pose_before if gate_outliers else None)
+            if std_devs is None:
+                worker.frames_rejected += 1
+                continue
 
-        # send to swerve
-        self.swerve_drive.drivetrain.add_vision_measurement(
-            est.estimatedPose.toPose2d(),
-            est.timestampSeconds,
-            vision_measurement_std_devs = [.1, .1, 5.0] # distrust of x, y in meters, heading in degrees
-        )
+            # send to swerve
+            self.swerve_drive.drivetrain.add_vision_measurement(
+                estimate.pose,
+                estimate.timestamp,
+                vision_measurement_std_devs = std_devs # distrust of x, y in meters, heading in radians
+            )
+            # the estimator corrects its history at the capture time, so the same sample shows the move
+            pose_after = self.swerve_drive.drivetrain.sample_pose_at(estimate.timestamp) or pose_before
+            self._telemetry[estimate.camera_name].record(
+                estimate.latency_ms,
+                estimate.processing_ms,
+                (Timer.getFPGATimestamp() - estimate.timestamp) * 1000,
+                pose_after.translation().distance(pose_before.translation()) * 100,
+                abs((pose_after.rotation() - pose_before.rotation()).degrees()),
+                estimate.tag_count,
+            )
+
+            # Dashboard
+            pub_x, pub_y, pub_heading = self._pub_vision_pose[estimate.camera_name]
+            pub_x.set(estimate.pose.X())
+            pub_y.set(estimate.pose.Y())
+            pub_heading.set(estimate.pose.rotation().degrees())
+            worker.frames_used += 1
 
-        # Dashboard
-        pose = est.estimatedPose
-        SmartDashboard.putNumber("Vision/Vision X right", pose.X())
-        SmartDashboard.putNumber("Vision/Vision Y right", pose.Y())
-        SmartDashboard.putNumber("Vision/Vision Heading right", 
-                                 pose.rotation().toRotation2d().degrees())
\ No newline at end of file
+        for worker in self.workers:
+            pub_received, pub_used, pub_dropped, pub_rejected = self._pub_frame_counts[worker.camera_name]
+            pub_received.set(worker.frames_received)
+            pub_used.set(worker.frames_used)
+            pub_dropped.set(worker.frames_dropped)
+            pub_rejected.set(worker.frames_rejected)
@@ -1,36 +1,74 @@
 import wpilib
 import phoenix6
 import commands2
-from phoenix6 import CANBus
-from wpilib import SmartDashboard
+from phoenix6 import CANBus, StatusCode
 from ntcore import NetworkTableInstance
-from pathplannerlib.auto import NamedCommands
+from subsystems.KrakenSignals import KrakenSignalRegistry
+from subsystems.DashboardPublisher import DashboardPublisher
+from subsystems.TunableParameters import TunableNumber
+from subsystems.ConfigApplier import TalonFXConfigApplier
+from subsystems.LazyCommands import LazyCommands
+from subsystems.FlywheelObserver import FlywheelObserver
+from subsystems.FeedforwardEstimator import FeedforwardEstimator
 
 class SS_Kraken(commands2.Subsystem):
+    _NOMINAL_VOLTS = 12.0 # VelocityDutyCycle gains are duty cycle per rps; the estimator works in volts
+    _MIN_FEEDFORWARD_SAMPLES = 250 # 5 s of running
+    _MIN_FEEDFORWARD_VELOCITY_SPREAD = 5.0 # rps; steady running alone can't separate kV from kS and kA
+
     def __init__(self, device_id: int, canbus: CANBus, dashboard_name: str, 
                  inverted: bool=False, brake_mode: bool=False,
                  max_rps: int=100, velocity_setpoint: float=0.0, percent_power_setpoint: float=0.0,
                  kp: float=0.0, ki: float=0.0, kd: float=0.0, kv: float=0.0, ks: float=0.0,
-                 ka: float=0.0, kg: float=0.0, vmax: float=0.0, amax: float=0.0, jerk: float=0.0) -> None:
+                 ka: float=0.0, kg: float=0.0, vmax: float=0.0, amax: float=0.0, jerk: float=0.0,
+                 observer_kv: float=0.0, observer_ka: float=0.0, fire_lookahead_s: float=0.1,
+                 identify_feedforward: bool=False, defer_configuration: bool=False) -> None:
         self.motor = phoenix6.hardware.TalonFX(device_id, canbus)
+        self.signals = KrakenSignalRegistry.register(self.motor) # refreshed once per loop in robotPeriodic
+        self._config_applier = TalonFXConfigApplier(self.motor)
+        self._pending_configs = [] # (pidf summary, Future) pairs still being applied by the config worker
 
         self.dashboard_name = dashboard_name
         self.max_rps = max_rps
         self.percent_power_setpoint = percent_power_setpoint
         self.velocity_setpoint = velocity_setpoint
         self.velocity_actual = 0.0
+        self.current_actual = 0.0
+        self.temperature_actual = 0.0
         self.command_mode = "stopped"
         self.commanded_velocity_setpoint = 0.0
         self.commanded_power_percent = 0.0
+        self._pub_config_success = DashboardPublisher.boolean(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Config Success")
         self._setup_hardware_configuration(inverted, brake_mode)
-        self._apply_pidf_to_config(kp, ki, kd, kv, ks, ka, kg, vmax, amax, jerk)
+        self._pidf_summary = self._set_pidf_in_config(kp, ki, kd, kv, ks, ka, kg, vmax, amax, jerk)
         self.position_setpoint = 0.0
         self.position_actual = 0.0
-        self._periodic_counter = 0
-        self.motor.set_position(self.position_setpoint) # pidf reset encoder position to 0 on startup
+        self._pub_position_actual = DashboardPublisher.number(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Position Actual", epsilon=0.005)
+        self._pub_velocity_actual = DashboardPublisher.number(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Velocity Actual", epsilon=0.05)
+        # Optional flywheel observer; observer_kv/ka are the mechanism's model in volts per rps and volts per rps/s
+        self.observer = FlywheelObserver(observer_kv, observer_ka) if observer_kv > 0.0 and observer_ka > 0.0 else None
+        self._fire_lookahead_s = fire_lookahead_s # time for a game piece to reach the wheel once fed
+        self._observer_timestamp = 0.0
+        if self.observer:
+            self._pub_filtered_velocity = DashboardPublisher.number(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Filtered Velocity", epsilon=0.05)
+            self._pub_acceleration = DashboardPublisher.number(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Acceleration", epsilon=0.5)
+            self._pub_time_to_setpoint = DashboardPublisher.number(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Time to Setpoint", epsilon=0.01)
+        # Optional online kS/kV/kA fit from normal running, suggested on the dashboard in config (duty cycle) units
+        self.feedforward_estimator = FeedforwardEstimator() if identify_feedforward else None
+        self._feedforward_timestamp = 0.0
+        self._feedforward_velocity = 0.0
+        if self.feedforward_estimator:
+            pidf_prefix = f"PIDF/{self.dashboard_name}/{self.dashboard_name}"
+            self._pub_suggested_ks = DashboardPublisher.number(f"{pidf_prefix} Suggested kS", epsilon=0.0005)
+            self._pub_suggested_kv = DashboardPublisher.number(f"{pidf_prefix} Suggested kV", epsilon=0.00005)
+            self._pub_suggested_ka = DashboardPublisher.number(f"{pidf_prefix} Suggested kA", epsilon=0.00005)
+            self._pub_feedforward_samples = DashboardPublisher.number(f"{pidf_prefix} Feedforward Samples")
+            self._pub_feedforward_velocity_spread = DashboardPublisher.number(f"{pidf_prefix} Feedforward Velocity Spread", epsilon=0.05)
+        if not defer_configuration: # otherwise DeviceStartup calls configure_hardware() alongside the other devices
+            self.configure_hardware()
 
         self._put_telemetry_on_dashboard()
-        self._construct_register_and_dashboard_commands()
+        self._register_lazy_commands()
 
     def _setup_hardware_configuration(self, inverted: bool=False, brake_mode: bool=False):
         self._config = phoenix6.configs.TalonFXConfiguration()
@@ -52,8 +90,22 @@ class SS_Kraken(commands2.Subsystem):
         self.velocity_FOC_request = phoenix6.controls.VelocityTorqueCurrentFOC(0.0) # advanced control unused
         self.position_request_with_trapezoid = phoenix6.controls.MotionMagicDutyCycle(0.0)
 
+    def configure_hardware(self) -> StatusCode:
+        """Blocking device setup: full config apply, then encoder reset. Safe to run on a startup thread."""
+        status = self._config_applier.apply(self._config)
+        self._report_config_status(status, self._pidf_summary)
+        if status.is_ok():
+            status = self.motor.set_position(self.position_setpoint) # pidf reset encoder position to 0 on startup
+        return status
+
     def _apply_pidf_to_config(self, new_p, new_i, new_d, new_v, new_s, 
                               new_a, new_g, new_vmax, new_amax, new_jerk):
+        pidf_summary = self._set_pidf_in_config(new_p, new_i, new_d, new_v, new_s, new_a, new_g, new_vmax, new_amax, new_jerk)
+        # live tuning: only changed groups are sent, on the config worker thread
+        self._pending_configs.append((pidf_summary, self._config_applier.submit(self._config)))
+
+    def _set_pidf_in_config(self, new_p, new_i, new_d, new_v, new_s, 
+                            new_a, new_g, new_vmax, new_amax, new_jerk) -> str:
         self._config.slot0.k_p = self.kP = new_p
         self._config.slot0.k_i = self.kI = new_i
         self._config.slot0.k_d = self.kD = new_d
@@ -69,106 +121,148 @@ class SS_Kraken(commands2.Subsystem):
             self._config.motion_magic.motion_magic_acceleration = self.amax
             self._config.motion_magic.motion_magic_jerk = self.jerk
 
-        self.status = self.motor.configurator.apply(self._config)
+        return f"kP={new_p}, kI={new_i}, kD={new_d}, kV={new_v}, kS={new_s}, kA={new_a}, kG={new_g}, vmax={new_vmax}, amax={new_amax}, jerk={new_jerk}"
+
+    def _report_config_status(self, status, pidf_summary: str) -> None:
+        self.status = status
         if self.status.is_ok():
-            wpilib.reportWarning(f"Applying PIDF config to {self.dashboard_name}: kP={new_p}, kI={new_i}, kD={new_d}, kV={new_v}, kS={new_s}, kA={new_a}, kG={new_g}, vmax={new_vmax}, amax={new_amax}, jerk={new_jerk}", printTrace=False)
+            wpilib.reportWarning(f"Applying PIDF config to {self.dashboard_name}: {pidf_summary}", printTrace=False)
         else:
             wpilib.reportError(f"Kraken PID update failed: {self.status}", False)
-        SmartDashboard.putBoolean(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Config Success", self.status.is_ok())
+        self._pub_config_success.set(self.status.is_ok())
+
+    def _report_finished_configs(self) -> None:
+        while self._pending_configs and self._pending_configs[0][1].done():
+            pidf_summary, pending_config = self._pending_configs.pop(0)
+            self._report_config_status(pending_config.result(), pidf_summary)
 
     def _put_telemetry_on_dashboard(self):
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Velocity Actual", round(self.velocity_actual, 1))
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Velocity Setpoint", self.velocity_setpoint)
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Power Percent Setpoint", self.percent_power_setpoint)
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Position Actual", round(self.position_actual, 2))
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Position Setpoint", self.position_setpoint)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} kP", self.kP)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} kI", self.kI)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} kD", self.kD)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} kV", self.kV)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} kS", self.kS)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} ka", self.kA)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} kg", self.kG)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} vmax", self.vmax)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} amax", self.amax)
-        SmartDashboard.putNumber(f"PIDF/{self.dashboard_name}/{self.dashboard_name} jerk", self.jerk)
-        nt_pidf = NetworkTableInstance.getDefault().getTable(f"PIDF/{self.dashboard_name}")
-        self._nt_kP = nt_pidf.getEntry(f"{self.dashboard_name} kP")
-        self._nt_kI = nt_pidf.getEntry(f"{self.dashboard_name} kI")
-        self._nt_kD = nt_pidf.getEntry(f"{self.dashboard_name} kD")
-        self._nt_kV = nt_pidf.getEntry(f"{self.dashboard_name} kV")
-        self._nt_kS = nt_pidf.getEntry(f"{self.dashboard_name} kS")
-        self._nt_kA = nt_pidf.getEntry(f"{self.dashboard_name} kA")
-        self._nt_kG = nt_pidf.getEntry(f"{self.dashboard_name} kG")
-        self._nt_vmax = nt_pidf.getEntry(f"{self.dashboard_name} vmax")
-        self._nt_amax = nt_pidf.getEntry(f"{self.dashboard_name} amax")
-        self._nt_jerk = nt_pidf.getEntry(f"{self.dashboard_name} jerk")
-
-    def _construct_register_and_dashboard_commands(self):
-        self.stop_motor_command = self.stop_motor()
-        NamedCommands.registerCommand(f"{self.dashboard_name} Stop Motor", self.stop_motor_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Stop Motor", self.stop_motor_command)
-
-        self.run_at_velocity_command = self.run_at_dashboard_velocity()
-        NamedCommands.registerCommand(f"{self.dashboard_name} Run at Setpoint Velocity", self.run_at_velocity_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Run at Velocity", self.run_at_velocity_command)
-
-        self.run_power_percent_forward_command = self.run_power_percent_forward_dashboard()
-        NamedCommands.registerCommand(f"{self.dashboard_name} Power Percent Forward", self.run_power_percent_forward_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Power Percent Forward", self.run_power_percent_forward_command)
-
-        self.run_power_percent_reverse_command = self.run_power_percent_reverse_dashboard()
-        NamedCommands.registerCommand(f"{self.dashboard_name} Power Percent Reverse", self.run_power_percent_reverse_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Power Percent Reverse", self.run_power_percent_reverse_command)
-        
-        self.spin_up_and_wait_command = self.spin_up_and_wait()
-        NamedCommands.registerCommand(f"{self.dashboard_name}/{self.dashboard_name} Spin-up to Setpoint and Wait", self.spin_up_and_wait_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Spin-up to Setpoint and Wait", self.spin_up_and_wait_command)
-
-        self.rotate_to_position_command = self.rotate_to_position()
-        NamedCommands.registerCommand(f"{self.dashboard_name} Rotate to Position", self.rotate_to_position_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Rotate to Position", self.rotate_to_position_command)
-
-        self.rotate_to_position_and_wait_command = self.rotate_to_position_and_wait()
-        NamedCommands.registerCommand(f"{self.dashboard_name} Rotate to and Wait", self.rotate_to_position_and_wait_command)
-        SmartDashboard.putData(f"Commands/{self.dashboard_name}/{self.dashboard_name} Rotate to Position and Wait", self.rotate_to_position_and_wait_command)
+        self._pub_velocity_actual.set(round(self.velocity_actual, 1))
+        self._pub_position_actual.set(round(self.position_actual, 2))
+        telemetry_prefix = f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name}"
+        self._tunable_velocity_setpoint = TunableNumber(f"{telemetry_prefix} Velocity Setpoint", self.velocity_setpoint, self._on_dashboard_velocity_setpoint)
+        self._tunable_power_percent_setpoint = TunableNumber(f"{telemetry_prefix} Power Percent Setpoint", self.percent_power_setpoint, self._on_dashboard_power_percent_setpoint)
+        self._tunable_position_setpoint = TunableNumber(f"{telemetry_prefix} Position Setpoint", self.position_setpoint, self._on_dashboard_position_setpoint)
+        pidf_prefix = f"PIDF/{self.dashboard_name}/{self.dashboard_name}"
+        self._pidf_changed = False
+        self._tunable_pidf = [ # order matches _apply_pidf_to_config arguments
+            TunableNumber(f"{pidf_prefix} kP", self.kP, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} kI", self.kI, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} kD", self.kD, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} kV", self.kV, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} kS", self.kS, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} ka", self.kA, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} kg", self.kG, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} vmax", self.vmax, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} amax", self.amax, self._on_dashboard_pidf),
+            TunableNumber(f"{pidf_prefix} jerk", self.jerk, self._on_dashboard_pidf),
+        ]
+
+    # -------------------------
+    # Dashboard edits - called from TunableParameters.drain() at the start of each loop
+    # -------------------------
+    def _on_dashboard_velocity_setpoint(self, value: float) -> None:
+        self.velocity_setpoint = max(min(value, self.max_rps), -self.max_rps)
+
+    def _on_dashboard_power_percent_setpoint(self, value: float) -> None:
+        self.percent_power_setpoint = max(min(value, 1.0), -1.0)
+
+    def _on_dashboard_position_setpoint(self, value: float) -> None:
+        self.position_setpoint = max(min(value, 1.0), -1.0)
+
+    def _on_dashboard_pidf(self, value: float) -> None:
+        self._pidf_changed = True # several gains edited in one loop are applied together in periodic
+
+    def _register_lazy_commands(self):
+        # Names go to NamedCommands and the dashboard now; each command is built on its first use
+        name = self.dashboard_name
+        self.stop_motor_command = LazyCommands.register(
+            self.stop_motor, f"{name} Stop Motor", f"Commands/{name}/{name} Stop Motor", (self,))
+        self.run_at_velocity_command = LazyCommands.register(
+            self.run_at_dashboard_velocity, f"{name} Run at Setpoint Velocity", f"Commands/{name}/{name} Run at Velocity", (self,))
+        self.run_power_percent_forward_command = LazyCommands.register(
+            self.run_power_percent_forward_dashboard, f"{name} Power Percent Forward", f"Commands/{name}/{name} Power Percent Forward", (self,))
+        self.run_power_percent_reverse_command = LazyCommands.register(
+            self.run_power_percent_reverse_dashboard, f"{name} Power Percent Reverse", f"Commands/{name}/{name} Power Percent Reverse", (self,))
+        self.spin_up_and_wait_command = LazyCommands.register(
+            self.spin_up_and_wait, f"{name}/{name} Spin-up to Setpoint and Wait", f"Commands/{name}/{name} Spin-up to Setpoint and Wait", (self,))
+        self.rotate_to_position_command = LazyCommands.register(
+            self.rotate_to_position, f"{name} Rotate to Position", f"Commands/{name}/{name} Rotate to Position", (self,))
+        self.rotate_to_position_and_wait_command = LazyCommands.register(
+            self.rotate_to_position_and_wait, f"{name} Rotate to and Wait", f"Commands/{name}/{name} Rotate to Position and Wait", (self,))
+        if self.feedforward_estimator:
+            self.apply_suggested_feedforward_command = LazyCommands.register(
+                self.apply_suggested_feedforward, dashboard_key=f"Commands/{name}/{name} Apply Suggested Feedforward")
 
     # -------------------------
     # Periodic tasks - dashboard updates and config changes
     # -------------------------
     def periodic(self):
-        self.position_actual = self.motor.get_position().value
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Position Actual", round(self.position_actual, 2))
-        self.velocity_actual = self.motor.get_velocity().value
-        SmartDashboard.putNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Velocity Actual", round(self.velocity_actual, 1))
-
-        self._periodic_counter += 1
-        if self._periodic_counter % 5 == 0:  # Every 100ms instead of every 20ms
-            dashboard_velocity_setpoint = self.get_dashboard_velocity_setpoint()
-            if dashboard_velocity_setpoint != self.velocity_setpoint:
-                self.velocity_setpoint = dashboard_velocity_setpoint
-            dashboard_power_percent_setpoint = SmartDashboard.getNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Power Percent Setpoint", self.percent_power_setpoint)
-            if dashboard_power_percent_setpoint != self.percent_power_setpoint:
-                self.percent_power_setpoint = max(min(dashboard_power_percent_setpoint, 1.0), -1.0)
-            dashboard_position_setpoint = SmartDashboard.getNumber(f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Position Setpoint", self.position_setpoint)
-            if dashboard_position_setpoint != self.position_setpoint:
-                self.position_setpoint = max(min(dashboard_position_setpoint, 1.0), -1.0)
-            dashboard_p = self._nt_kP.getDouble(self.kP)
-            dashboard_i = self._nt_kI.getDouble(self.kI)
-            dashboard_d = self._nt_kD.getDouble(self.kD)
-            dashboard_v = self._nt_kV.getDouble(self.kV)
-            dashboard_s = self._nt_kS.getDouble(self.kS)
-            dashboard_a = self._nt_kA.getDouble(self.kA)
-            dashboard_g = self._nt_kG.getDouble(self.kG)
-            dashboard_vmax = self._nt_vmax.getDouble(self.vmax)
-            dashboard_amax = self._nt_amax.getDouble(self.amax)
-            dashboard_jerk = self._nt_jerk.getDouble(self.jerk)
-            if (dashboard_p != self.kP or dashboard_i != self.kI or dashboard_d != self.kD or 
-                dashboard_v != self.kV or dashboard_s != self.kS or dashboard_a != self.kA or dashboard_g != self.kG or
-                dashboard_vmax != self.vmax or dashboard_amax != self.amax or dashboard_jerk != self.jerk):
-                self._apply_pidf_to_config(dashboard_p, dashboard_i, dashboard_d, dashboard_v, dashboard_s, 
-                                        dashboard_a, dashboard_g, dashboard_vmax, dashboard_amax, dashboard_jerk)
-            # self._put_telemetry_on_dashboard()
+        self.position_actual = self.signals.position
+        self._pub_position_actual.set(round(self.position_actual, 2))
+        self.velocity_actual = self.signals.velocity
+        self.current_actual = self.signals.stator_current
+        self.temperature_actual = self.signals.temperature
+        self._pub_velocity_actual.set(round(self.velocity_actual, 1))
+        if self.observer:
+            self._update_observer()
+        if self.feedforward_estimator and self.command_mode != "stopped":
+            self._update_feedforward_estimate()
+
+        if self._pidf_changed:
+            self._pidf_changed = False
+            self._apply_pidf_to_config(*(tunable.value for tunable in self._tunable_pidf))
+        self._report_finished_configs()
+
+    def _update_observer(self) -> None:
+        dt = self.signals.timestamp - self._observer_timestamp
+        self._observer_timestamp = self.signals.timestamp
+        if not 0.0 < dt < 0.1: # first sample or a long stall: restart from the measurement
+            self.observer.reset(self.velocity_actual)
+            return
+        self.observer.update(self.signals.motor_voltage, self.velocity_actual, dt)
+        self._pub_filtered_velocity.set(round(self.observer.velocity, 1))
+        self._pub_acceleration.set(round(self.observer.acceleration))
+        time_to_setpoint = self.observer.time_to_setpoint(self.velocity_setpoint, 5.0)
+        self._pub_time_to_setpoint.set(round(min(time_to_setpoint, 10.0), 2))
+
+    def _update_feedforward_estimate(self) -> None:
+        # Differentiate over the velocity frame's own timestamps. The loop timestamp would turn a frame that
+        # arrived late into a zero acceleration followed by a doubled one; a stale frame is just skipped.
+        dt = self.signals.velocity_timestamp - self._feedforward_timestamp
+        if dt <= 0.0:
+            return
+        acceleration = (self.velocity_actual - self._feedforward_velocity) / dt if dt < 0.1 else None
+        self._feedforward_timestamp = self.signals.velocity_timestamp
+        self._feedforward_velocity = self.velocity_actual
+        if acceleration is None or not self.feedforward_estimator.add_sample(self.signals.motor_voltage, self.velocity_actual, acceleration):
+            return
+        self._pub_suggested_ks.set(self._suggested_feedforward(self.feedforward_estimator.ks))
+        self._pub_suggested_kv.set(self._suggested_feedforward(self.feedforward_estimator.kv))
+        self._pub_suggested_ka.set(self._suggested_feedforward(self.feedforward_estimator.ka))
+        self._pub_feedforward_samples.set(self.feedforward_estimator.samples)
+        self._pub_feedforward_velocity_spread.set(round(self.feedforward_estimator.velocity_spread, 1))
+
+    def _suggested_feedforward(self, volts_gain: float) -> float:
+        return max(volts_gain, 0.0) / self._NOMINAL_VOLTS # a negative fit only means too little excitation
+
+    def _apply_suggested_feedforward(self) -> None:
+        estimator = self.feedforward_estimator
+        if estimator.samples < self._MIN_FEEDFORWARD_SAMPLES:
+            wpilib.reportWarning(f"{self.dashboard_name}: only {estimator.samples} feedforward samples, not applying", printTrace=False)
+            return
+        if estimator.velocity_spread < self._MIN_FEEDFORWARD_VELOCITY_SPREAD:
+            wpilib.reportWarning(f"{self.dashboard_name}: feedforward velocity spread {estimator.velocity_spread:.1f} rps, "
+                                 f"vary the speed more before applying", printTrace=False)
+            return
+        # Through the PIDF tunables, so the dashboard shows the new gains and periodic applies them on the config worker
+        self._tunable_pidf[3].set(self._suggested_feedforward(estimator.kv))
+        if estimator.ks_identifiable:
+            self._tunable_pidf[4].set(self._suggested_feedforward(estimator.ks))
+        else:
+            wpilib.reportWarning(f"{self.dashboard_name}: only one direction seen, kS is just an offset; keeping kS", printTrace=False)
+        self._tunable_pidf[5].set(self._suggested_feedforward(estimator.ka))
+        self._pidf_changed = True
 
     # -------------------------
     # Motor movement functions
@@ -216,10 +310,7 @@ class SS_Kraken(commands2.Subsystem):
     # Commands
     # -------------------------
     def get_dashboard_velocity_setpoint(self) -> float:
-        dashboard_velocity = SmartDashboard.getNumber(
-            f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Velocity Setpoint",
-            self.velocity_setpoint,
-        )
+        dashboard_velocity = self._tunable_velocity_setpoint.value # kept current by the NT listener
         return max(min(dashboard_velocity, self.max_rps), -self.max_rps)
 
     def get_velocity_setpoint(self) -> float:
@@ -228,28 +319,22 @@ class SS_Kraken(commands2.Subsystem):
     def set_velocity_setpoint(self, setpoint: float, publish_dashboard: bool = True) -> float:
         self.velocity_setpoint = max(min(setpoint, self.max_rps), -self.max_rps)
         if publish_dashboard:
-            SmartDashboard.putNumber(
-                f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Velocity Setpoint",
-                self.velocity_setpoint,
-            )
+            self._tunable_velocity_setpoint.set(self.velocity_setpoint)
         return self.velocity_setpoint
 
     def get_dashboard_power_percent_setpoint(self) -> float:
-        dashboard_power = SmartDashboard.getNumber(
-            f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Power Percent Setpoint",
-            self.percent_power_setpoint,
-        )
+        dashboard_power = self._tunable_power_percent_setpoint.value # kept current by the NT listener
         return max(min(dashboard_power, 1.0), -1.0)
 
     def set_power_percent_setpoint(self, setpoint: float, publish_dashboard: bool = True) -> float:
         self.percent_power_setpoint = max(min(setpoint, 1.0), -1.0)
         if publish_dashboard:
-            SmartDashboard.putNumber(
-                f"SS_Telemetry/{self.dashboard_name}/{self.dashboard_name} Power Percent Setpoint",
-                self.percent_power_setpoint,
-            )
+            self._tunable_power_percent_setpoint.set(self.percent_power_setpoint)
         return self.percent_power_setpoint
 
+    def apply_suggested_feedforward(self):
+        return commands2.cmd.runOnce(self._apply_suggested_feedforward).ignoringDisable(True)
+
     def stop_motor(self):
         return commands2.cmd.runOnce(lambda: self._stop_motor(), self)
 
@@ -328,7 +413,7 @@ class SS_Kraken(commands2.Subsystem):
             lambda: self._run_at_velocity(self.velocity_setpoint),
             lambda: None,
             lambda interrupted: wpilib.reportWarning(f"SpinUpAndWait_Command {'interrupted before reaching target velocity!' if interrupted else 'reached target velocity!'}", printTrace=False),
-            lambda: abs(self.velocity_actual - self.velocity_setpoint) < 10,
+            lambda: self.will_be_at_velocity(10),
             self )
 
     def spin_up_and_wait_supplier(self, velocity_supplier):
@@ -343,7 +428,7 @@ class SS_Kraken(commands2.Subsystem):
                 f"SpinUpAndWait_Command {'interrupted before reaching target velocity!' if interrupted else 'reached target velocity!'}",
                 printTrace=False,
             ),
-            lambda: abs(self.velocity_actual - self.velocity_setpoint) < 10,
+            lambda: self.will_be_at_velocity(10),
             self,
         )
 
@@ -358,6 +443,12 @@ class SS_Kraken(commands2.Subsystem):
     def is_at_velocity(self, tolerance: float = 5.0) -> bool:
         return abs(self.velocity_actual - self.velocity_setpoint) < tolerance
 
+    def will_be_at_velocity(self, tolerance: float = 5.0) -> bool:
+        """Fire gate: with an observer, true once the velocity predicted fire_lookahead_s ahead is within tolerance."""
+        if self.observer is None:
+            return self.is_at_velocity(tolerance)
+        return abs(self.observer.predicted_velocity(self._fire_lookahead_s) - self.velocity_setpoint) < tolerance
+
     def rotate_to_position_and_wait(self, target_rotations = None):
         if target_rotations is None:
             target_rotations = self.position_setpoint
@@ -2,12 +2,19 @@ import commands2
 import wpilib
 import math
 from enum import IntEnum
-from wpimath import applyDeadband
-from wpimath.filter import SlewRateLimiter
 from wpimath.units import rotationsToRadians
 from phoenix6 import swerve, SignalLogger
 from wpimath.kinematics import ChassisSpeeds
 from telemetry import Telemetry
+from subsystems.DashboardPublisher import DashboardPublisher
+from subsystems.TunableParameters import TunableNumber
+from subsystems.ShotTable import ShotTable
+from subsystems.FieldGeometry import FieldGeometry
+from subsystems.DriverInput import DriverInput
+from subsystems.SwerveSetpointLimiter import SwerveSetpointLimiter
+from subsystems.POVPathCache import POVPathCache
+from subsystems.NavGrid import NavGrid
+from subsystems.ShotSolver import ShotSolver, ShotSolution
 from generated.tuner_constants_2026_GF import TunerConstants
 # from generated.tuner_constants_2025_old import TunerConstants
 from wpilib import DriverStation, Timer, SmartDashboard
@@ -28,20 +35,38 @@ class PathfindPOVTarget(IntEnum):
     TOP_LEFT = 315
 
 
+class DriveStateSnapshot:
+    """Drivetrain state captured once per loop, so every consumer in that loop sees the same pose."""
+
+    def __init__(self, pose: Pose2d | None = None, speeds: ChassisSpeeds | None = None,
+                 module_states: list | None = None, timestamp: float = 0.0) -> None:
+        self.pose = pose if pose is not None else Pose2d()
+        self.speeds = speeds if speeds is not None else ChassisSpeeds(0.0, 0.0, 0.0) # robot relative
+        self.module_states = module_states if module_states is not None else []
+        self.timestamp = timestamp
+
+
 class SS_SwerveDrive(commands2.Subsystem):
-    def __init__(self, joystick) -> None:
+    def __init__(self, joystick, driver_input: DriverInput) -> None:
         super().__init__()
-        self.alliance = DriverStation.getAlliance()
         self._joystick = joystick
+        self._driver_input = driver_input # sampled once per loop in robotPeriodic
         self._max_angular_rate = rotationsToRadians(0.75)
         self._max_speed_factor = 0.2
         self._max_speed = self._max_speed_factor * TunerConstants.speed_at_12_volts
         wpilib.SmartDashboard.putNumber("Swerve/Swerve Max Speed Factor", self._max_speed)
+        self._tunable_max_speed_factor = TunableNumber("Swerve/Swerve Max Speed Factor", self._max_speed_factor,
+                                                       self._on_dashboard_max_speed_factor, publish_default=False)
         self._pov_speed = 0.2
-        self._latest_pose = Pose2d()
-        self._latest_speeds = ChassisSpeeds(0.0, 0.0, 0.0)
         self._last_heading = Rotation2d()
         self.drivetrain = TunerConstants.create_drivetrain() # does this need to after swerve configs?
+        self.drive_state = DriveStateSnapshot()
+        self.last_pose_reset_time = 0.0 # vision drops frames captured before it; physics.py moves its ground truth
+        self.capture_drive_state()
+        self._robot_config = RobotConfig.fromGUISettings()
+        self._max_steer_velocity_rps = 100.0 / TunerConstants._steer_gear_ratio # Kraken X60 free speed through the steer gearing
+        self._setpoint_limiter = SwerveSetpointLimiter(self._robot_config, self._max_steer_velocity_rps)
+        self._limit_path_output = False # set while a pathfinding command drives the robot
         self._auto_translation_kp = 2.0
         self._auto_translation_ki = 0.0
         self._auto_translation_kd = 0.0
@@ -51,28 +76,45 @@ class SS_SwerveDrive(commands2.Subsystem):
         self._padlock_heading_kp = 5.0
         self._padlock_heading_ki = 1.0
         self._padlock_heading_kd = 0.0
-        wpilib.SmartDashboard.putNumber("Swerve/Auto Translation kP", self._auto_translation_kp)
-        wpilib.SmartDashboard.putNumber("Swerve/Auto Translation kI", self._auto_translation_ki)
-        wpilib.SmartDashboard.putNumber("Swerve/Auto Translation kD", self._auto_translation_kd)
-        wpilib.SmartDashboard.putNumber("Swerve/Auto Rotation kP", self._auto_rotation_kp)
-        wpilib.SmartDashboard.putNumber("Swerve/Auto Rotation kI", self._auto_rotation_ki)
-        wpilib.SmartDashboard.putNumber("Swerve/Auto Rotation kD", self._auto_rotation_kd)
-        wpilib.SmartDashboard.putNumber("Swerve/Lock On Target kP", self._padlock_heading_kp)
-        wpilib.SmartDashboard.putNumber("Swerve/Lock On Target kI", self._padlock_heading_ki)
-        wpilib.SmartDashboard.putNumber("Swerve/Lock On Target kD", self._padlock_heading_kd)
+        self._auto_pid_changed = False
+        self._tunable_auto_pid = [
+            TunableNumber("Swerve/Auto Translation kP", self._auto_translation_kp, self._on_dashboard_auto_pid),
+            TunableNumber("Swerve/Auto Translation kI", self._auto_translation_ki, self._on_dashboard_auto_pid),
+            TunableNumber("Swerve/Auto Translation kD", self._auto_translation_kd, self._on_dashboard_auto_pid),
+            TunableNumber("Swerve/Auto Rotation kP", self._auto_rotation_kp, self._on_dashboard_auto_pid),
+            TunableNumber("Swerve/Auto Rotation kI", self._auto_rotation_ki, self._on_dashboard_auto_pid),
+            TunableNumber("Swerve/Auto Rotation kD", self._auto_rotation_kd, self._on_dashboard_auto_pid),
+        ]
+        self._tunable_padlock_pid = [
+            TunableNumber("Swerve/Lock On Target kP", self._padlock_heading_kp, self._on_dashboard_padlock_pid),
+            TunableNumber("Swerve/Lock On Target kI", self._padlock_heading_ki, self._on_dashboard_padlock_pid),
+            TunableNumber("Swerve/Lock On Target kD", self._padlock_heading_kd, self._on_dashboard_padlock_pid),
+        ]
         # self._logger = Telemetry(self._max_speed)
         # self.drivetrain.register_telemetry( lambda state: self._logger.telemeterize(state) )
-        self._left_x_limiter = SlewRateLimiter(2.0)
-        self._left_y_limiter = SlewRateLimiter(2.0)
-        self._right_x_limiter = SlewRateLimiter(0.25)
-        self._right_y_limiter = SlewRateLimiter(1.5)
         self.x_vector_to_target = 0.0
         self.y_vector_to_target = 0.0
         self.range_to_target = 0.0
         self.target_x = 0.0
         self.target_y = 0.0
+        self.x_vector_to_aim = 0.0 # padlock heading: toward the shoot-while-moving virtual target
+        self.y_vector_to_aim = 0.0
+        self._shot_solver = ShotSolver(ShotTable.load())
+        self.shot_solution = ShotSolution()
         self._padlock_active = False
         self.stop_distance = 2.819 # Default stop distance
+        self._tunable_stop_distance = TunableNumber("Swerve/Stop Distance", self.stop_distance, self._on_dashboard_stop_distance)
+        self._pub_target_x_vector = DashboardPublisher.number("Swerve/Target X Vector", epsilon=0.005)
+        self._pub_target_y_vector = DashboardPublisher.number("Swerve/Target Y Vector", epsilon=0.005)
+        self._pub_target_x = DashboardPublisher.number("Swerve/Target X")
+        self._pub_target_y = DashboardPublisher.number("Swerve/Target Y")
+        self._pub_target_range = DashboardPublisher.number("Swerve/Target Range", epsilon=0.005)
+        self._pub_virtual_target_x = DashboardPublisher.number("Swerve/Virtual Target X", epsilon=0.005)
+        self._pub_virtual_target_y = DashboardPublisher.number("Swerve/Virtual Target Y", epsilon=0.005)
+        self._pub_shot_range = DashboardPublisher.number("Swerve/Shot Range", epsilon=0.005)
+        self._pub_pose_x = DashboardPublisher.number("Swerve/Swerve Pose X (meters)", epsilon=0.005)
+        self._pub_pose_y = DashboardPublisher.number("Swerve/Swerve Pose Y (meters)", epsilon=0.005)
+        self._pub_rotation = DashboardPublisher.number("Swerve/Swerve Rotation (deg)", epsilon=0.05)
         self.field = wpilib.Field2d()
         wpilib.SmartDashboard.putData("Field", self.field)
         self._pathfind_cancel_deadband = 0.20
@@ -106,13 +148,18 @@ class SS_SwerveDrive(commands2.Subsystem):
         self._setup_padlock_target_chooser()
         self._setup_pathfind_targets()
         self._setup_pathplanner_auto_builder()
+        self.navgrid = NavGrid.load() # O(1) obstacle / clearance queries for aiming and driver assists
+        self._pub_obstacle_clearance = DashboardPublisher.number("Swerve/Obstacle Clearance (m)", epsilon=0.05)
+        self._pov_paths = POVPathCache(self.navgrid, self._robot_config)
+        self._pub_pov_paths_planned = DashboardPublisher.number("Swerve/POV Paths Planned")
+        self._pub_pov_paths_failed = DashboardPublisher.number("Swerve/POV Paths Failed")
 
     def _request_command(self, request_supplier):
         """Create a drive command that requires this subsystem, not just the CTRE drivetrain."""
         return self.run(lambda: self.drivetrain.set_control(request_supplier()))
 
-    def periodic(self) -> None:
-        state = None
+    def capture_drive_state(self) -> DriveStateSnapshot:
+        """Read the drivetrain state once; get_pose(), get_robot_relative_speeds() and physics.py reuse it."""
         try:
             state = self.drivetrain.get_state()
         except Exception:
@@ -120,113 +167,165 @@ class SS_SwerveDrive(commands2.Subsystem):
 
         pose = getattr(state, "pose", None)
         if pose is not None:
-            self._latest_pose = pose
-            self._latest_speeds = getattr(state, "speeds", self._latest_speeds)
+            self.drive_state = DriveStateSnapshot(
+                pose,
+                getattr(state, "speeds", self.drive_state.speeds),
+                getattr(state, "module_states", self.drive_state.module_states),
+                getattr(state, "timestamp", self.drive_state.timestamp),
+            )
+        return self.drive_state
+
+    def periodic(self) -> None:
+        # Subsystem periodics run before triggers and commands, so everything this loop shares one snapshot
+        pose = self.capture_drive_state().pose
+        if pose is not None:
             self.target_x, self.target_y = self._determine_padlock_target(pose)
-            self.x_vector_to_target = self._latest_pose.translation().X() - self.target_x
-            self.y_vector_to_target = self._latest_pose.translation().Y() - self.target_y
-            if DriverStation.getAlliance() == DriverStation.Alliance.kRed:
+            self.x_vector_to_target = pose.translation().X() - self.target_x
+            self.y_vector_to_target = pose.translation().Y() - self.target_y
+            if FieldGeometry.is_red:
                 self.x_vector_to_target = -self.x_vector_to_target
                 self.y_vector_to_target = -self.y_vector_to_target
             self.range_to_target = (self.x_vector_to_target**2 + self.y_vector_to_target**2)**0.5
             self.x_direction_to_target = self.x_vector_to_target / self.range_to_target
             self.y_direction_to_target = self.y_vector_to_target / self.range_to_target
             self.speed_to_target = .8 * (self.range_to_target - self.stop_distance) # Subtract desired stopping distance from error calculation
+            self._solve_shot(pose)
 
-        dashboard_stop_distance = wpilib.SmartDashboard.getNumber("Swerve/Stop Distance", self.stop_distance)
-        dashboard_max_speed = wpilib.SmartDashboard.getNumber("Swerve/Swerve Max Speed Factor", self._max_speed_factor)
-        if dashboard_max_speed != self._max_speed_factor:
-            self._max_speed_factor = max(min(dashboard_max_speed, 1.0), 0.0) # Clamp between 0 and 1
-        if dashboard_stop_distance != self.stop_distance:
-            self.stop_distance = max(min(dashboard_stop_distance, 7.0), 0.0)
         self._new_dashboard_pid_values()
-        wpilib.SmartDashboard.putNumber("Swerve/Target X Vector", self.x_vector_to_target)
-        wpilib.SmartDashboard.putNumber("Swerve/Target Y Vector", self.y_vector_to_target)
-        wpilib.SmartDashboard.putNumber("Swerve/Target X", self.target_x)
-        wpilib.SmartDashboard.putNumber("Swerve/Target Y", self.target_y)
-        wpilib.SmartDashboard.putNumber("Swerve/Target Range", self.range_to_target)
-        wpilib.SmartDashboard.putNumber("Swerve/Stop Distance", self.stop_distance)
+        self._pub_target_x_vector.set(self.x_vector_to_target)
+        self._pub_target_y_vector.set(self.y_vector_to_target)
+        self._pub_target_x.set(self.target_x)
+        self._pub_target_y.set(self.target_y)
+        self._pub_target_range.set(self.range_to_target)
+        self._pub_virtual_target_x.set(self.shot_solution.virtual_target_x)
+        self._pub_virtual_target_y.set(self.shot_solution.virtual_target_y)
+        self._pub_shot_range.set(self.shot_solution.range_m)
 
         self._max_speed = self._max_speed_factor * TunerConstants.speed_at_12_volts
 
         # Dashboard pose output
-        pose_translation = self._latest_pose.translation()
-        pose_rotation = self._latest_pose.rotation()
-        SmartDashboard.putNumber("Swerve/Swerve Pose X (meters)", round(pose_translation.X(), 2))
-        SmartDashboard.putNumber("Swerve/Swerve Pose Y (meters)", round(pose_translation.Y(), 2))
-        SmartDashboard.putNumber("Swerve/Swerve Rotation (deg)", round(pose_rotation.degrees(), 1))
-        self.field.setRobotPose(self._latest_pose)
+        pose_translation = self.drive_state.pose.translation()
+        pose_rotation = self.drive_state.pose.rotation()
+        self._pub_pose_x.set(round(pose_translation.X(), 2))
+        self._pub_pose_y.set(round(pose_translation.Y(), 2))
+        self._pub_rotation.set(round(pose_rotation.degrees(), 1))
+        self.field.setRobotPose(self.drive_state.pose)
+        self._pub_obstacle_clearance.set(self.navgrid.clearance(pose_translation.X(), pose_translation.Y()))
+
+        if DriverStation.isDisabled(): # pre-plan the POV zone paths while nothing else needs the pathfinder
+            pov_path_key = self._pov_path_key()
+            self._pov_paths.plan_step(pov_path_key, FieldGeometry.pov_zone_goals, self._pathfind_constraints())
+            self._pub_pov_paths_planned.set(self._pov_paths.planned_count(pov_path_key))
+            self._pub_pov_paths_failed.set(self._pov_paths.failed_plans)
+        else:
+            self._pov_paths.interrupt()
+
+    def _solve_shot(self, pose: Pose2d) -> None:
+        # One solution per loop: the padlock heading aims at its virtual target and the shooter spins for its range
+        speeds = self.drive_state.speeds # robot relative
+        heading = pose.rotation()
+        velocity_x = speeds.vx * heading.cos() - speeds.vy * heading.sin()
+        velocity_y = speeds.vx * heading.sin() + speeds.vy * heading.cos()
+        self.shot_solution = self._shot_solver.solve(pose.translation(), velocity_x, velocity_y, self.target_x, self.target_y)
+        self.x_vector_to_aim = pose.translation().X() - self.shot_solution.virtual_target_x
+        self.y_vector_to_aim = pose.translation().Y() - self.shot_solution.virtual_target_y
+        if FieldGeometry.is_red:
+            self.x_vector_to_aim = -self.x_vector_to_aim
+            self.y_vector_to_aim = -self.y_vector_to_aim
 
     def _determine_padlock_target(self, pose: Pose2d) -> tuple:
         selected_target = self._padlock_target_chooser.getSelected()
-        if selected_target == (-1.0, -1.0) or selected_target is None: 
+        if (selected_target == (-1.0, -1.0) or selected_target is None) and FieldGeometry.target is not None:
             # If "Auto Targetting" is selected, choose target based on alliance and position
-            if DriverStation.getAlliance() == DriverStation.Alliance.kBlue:
-                    selected_target = (4.6, 4.0)
-
-            elif DriverStation.getAlliance() == DriverStation.Alliance.kRed:
-                    selected_target = (11.94, 4.0)
-
+            selected_target = FieldGeometry.target
         return selected_target
 
     # -------------------------
     # Drive mode switching for joystick/gamepad control
     # -------------------------
     def drive_mode_field_centered(self) -> None:
-            return self._request_command(lambda: (
-                self._drive_field_centered
-                    .with_velocity_x(-self._smoothed_axis(self._joystick.getLeftY(), self._left_y_limiter, square_input=True)* self._max_speed)
-                    .with_velocity_y(-self._smoothed_axis(self._joystick.getLeftX(), self._left_x_limiter, square_input=True)* self._max_speed)
-                    .with_rotational_rate(-self._joystick.getRightX() * abs(self._joystick.getRightX()) * self._max_angular_rate)
+            return self._request_command(lambda: self._build_field_centered_request(
+                self._driver_input.translation_x * self._max_speed,
+                self._driver_input.translation_y * self._max_speed,
+                self._driver_input.rotation * self._max_angular_rate,
         ))
     
     def drive_mode_non_smoothed(self) -> None:
-        return self._request_command(lambda: (
-            self._drive_field_centered
-            .with_velocity_x(-self._joystick.getLeftY() * abs(self._joystick.getLeftY()) * self._max_speed)
-            .with_velocity_y(-self._joystick.getLeftX() * abs(self._joystick.getLeftX()) * self._max_speed)
-                .with_rotational_rate(-self._joystick.getRightX() * abs(self._joystick.getRightX()) * self._max_angular_rate)
+        return self._request_command(lambda: self._build_field_centered_request(
+            self._driver_input.translation_x_unsmoothed * self._max_speed,
+            self._driver_input.translation_y_unsmoothed * self._max_speed,
+            self._driver_input.rotation * self._max_angular_rate,
     ))
 
     def drive_mode_angular(self):
-        return self._request_command(lambda: (
-            self._drive_facing_direction
-                .with_velocity_x(-self._smoothed_axis(self._joystick.getLeftY(), self._left_y_limiter, square_input=True)* self._max_speed)
-                .with_velocity_y(-self._smoothed_axis(self._joystick.getLeftX(), self._left_x_limiter, square_input=True)* self._max_speed)
-                .with_target_direction(self._heading_from_right_stick())
-                .with_heading_pid(1, 10, 0.2)
-        ))
+        return self._request_command(lambda: self._build_facing_request(
+            self._drive_facing_direction,
+            self._limited_robot_speeds(self._driver_input.translation_x * self._max_speed, self._driver_input.translation_y * self._max_speed),
+            self._heading_from_right_stick(),
+        ).with_heading_pid(1, 10, 0.2))
     
     def drive_mode_hybrid(self):
-        return self._request_command(lambda: (
-            self._drive_field_facing
-                .with_velocity_x(-self._smoothed_axis(self._joystick.getLeftY(), self._left_y_limiter, square_input=True) * self._max_speed)
-                .with_velocity_y(-self._smoothed_axis(self._joystick.getLeftX(), self._left_x_limiter, square_input=True) * self._max_speed)
-                .with_target_direction(self._heading_from_right_stick())
+        return self._request_command(lambda: self._build_facing_request(
+            self._drive_field_facing,
+            self._limited_field_speeds(self._driver_input.translation_x * self._max_speed, self._driver_input.translation_y * self._max_speed),
+            self._heading_from_right_stick(),
         ))
     
     def drive_mode_padlocked(self) -> None:
         return self._request_command(
             lambda: self._build_padlock_request(
-                -self._smoothed_axis(self._joystick.getLeftY(), self._left_y_limiter, square_input=True) * self._max_speed,
-                -self._smoothed_axis(self._joystick.getLeftX(), self._left_x_limiter, square_input=True) * self._max_speed,
+                self._driver_input.translation_x * self._max_speed,
+                self._driver_input.translation_y * self._max_speed,
             )
         )
 
     def drive_mode_robot_centered(self) -> None:
-            return self._request_command(lambda: (
-                self._drive_robot_centered
-                    .with_velocity_x(-self._joystick.getLeftY() * abs(self._joystick.getLeftY()) * self._max_speed)
-                    .with_velocity_y(-self._joystick.getLeftX() * abs(self._joystick.getLeftX()) * self._max_speed)
-                    .with_rotational_rate(-self._joystick.getRightX() * abs(self._joystick.getRightX()) * self._max_angular_rate)
+            return self._request_command(lambda: self._build_robot_centered_request(
+                self._driver_input.translation_x_unsmoothed * self._max_speed,
+                self._driver_input.translation_y_unsmoothed * self._max_speed,
+                self._driver_input.rotation * self._max_angular_rate,
         ))
 
-    def _smoothed_axis(self, raw_axis: float, limiter: SlewRateLimiter,
-                    deadband: float = 0.12, square_input: bool = False) -> float:
-        axis = applyDeadband(raw_axis, deadband)
-        if square_input:
-            axis = axis * abs(axis)
-        return limiter.calculate(axis)
+    # -------------------------
+    # Setpoint generator - teleop and pathfinding requests are limited to what the modules and tires can actually do
+    # -------------------------
+    def _limited_field_speeds(self, velocity_x: float, velocity_y: float, rotational_rate: float | None = None) -> ChassisSpeeds:
+        # Requests that hold a heading get their rotation from CTRE's heading PID, so only translation is limited
+        if rotational_rate is None:
+            rotational_rate = self.drive_state.speeds.omega
+        heading = self.drive_state.pose.rotation() - self.drivetrain.get_operator_forward_direction() # requests are operator perspective
+        return self._setpoint_limiter.limit_field_relative(velocity_x, velocity_y, rotational_rate, heading, self.drive_state)
+
+    def _limited_robot_speeds(self, velocity_x: float, velocity_y: float, rotational_rate: float | None = None) -> ChassisSpeeds:
+        if rotational_rate is None:
+            rotational_rate = self.drive_state.speeds.omega
+        return self._setpoint_limiter.limit(ChassisSpeeds(velocity_x, velocity_y, rotational_rate), self.drive_state).robot_relative_speeds
+
+    def _build_field_centered_request(self, velocity_x: float, velocity_y: float, rotational_rate: float):
+        speeds = self._limited_field_speeds(velocity_x, velocity_y, rotational_rate)
+        return (
+            self._drive_field_centered
+            .with_velocity_x(speeds.vx)
+            .with_velocity_y(speeds.vy)
+            .with_rotational_rate(speeds.omega)
+        )
+
+    def _build_robot_centered_request(self, velocity_x: float, velocity_y: float, rotational_rate: float):
+        speeds = self._limited_robot_speeds(velocity_x, velocity_y, rotational_rate)
+        return (
+            self._drive_robot_centered
+            .with_velocity_x(speeds.vx)
+            .with_velocity_y(speeds.vy)
+            .with_rotational_rate(speeds.omega)
+        )
+
+    def _build_facing_request(self, request, speeds: ChassisSpeeds, target_direction: Rotation2d):
+        return (
+            request
+            .with_velocity_x(speeds.vx)
+            .with_velocity_y(speeds.vy)
+            .with_target_direction(target_direction)
+        )
 
 
     # -------------------------
@@ -249,37 +348,59 @@ class SS_SwerveDrive(commands2.Subsystem):
         if target_pose is None:
             return commands2.cmd.none()
 
-        constraints = PathConstraints(
-            wpilib.SmartDashboard.getNumber("Swerve/Pathfind Max Velocity", 2.5),
-            wpilib.SmartDashboard.getNumber("Swerve/Pathfind Max Acceleration", 2.0),
-            rotationsToRadians(wpilib.SmartDashboard.getNumber("Swerve/Pathfind Max Angular Velocity (rot∕s)", 0.75)),
-            rotationsToRadians(wpilib.SmartDashboard.getNumber("Swerve/Pathfind Max Angular Acceleration (rot∕s^2)", 1.5)),
+        pose = self.get_pose()
+        paths = self._pov_paths.find(self._pov_path_key(), pov_angle, pose)
+        if paths is None: # no pre-planned path from here (or its lead-in is blocked), fall back to pathfinding
+            return self._limiting_path_output(
+                AutoBuilder.pathfindToPoseFlipped(target_pose, self._pathfind_constraints(), 0.0)
+            ).until(self._driver_override_active)
+
+        # The cached path was built and its trajectory generated while disabled; only the short lead-in is built
+        # now. Its start heading is the nearest of POVPathCache.HEADINGS, so hold the heading the robot has.
+        heading = pose.rotation()
+        follow = commands2.cmd.sequence(*(AutoBuilder.followPath(path) for path in paths))
+        return self._limiting_path_output(follow).beforeStarting(
+            lambda: PPHolonomicDriveController.setRotationTargetOverride(lambda: heading)
+        ).finallyDo(
+            lambda interrupted: PPHolonomicDriveController.setRotationTargetOverride(None)
+        ).until(self._driver_override_active)
+
+    def _pathfind_constraints(self) -> PathConstraints:
+        return PathConstraints(
+            self._tunable_pathfind_max_velocity.value,
+            self._tunable_pathfind_max_acceleration.value,
+            rotationsToRadians(self._tunable_pathfind_max_angular_velocity.value),
+            rotationsToRadians(self._tunable_pathfind_max_angular_acceleration.value),
         )
 
-        return AutoBuilder.pathfindToPoseFlipped(target_pose, constraints, 0.0).until(
-            self._driver_override_active
+    def _pov_path_key(self) -> tuple:
+        # Cached POV paths are only valid for the alliance, lane values and constraints they were planned with
+        return (
+            FieldGeometry.alliance,
+            self._tunable_pathfind_opponent_x.value,
+            self._tunable_pathfind_alliance_x.value,
+            self._tunable_pathfind_left_lane_y.value,
+            self._tunable_pathfind_right_lane_y.value,
+            self._tunable_pathfind_max_velocity.value,
+            self._tunable_pathfind_max_acceleration.value,
+            self._tunable_pathfind_max_angular_velocity.value,
+            self._tunable_pathfind_max_angular_acceleration.value,
         )
 
-    def _get_pov_pathfind_pose(self, pov_angle: int) -> Pose2d | None:
-        zone_positions = {
-            PathfindPOVTarget.TOP_RIGHT: (
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Opponent X", 12.0),
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Right Lane Y", 0.5),
-            ),
-            PathfindPOVTarget.BOTTOM_RIGHT: (
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Alliance X", 4.0),
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Right Lane Y", 0.5),
-            ),
-            PathfindPOVTarget.BOTTOM_LEFT: (
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Alliance X", 4.0),
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Left Lane Y", 7.5),
-            ),
-            PathfindPOVTarget.TOP_LEFT: (
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Opponent X", 12.0),
-                wpilib.SmartDashboard.getNumber("Swerve/Pathfind Left Lane Y", 7.5),
-            ),
+    def _get_pov_zone_positions(self) -> dict:
+        opponent_x = self._tunable_pathfind_opponent_x.value
+        alliance_x = self._tunable_pathfind_alliance_x.value
+        left_lane_y = self._tunable_pathfind_left_lane_y.value
+        right_lane_y = self._tunable_pathfind_right_lane_y.value
+        return {
+            PathfindPOVTarget.TOP_RIGHT: (opponent_x, right_lane_y),
+            PathfindPOVTarget.BOTTOM_RIGHT: (alliance_x, right_lane_y),
+            PathfindPOVTarget.BOTTOM_LEFT: (alliance_x, left_lane_y),
+            PathfindPOVTarget.TOP_LEFT: (opponent_x, left_lane_y),
         }
 
+    def _get_pov_pathfind_pose(self, pov_angle: int) -> Pose2d | None:
+        zone_positions = self._get_pov_zone_positions()
         target_xy = zone_positions.get(PathfindPOVTarget(pov_angle)) if pov_angle in PathfindPOVTarget._value2member_map_ else None
         if target_xy is None:
             return None
@@ -288,12 +409,12 @@ class SS_SwerveDrive(commands2.Subsystem):
         return Pose2d(target_xy[0], target_xy[1], current_rotation)
 
     def _heading_from_right_stick(self) -> Rotation2d:
-        if DriverStation.getAlliance() == DriverStation.Alliance.kRed:
-            ry = -self._joystick.getRightX()
-            rx= -self._joystick.getRightY()
+        if FieldGeometry.is_red:
+            ry = -self._driver_input.right_x
+            rx= -self._driver_input.right_y
         else:
-            ry = self._joystick.getRightX()
-            rx = self._joystick.getRightY()
+            ry = self._driver_input.right_x
+            rx = self._driver_input.right_y
 
         mag = (rx * rx + ry * ry) ** 0.5
 
@@ -304,28 +425,17 @@ class SS_SwerveDrive(commands2.Subsystem):
         return self._last_heading
 
     def _driver_override_active(self) -> bool:
-        cancel_deadband = wpilib.SmartDashboard.getNumber(
-            "Swerve/Pathfind Cancel Deadband",
-            self._pathfind_cancel_deadband,
-        )
-        self._pathfind_cancel_deadband = max(min(cancel_deadband, 1.0), 0.0)
-
-        left_x = self._joystick.getLeftX()
-        left_y = self._joystick.getLeftY()
-        right_x = self._joystick.getRightX()
-        right_y = self._joystick.getRightY()
-
+        driver_input = self._driver_input
         return any(
             abs(axis) > self._pathfind_cancel_deadband
-            for axis in (left_x, left_y, right_x, right_y)
+            for axis in (driver_input.left_x, driver_input.left_y, driver_input.right_x, driver_input.right_y)
         )
 
     def free_rotate_drive_request_command(self, vx_requested, vy_requested, rotational_rate) -> commands2.Command:
-        return self._request_command(lambda: (
-            self._drive_field_centered
-                .with_velocity_x(vx_requested * self._max_speed)
-                .with_velocity_y(vy_requested * self._max_speed)
-                .with_rotational_rate(rotational_rate * self._max_angular_rate) 
+        return self._request_command(lambda: self._build_field_centered_request(
+            vx_requested * self._max_speed,
+            vy_requested * self._max_speed,
+            rotational_rate * self._max_angular_rate,
         ))
 
     def padlocked_drive_request_command(self, vx_requested, vy_requested, x_vector=0.0, y_vector=0.0) -> commands2.Command:
@@ -349,23 +459,20 @@ class SS_SwerveDrive(commands2.Subsystem):
         )
 
     def get_padlock_driver_velocity_x(self) -> float:
-        return -self._smoothed_axis(self._joystick.getLeftY(), self._left_y_limiter, square_input=True) * self._max_speed
+        return self._driver_input.translation_x * self._max_speed
 
     def get_padlock_driver_velocity_y(self) -> float:
-        return -self._smoothed_axis(self._joystick.getLeftX(), self._left_x_limiter, square_input=True) * self._max_speed
+        return self._driver_input.translation_y * self._max_speed
 
     def target_goal(self) -> None:
-        if DriverStation.getAlliance() == DriverStation.Alliance.kBlue:
-            tx, ty = (4.6, 4.0)
-        else:
-            tx, ty = (11.94, 4.0)
+        tx, ty = FieldGeometry.BLUE_TARGET if FieldGeometry.is_blue else FieldGeometry.RED_TARGET
 
         self._forced_padlock_target = (tx, ty)
         self.target_x = tx
         self.target_y = ty
 
         try:
-            pose = self._latest_pose
+            pose = self.drive_state.pose
             self.x_vector_to_target = tx - pose.translation().X()
             self.y_vector_to_target = ty - pose.translation().Y()
         except:
@@ -387,11 +494,10 @@ class SS_SwerveDrive(commands2.Subsystem):
         )
 
     def robot_pov_drive_request_command(self, direction_x, direction_y) -> commands2.Command:
-        return self._request_command(lambda: (
-            self._drive_robot_centered
-                .with_velocity_x(direction_x * self._pov_speed)
-                .with_velocity_y(direction_y * self._pov_speed)
-                .with_rotational_rate(0) 
+        return self._request_command(lambda: self._build_robot_centered_request(
+            direction_x * self._pov_speed,
+            direction_y * self._pov_speed,
+            0,
         ))
 
     def brake(self) -> None:
@@ -436,8 +542,8 @@ class SS_SwerveDrive(commands2.Subsystem):
                 PIDConstants(self._auto_translation_kp, self._auto_translation_ki, self._auto_translation_kd),
                 PIDConstants(self._auto_rotation_kp, self._auto_rotation_ki, self._auto_rotation_kd),
             ),
-            robot_config=RobotConfig.fromGUISettings(),
-            should_flip_path=lambda: DriverStation.getAlliance() == DriverStation.Alliance.kRed,
+            robot_config=self._robot_config,
+            should_flip_path=lambda: FieldGeometry.is_red,
             drive_subsystem=self
         )
 
@@ -455,45 +561,32 @@ class SS_SwerveDrive(commands2.Subsystem):
 
 
     def get_pose(self) -> Pose2d:
-        state = None
-        try:
-            state = self.drivetrain.get_state()
-        except Exception:
-            state = None
-        pose = getattr(state, "pose", None)
-        if state is not None:
-            self._latest_pose = pose
-        return self._latest_pose
+        return self.drive_state.pose
 
     def reset_pose(self, pose: Pose2d) -> None:
         self.drivetrain.reset_pose(pose)
-        self._latest_pose = pose
+        self.drive_state.pose = pose # later readers this loop see the reset pose
+        self.last_pose_reset_time = Timer.getFPGATimestamp()
 
     def get_robot_relative_speeds(self) -> ChassisSpeeds:
-        """Get the current robot-relative chassis speeds.
-        The underlying drivetrain may not yet have a valid state (especially
-        during early init or in simulation). Return a zero ChassisSpeeds if the
-        state is unavailable to avoid AttributeError.
+        """Get the current robot-relative chassis speeds from this loop's drive state snapshot.
+        The snapshot starts at zero speed, so this is safe before the drivetrain has a valid state.
         """
-        state = None
-        try:
-            state = self.drivetrain.get_state()
-        except Exception:
-            # Be defensive: if getting state raises, treat as no motion.
-            state = None
-
-        if state is None:
-            return ChassisSpeeds(0.0, 0.0, 0.0)
-
-        # Some drivetrain implementations may not include 'speeds' attribute
-        # (unlikely), so be defensive.
-        self._latest_speeds = getattr(state, "speeds", ChassisSpeeds(0.0, 0.0, 0.0))
-        return getattr(state, "speeds", ChassisSpeeds(0.0, 0.0, 0.0))
+        return self.drive_state.speeds
 
     def drive_robot_relative(self, robot_relative_speeds: ChassisSpeeds, drive_feedforwards=None) -> None:
+        # Path following output already respects the path's constraints, so it and its feedforwards go straight
+        # through. Pathfinding starts from whatever the driver was doing, so it is limited like teleop, keeping
+        # PathPlanner's feedforwards whenever the limiter didn't have to clip the command.
+        speeds = robot_relative_speeds
+        if self._limit_path_output:
+            setpoint = self._setpoint_limiter.limit(robot_relative_speeds, self.drive_state)
+            if drive_feedforwards is None or self._clipped(robot_relative_speeds, setpoint.robot_relative_speeds):
+                drive_feedforwards = setpoint.feedforwards
+            speeds = setpoint.robot_relative_speeds
         request = (
             swerve.requests.ApplyRobotSpeeds()
-            .with_speeds(robot_relative_speeds)
+            .with_speeds(speeds)
             .with_desaturate_wheel_speeds(True)
         )
         if drive_feedforwards is not None:
@@ -504,73 +597,83 @@ class SS_SwerveDrive(commands2.Subsystem):
             )
         self.drivetrain.set_control(request)
 
+    @staticmethod
+    def _clipped(desired: ChassisSpeeds, limited: ChassisSpeeds, tolerance: float = 1e-3) -> bool:
+        return (abs(desired.vx - limited.vx) > tolerance or abs(desired.vy - limited.vy) > tolerance
+                or abs(desired.omega - limited.omega) > tolerance)
+
+    def _limiting_path_output(self, command: commands2.Command) -> commands2.Command:
+        """Run command with its PathPlanner output going through the setpoint limiter."""
+        return command.beforeStarting(lambda: setattr(self, "_limit_path_output", True)).finallyDo(
+            lambda interrupted: setattr(self, "_limit_path_output", False))
+
     def _setup_padlock_target_chooser(self):
         # This is an example of how you might set up a dashboard chooser to select between different padlock targets (e.g., different scoring locations)
         self._padlock_target_chooser = wpilib.SendableChooser()
         self._padlock_target_chooser.setDefaultOption("Auto Targetting", (-1.0, -1.0)) # Choose a target based on alliance and position
-        self._padlock_target_chooser.addOption("Blue Target", (4.6, 4.0)) # Blue alliance target
-        self._padlock_target_chooser.addOption("Blue Top Zone", (4.0, 6.0)) # Red alliance target
-        self._padlock_target_chooser.addOption("Blue Bottom Zone", (4.0, 2.0)) # Red alliance target
-        self._padlock_target_chooser.addOption("Red Target", (11.94, 4.0)) # Red alliance target
-        self._padlock_target_chooser.addOption("Red Top Zone", (12.6, 6.0)) # Red alliance target
-        self._padlock_target_chooser.addOption("Red Bottom Zone", (12.6, 2.0)) # Red alliance target
+        self._padlock_target_chooser.addOption("Blue Target", FieldGeometry.BLUE_TARGET) # Blue alliance target
+        self._padlock_target_chooser.addOption("Blue Top Zone", FieldGeometry.BLUE_TOP_ZONE)
+        self._padlock_target_chooser.addOption("Blue Bottom Zone", FieldGeometry.BLUE_BOTTOM_ZONE)
+        self._padlock_target_chooser.addOption("Red Target", FieldGeometry.RED_TARGET) # Red alliance target
+        self._padlock_target_chooser.addOption("Red Top Zone", FieldGeometry.RED_TOP_ZONE)
+        self._padlock_target_chooser.addOption("Red Bottom Zone", FieldGeometry.RED_BOTTOM_ZONE)
         wpilib.SmartDashboard.putData("Swerve/Padlock Target Chooser", self._padlock_target_chooser)
 
     def _setup_pathfind_targets(self):
         # These are blue-alliance-origin coordinates. PathPlanner flips them for red at runtime.
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Opponent X", 12.0)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Alliance X", 4.0) 
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Left Lane Y", 7.5)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Right Lane Y", 0.5)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Max Velocity", 2.5)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Max Acceleration", 2.0)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Max Angular Velocity (rot∕s)", 0.75)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Max Angular Acceleration (rot∕s^2)", 1.5)
-        wpilib.SmartDashboard.putNumber("Swerve/Pathfind Cancel Deadband", self._pathfind_cancel_deadband)
+        self._tunable_pathfind_opponent_x = TunableNumber("Swerve/Pathfind Opponent X", 12.0, self._on_dashboard_pov_zones)
+        self._tunable_pathfind_alliance_x = TunableNumber("Swerve/Pathfind Alliance X", 4.0, self._on_dashboard_pov_zones)
+        self._tunable_pathfind_left_lane_y = TunableNumber("Swerve/Pathfind Left Lane Y", 7.5, self._on_dashboard_pov_zones)
+        self._tunable_pathfind_right_lane_y = TunableNumber("Swerve/Pathfind Right Lane Y", 0.5, self._on_dashboard_pov_zones)
+        self._tunable_pathfind_max_velocity = TunableNumber("Swerve/Pathfind Max Velocity", 2.5)
+        self._tunable_pathfind_max_acceleration = TunableNumber("Swerve/Pathfind Max Acceleration", 2.0)
+        self._tunable_pathfind_max_angular_velocity = TunableNumber("Swerve/Pathfind Max Angular Velocity (rot∕s)", 0.75)
+        self._tunable_pathfind_max_angular_acceleration = TunableNumber("Swerve/Pathfind Max Angular Acceleration (rot∕s^2)", 1.5)
+        self._tunable_cancel_deadband = TunableNumber("Swerve/Pathfind Cancel Deadband", self._pathfind_cancel_deadband,
+                                                      self._on_dashboard_cancel_deadband)
+        self._on_dashboard_pov_zones(0.0)
 
     def _build_padlock_request(self, velocity_x: float, velocity_y: float, x_vector: float | None = None, y_vector: float | None = None):
         if x_vector is None or y_vector is None or (x_vector == 0.0 and y_vector == 0.0):
-            x_vector = self.x_vector_to_target
-            y_vector = self.y_vector_to_target
+            x_vector = self.x_vector_to_aim
+            y_vector = self.y_vector_to_aim
 
-        return (
-            self._drive_field_facing
-            .with_velocity_x(velocity_x)
-            .with_velocity_y(velocity_y)
-            .with_target_direction(Rotation2d(x_vector, y_vector))
-            .with_heading_pid(self._padlock_heading_kp, self._padlock_heading_ki, self._padlock_heading_kd)
-        )
+        return self._build_facing_request(
+            self._drive_field_facing,
+            self._limited_field_speeds(velocity_x, velocity_y),
+            Rotation2d(x_vector, y_vector),
+        ).with_heading_pid(self._padlock_heading_kp, self._padlock_heading_ki, self._padlock_heading_kd)
 
-    def _new_dashboard_pid_values(self) -> None:
-        new_padlock_kp = wpilib.SmartDashboard.getNumber("Swerve/Lock On Target kP", self._padlock_heading_kp)
-        new_padlock_ki = wpilib.SmartDashboard.getNumber("Swerve/Lock On Target kI", self._padlock_heading_ki)
-        new_padlock_kd = wpilib.SmartDashboard.getNumber("Swerve/Lock On Target kD", self._padlock_heading_kd)
-        self._padlock_heading_kp = new_padlock_kp
-        self._padlock_heading_ki = new_padlock_ki
-        self._padlock_heading_kd = new_padlock_kd
-
-        new_auto_translation_kp = wpilib.SmartDashboard.getNumber("Swerve/Auto Translation kP", self._auto_translation_kp)
-        new_auto_translation_ki = wpilib.SmartDashboard.getNumber("Swerve/Auto Translation kI", self._auto_translation_ki)
-        new_auto_translation_kd = wpilib.SmartDashboard.getNumber("Swerve/Auto Translation kD", self._auto_translation_kd)
-        new_auto_rotation_kp = wpilib.SmartDashboard.getNumber("Swerve/Auto Rotation kP", self._auto_rotation_kp)
-        new_auto_rotation_ki = wpilib.SmartDashboard.getNumber("Swerve/Auto Rotation kI", self._auto_rotation_ki)
-        new_auto_rotation_kd = wpilib.SmartDashboard.getNumber("Swerve/Auto Rotation kD", self._auto_rotation_kd)
-
-        auto_pid_changed = (
-            new_auto_translation_kp != self._auto_translation_kp
-            or new_auto_translation_ki != self._auto_translation_ki
-            or new_auto_translation_kd != self._auto_translation_kd
-            or new_auto_rotation_kp != self._auto_rotation_kp
-            or new_auto_rotation_ki != self._auto_rotation_ki
-            or new_auto_rotation_kd != self._auto_rotation_kd
-        )
+    # -------------------------
+    # Dashboard edits - called from TunableParameters.drain() at the start of each loop
+    # -------------------------
+    def _on_dashboard_max_speed_factor(self, value: float) -> None:
+        self._max_speed_factor = max(min(value, 1.0), 0.0) # Clamp between 0 and 1
+
+    def _on_dashboard_stop_distance(self, value: float) -> None:
+        self.stop_distance = max(min(value, 7.0), 0.0)
+        if self.stop_distance != value: # only write back when clamped
+            self._tunable_stop_distance.set(self.stop_distance)
+
+    def _on_dashboard_cancel_deadband(self, value: float) -> None:
+        self._pathfind_cancel_deadband = max(min(value, 1.0), 0.0)
+
+    def _on_dashboard_pov_zones(self, value: float) -> None:
+        # FieldGeometry flips them once per edit or alliance change, not on every read
+        FieldGeometry.set_pov_zones({int(pov_target): xy for pov_target, xy in self._get_pov_zone_positions().items()})
 
-        self._auto_translation_kp = new_auto_translation_kp
-        self._auto_translation_ki = new_auto_translation_ki
-        self._auto_translation_kd = new_auto_translation_kd
-        self._auto_rotation_kp = new_auto_rotation_kp
-        self._auto_rotation_ki = new_auto_rotation_ki
-        self._auto_rotation_kd = new_auto_rotation_kd
+    def _on_dashboard_padlock_pid(self, value: float) -> None:
+        self._padlock_heading_kp, self._padlock_heading_ki, self._padlock_heading_kd = (
+            tunable.value for tunable in self._tunable_padlock_pid)
 
-        if auto_pid_changed:
-            self._setup_pathplanner_auto_builder()
+    def _on_dashboard_auto_pid(self, value: float) -> None:
+        self._auto_pid_changed = True # several gains edited in one loop only reconfigure AutoBuilder once
+
+    def _new_dashboard_pid_values(self) -> None:
+        if not self._auto_pid_changed:
+            return
+        self._auto_pid_changed = False
+        (self._auto_translation_kp, self._auto_translation_ki, self._auto_translation_kd,
+         self._auto_rotation_kp, self._auto_rotation_ki, self._auto_rotation_kd) = (
+            tunable.value for tunable in self._tunable_auto_pid)
+        self._setup_pathplanner_auto_builder()
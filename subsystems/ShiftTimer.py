@@ -1,5 +1,6 @@
 import wpilib
 import commands2
+from subsystems.DashboardPublisher import DashboardPublisher
 
 class ShiftTimer():
     def __init__(self, match_timer: wpilib.Timer) -> None:
@@ -14,11 +15,13 @@ class ShiftTimer():
                                 ("End Game", 30),
                                 ]
         self.current_shift = "Transition"
+        self._pub_current_shift = DashboardPublisher.string("Current Shift")
+        self._pub_time_remaining = DashboardPublisher.number("Time Remaining", epsilon=0.05)
         self.update_dashboard()
 
     def update_dashboard(self):
         self.shooting_shift = not self.shooting_shift
-        wpilib.SmartDashboard.putString("Current Shift", self.current_shift)
+        self._pub_current_shift.set(self.current_shift)
         wpilib.SmartDashboard.putBoolean("Shooting Shift Active", self.shooting_shift)
 
     def its_periodic(self):
@@ -28,7 +31,7 @@ class ShiftTimer():
         current_time = self.match_timer.get()
 
         remaining_shift_time = current_time - self.next_shift_end
-        wpilib.SmartDashboard.putNumber("Time Remaining", self.next_shift_end - self.match_timer.get())
+        self._pub_time_remaining.set(self.next_shift_end - current_time)
 
         match self.current_shift:
             case "Transition":
@@ -0,0 +1,48 @@
+import math
+from wpimath.geometry import Translation2d
+from subsystems.ShotTable import ShotTable
+
+
+class ShotSolution:
+    """Where to aim and how fast to spin for one loop; the padlock heading and shooter RPS both use it."""
+
+    def __init__(self, virtual_target_x: float = 0.0, virtual_target_y: float = 0.0, range_m: float = 0.0,
+                 time_of_flight_s: float = 0.0, shooter_rps: float = 0.0, iterations: int = 0) -> None:
+        self.virtual_target_x = virtual_target_x
+        self.virtual_target_y = virtual_target_y
+        self.range_m = range_m
+        self.time_of_flight_s = time_of_flight_s
+        self.shooter_rps = shooter_rps
+        self.iterations = iterations
+
+
+class ShotSolver:
+    """
+    Shoot-while-moving: the ball keeps the robot's field velocity for its whole flight, so we aim
+    at a virtual target shifted by -velocity * time_of_flight. Time of flight depends on the range
+    to that virtual target, so the offset is iterated until it stops moving.
+    """
+
+    def __init__(self, shot_table: ShotTable, max_iterations: int = 5, tolerance_m: float = 0.01) -> None:
+        self._shot_table = shot_table
+        self._max_iterations = max_iterations
+        self._tolerance_m = tolerance_m
+
+    def solve(self, robot: Translation2d, velocity_x: float, velocity_y: float, target_x: float, target_y: float) -> ShotSolution:
+        """velocity_x/velocity_y are the robot's field-relative velocity in m/s."""
+        virtual_x, virtual_y = target_x, target_y
+        range_m = math.hypot(virtual_x - robot.X(), virtual_y - robot.Y())
+        time_of_flight = self._shot_table.lookup("time_of_flight_s", range_m)
+        iterations = 0
+        while iterations < self._max_iterations:
+            iterations += 1
+            next_x = target_x - velocity_x * time_of_flight
+            next_y = target_y - velocity_y * time_of_flight
+            moved = math.hypot(next_x - virtual_x, next_y - virtual_y)
+            virtual_x, virtual_y = next_x, next_y
+            range_m = math.hypot(virtual_x - robot.X(), virtual_y - robot.Y())
+            time_of_flight = self._shot_table.lookup("time_of_flight_s", range_m)
+            if moved < self._tolerance_m:
+                break
+        return ShotSolution(virtual_x, virtual_y, range_m, time_of_flight,
+                            self._shot_table.lookup("shooter_rps", range_m), iterations)
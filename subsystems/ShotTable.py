@@ -0,0 +1,77 @@
+import bisect
+import json
+import os
+import wpilib
+
+
+class ShotTable:
+    """
+    Range-to-shot lookup table read from a JSON file in the deploy directory. Each column
+    (shooter_rps, feeder_rps, time_of_flight_s, ...) is interpolated linearly with a binary search
+    and held at the end values outside the calibrated range. ShotTable.reload_changed() re-reads
+    any file edited on the roboRIO, so points can be calibrated at an event without a redeploy.
+    """
+    RANGE_KEY = "range_m"
+    _tables: dict[str, "ShotTable"] = {} # filename -> shared table
+
+    @classmethod
+    def load(cls, filename: str = "shot_table.json") -> "ShotTable":
+        if filename not in cls._tables:
+            cls._tables[filename] = ShotTable(os.path.join(wpilib.getDeployDirectory(), filename))
+        return cls._tables[filename]
+
+    @classmethod
+    def reload_changed(cls) -> None:
+        for table in cls._tables.values():
+            table.reload_if_changed()
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._modified_time = None
+        self._ranges: list[float] = []
+        self._columns: dict[str, list[float]] = {}
+        self.reload_if_changed()
+
+    def lookup(self, key: str, range_m: float) -> float:
+        ranges, column = self._ranges, self._columns.get(key)
+        if not column:
+            return 0.0
+        index = bisect.bisect_left(ranges, range_m)
+        if index == 0:
+            return column[0]
+        if index == len(ranges):
+            return column[-1]
+        fraction = (range_m - ranges[index - 1]) / (ranges[index] - ranges[index - 1])
+        return column[index - 1] + fraction * (column[index] - column[index - 1])
+
+    def reload_if_changed(self) -> None:
+        try:
+            modified_time = os.path.getmtime(self._path)
+        except OSError:
+            if self._modified_time is None:
+                wpilib.reportError(f"Shot table {self._path} not found", False)
+                self._modified_time = 0.0 # report once, keep checking in case it gets deployed
+            return
+        if modified_time == self._modified_time:
+            return
+        self._modified_time = modified_time
+        try:
+            ranges, columns = self._read()
+        except (OSError, ValueError, KeyError, TypeError) as error: # keep the previous table on a bad edit
+            wpilib.reportError(f"Shot table {self._path} not loaded: {error}", False)
+            return
+        self._ranges, self._columns = ranges, columns
+        wpilib.reportWarning(f"Shot table loaded: {len(ranges)} points, {', '.join(columns)}", printTrace=False)
+
+    def _read(self) -> tuple[list[float], dict[str, list[float]]]:
+        with open(self._path) as file:
+            points = json.load(file)["points"]
+        if not points:
+            raise ValueError("no points")
+        points = sorted(points, key=lambda point: float(point[self.RANGE_KEY]))
+        ranges = [float(point[self.RANGE_KEY]) for point in points]
+        if any(later <= earlier for earlier, later in zip(ranges, ranges[1:])):
+            raise ValueError(f"duplicate {self.RANGE_KEY} values")
+        keys = [key for key in points[0] if key != self.RANGE_KEY]
+        columns = {key: [float(point[key]) for point in points] for key in keys}
+        return ranges, columns
@@ -0,0 +1,42 @@
+from wpilib import Timer
+from wpimath.geometry import Rotation2d
+from wpimath.kinematics import ChassisSpeeds, SwerveModuleState
+from pathplannerlib.config import RobotConfig
+from pathplannerlib.util import DriveFeedforwards
+from pathplannerlib.util.swerve import SwerveSetpoint, SwerveSetpointGenerator
+
+
+class SwerveSetpointLimiter:
+    """
+    Runs PathPlanner's swerve setpoint generator in front of teleop and pathfinding drive requests.
+    Each module's acceleration is held under the wheel friction / motor torque limits from the
+    RobotConfig, and its steer rate under max_steer_velocity_rps, so hard direction changes don't
+    saturate modules or break traction. The previous setpoint is chained from loop to loop. It restarts from the
+    measured drivetrain state whenever the limiter hasn't been used for a while.
+    """
+
+    def __init__(self, robot_config: RobotConfig, max_steer_velocity_rps: float,
+                 period_seconds: float = 0.02, stale_after_seconds: float = 0.1) -> None:
+        self._generator = SwerveSetpointGenerator.from_rots_per_sec(robot_config, max_steer_velocity_rps)
+        self._num_modules = robot_config.numModules
+        self._period_seconds = period_seconds
+        self._stale_after_seconds = stale_after_seconds
+        self._setpoint: SwerveSetpoint | None = None
+        self._last_time = 0.0
+
+    def limit(self, desired_robot_relative: ChassisSpeeds, drive_state) -> SwerveSetpoint:
+        """drive_state is the loop's DriveStateSnapshot, used to restart from what the robot is actually doing."""
+        now = Timer.getFPGATimestamp()
+        if self._setpoint is None or now - self._last_time > self._stale_after_seconds:
+            module_states = list(drive_state.module_states) or [SwerveModuleState() for _ in range(self._num_modules)]
+            self._setpoint = SwerveSetpoint(drive_state.speeds, module_states, DriveFeedforwards.zeros(self._num_modules))
+        self._last_time = now
+        self._setpoint = self._generator.generateSetpoint(self._setpoint, desired_robot_relative, self._period_seconds)
+        return self._setpoint
+
+    def limit_field_relative(self, velocity_x: float, velocity_y: float, rotational_rate: float,
+                             heading: Rotation2d, drive_state) -> ChassisSpeeds:
+        """Same as limit(), for field (operator) relative speeds; heading is the robot's heading in that frame."""
+        robot_relative = ChassisSpeeds.fromFieldRelativeSpeeds(velocity_x, velocity_y, rotational_rate, heading)
+        limited = self.limit(robot_relative, drive_state).robot_relative_speeds
+        return ChassisSpeeds.fromRobotRelativeSpeeds(limited, heading)
@@ -0,0 +1,73 @@
+import queue
+from typing import Callable
+from ntcore import EventFlags, NetworkTableInstance
+
+
+class TunableNumber:
+    """
+    A SmartDashboard number that is pushed to the robot by an NT listener instead of being polled.
+    Changes are queued from the NT listener thread and applied by TunableParameters.drain().
+    """
+
+    def __init__(self, key: str, default: float, on_change: Callable[[float], None] | None = None,
+                 publish_default: bool = True) -> None:
+        self.key = key
+        self.value = default
+        self._on_change = on_change
+        self._entry = NetworkTableInstance.getDefault().getTable("SmartDashboard").getEntry(key)
+        if publish_default:
+            self._publish(default)
+        # kImmediate queues the current dashboard value once, like the first poll used to
+        self._listener = NetworkTableInstance.getDefault().addListener(
+            self._entry, EventFlags.kValueAll | EventFlags.kImmediate, self._queue_change)
+
+    def set(self, value: float) -> None:
+        """Publish a value from robot code and use it right away."""
+        self.value = value
+        self._publish(value)
+
+    def _publish(self, value: float) -> None:
+        self._entry.setDouble(value)
+
+    def _queue_change(self, event) -> None:
+        # Runs on the NT listener thread: only hand the value over to the main loop
+        value = event.data.value
+        if value.isDouble():
+            TunableParameters._changes.put((self, value.getDouble()))
+
+    def _apply(self, value: float) -> None:
+        if value == self.value:
+            return
+        self.value = value
+        if self._on_change is not None:
+            self._on_change(value)
+
+
+class TunableBoolean(TunableNumber):
+    """A SmartDashboard checkbox, pushed to the robot the same way as a TunableNumber."""
+
+    def _publish(self, value: bool) -> None:
+        self._entry.setBoolean(value)
+
+    def _queue_change(self, event) -> None:
+        value = event.data.value
+        if value.isBoolean():
+            TunableParameters._changes.put((self, value.getBoolean()))
+
+
+class TunableParameters:
+    """Queue of dashboard edits shared by every TunableNumber; drained once per loop in robotPeriodic."""
+    _changes: queue.SimpleQueue = queue.SimpleQueue()
+
+    @classmethod
+    def drain(cls) -> int:
+        latest_values = {}
+        while True:
+            try:
+                tunable, value = cls._changes.get_nowait()
+            except queue.Empty:
+                break
+            latest_values[tunable] = value # only the newest edit per key is applied
+        for tunable, value in latest_values.items():
+            tunable._apply(value)
+        return len(latest_values)
@@ -0,0 +1,35 @@
+from phoenix6 import SignalLogger
+from subsystems.DashboardPublisher import DashboardPublisher
+from subsystems.LoopTimer import RollingHistogram
+
+
+class VisionTelemetry:
+    """
+    Rolling per-frame histograms for one camera, to set exposure, resolution and pipelines against
+    a latency budget. Latency is capture to NT receipt (coprocessor pipeline and transport), processing
+    is the worker's pose estimation, fusion age is capture to add_vision_measurement (adds the worker's
+    polling and the main loop's drain), and correction is how far the fused frame moved the pose estimate.
+    publish() sends p50/p95/p99/max to NT and SignalLogger; robot.py calls it about once a second.
+    """
+    _METRICS = (("Latency", "ms"), ("Processing", "ms"), ("Fusion Age", "ms"), ("Correction", "cm"),
+                ("Heading Correction", "deg"), ("Tags Used", "tags"))
+
+    def __init__(self, label: str) -> None:
+        self._label = label
+        self._histograms = {name: RollingHistogram() for name, _ in self._METRICS}
+
+    def record(self, latency_ms: float, processing_ms: float, fusion_age_ms: float, correction_cm: float,
+               heading_correction_deg: float, tags_used: int) -> None:
+        for name, value in zip(self._histograms, (latency_ms, processing_ms, fusion_age_ms, correction_cm,
+                                                   heading_correction_deg, tags_used)):
+            self._histograms[name].add(value)
+
+    def publish(self) -> None:
+        for name, unit in self._METRICS:
+            p50, p95, p99, worst = self._histograms[name].percentiles()
+            key = f"Vision/{self._label} {name}"
+            DashboardPublisher.number(f"{key} p50 ({unit})", epsilon=0.01).set(round(p50, 2))
+            DashboardPublisher.number(f"{key} p95 ({unit})", epsilon=0.01).set(round(p95, 2))
+            DashboardPublisher.number(f"{key} p99 ({unit})", epsilon=0.01).set(round(p99, 2))
+            DashboardPublisher.number(f"{key} max ({unit})", epsilon=0.01).set(round(worst, 2))
+            SignalLogger.write_double_array(key, [p50, p95, p99, worst], unit)
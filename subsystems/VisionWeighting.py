@@ -0,0 +1,76 @@
+import math
+from collections import deque
+from wpimath.geometry import Pose2d, Translation2d
+from wpimath.kinematics import ChassisSpeeds
+from subsystems.TunableParameters import TunableNumber
+from subsystems.VisionWorker import VisionEstimate
+
+
+class VisionMeasurementWeighting:
+    """
+    Turns a VisionEstimate and the robot's speed into x/y/theta standard deviations for
+    add_vision_measurement, or None to reject it. Trust falls with the square of the average tag
+    distance (pixel noise grows with range), rises with the tag count, and falls with ambiguity and
+    robot speed (motion blur, timestamp error). The speed is the drivetrain's speed in the loop that
+    fuses the frame, not at its capture; frames are fused a loop or two after capture (see the Fusion
+    Age telemetry), so the two only differ under hard acceleration. A single tag's heading is left
+    to the gyro.
+
+    Estimates farther from the pose estimate than the outlier gate are rejected, unless one camera
+    keeps disagreeing the same way: when its last several rejected estimates all put the robot at
+    the same offset from the pose estimate, the pose estimate is the likelier one to be wrong (a
+    collision) and the camera is trusted again. Scattered rejections never add up to an override.
+    """
+    _SINGLE_TAG_THETA_STD = 1000.0 # radians, effectively ignored
+    _AGREEING_REJECTIONS_TO_OVERRIDE = 10
+    _AGREEMENT_TOLERANCE_M = 0.25 # how far a rejected estimate's offset may be from the streak's mean offset
+
+    def __init__(self) -> None:
+        self._tunable_xy_std = TunableNumber("Vision/Weighting XY Std Dev at 1m (m)", 0.1)
+        self._tunable_theta_std = TunableNumber("Vision/Weighting Theta Std Dev at 1m (rad)", 0.2)
+        self._tunable_max_ambiguity = TunableNumber("Vision/Weighting Max Ambiguity", 0.2)
+        self._tunable_max_distance = TunableNumber("Vision/Weighting Max Distance (m)", 6.0)
+        self._tunable_speed_scale = TunableNumber("Vision/Weighting Std Dev Scale per mps", 0.5)
+        self._tunable_turn_scale = TunableNumber("Vision/Weighting Std Dev Scale per radps", 0.5)
+        self._tunable_outlier_gate = TunableNumber("Vision/Weighting Outlier Gate (m)", 1.0)
+        self._rejected_offsets: dict[str, deque[Translation2d]] = {} # per camera, since the last estimate it passed
+
+    def std_devs(self, estimate: VisionEstimate, speeds: ChassisSpeeds,
+                 reference_pose: Pose2d | None) -> tuple[float, float, float] | None:
+        """
+        speeds is the robot relative speed this loop. reference_pose is the pose estimate at the frame's
+        capture time; None skips the outlier gate.
+        """
+        if estimate.average_distance > self._tunable_max_distance.value:
+            return None
+        if estimate.tag_count == 1 and estimate.ambiguity > self._tunable_max_ambiguity.value:
+            return None
+        if reference_pose is not None and not self._passes_gate(estimate, reference_pose):
+            return None
+
+        scale = (max(estimate.average_distance, 1.0) ** 2 / estimate.tag_count
+                 * (1.0 + estimate.ambiguity / max(self._tunable_max_ambiguity.value, 0.01))
+                 * (1.0 + self._tunable_speed_scale.value * math.hypot(speeds.vx, speeds.vy)
+                    + self._tunable_turn_scale.value * abs(speeds.omega)))
+        xy_std = self._tunable_xy_std.value * scale
+        theta_std = self._tunable_theta_std.value * scale if estimate.tag_count > 1 else self._SINGLE_TAG_THETA_STD
+        return (xy_std, xy_std, theta_std)
+
+    def _passes_gate(self, estimate: VisionEstimate, reference_pose: Pose2d) -> bool:
+        rejected = self._rejected_offsets.setdefault(estimate.camera_name,
+                                                     deque(maxlen=self._AGREEING_REJECTIONS_TO_OVERRIDE))
+        offset = estimate.pose.translation() - reference_pose.translation()
+        if offset.norm() <= self._tunable_outlier_gate.value:
+            rejected.clear()
+            return True
+        rejected.append(offset)
+        if len(rejected) == rejected.maxlen and self._agree(rejected):
+            rejected.clear()
+            return True
+        return False
+
+    def _agree(self, offsets: deque[Translation2d]) -> bool:
+        mean_x = sum(offset.X() for offset in offsets) / len(offsets)
+        mean_y = sum(offset.Y() for offset in offsets) / len(offsets)
+        return all(math.hypot(offset.X() - mean_x, offset.Y() - mean_y) <= self._AGREEMENT_TOLERANCE_M
+                   for offset in offsets)
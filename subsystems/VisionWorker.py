@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import deque
+import wpilib
+from wpimath.geometry import Pose2d, Transform3d
+from photonlibpy import PhotonCamera, PhotonPoseEstimator
+from robotpy_apriltag import AprilTagFieldLayout
+
+
+class VisionEstimate:
+    """
+    One robot pose estimate from a camera frame, stamped with the frame's capture time (FPGA seconds),
+    with what VisionMeasurementWeighting needs to weigh it: tags used, their average distance (m) and the
+    pose ambiguity (0 for multi-tag solves). latency_ms and processing_ms are for VisionTelemetry.
+    """
+    __slots__ = ("camera_name", "pose", "timestamp", "tag_count", "average_distance", "ambiguity",
+                 "latency_ms", "processing_ms")
+
+    def __init__(self, camera_name: str, pose: Pose2d, timestamp: float, tag_count: int = 1,
+                 average_distance: float = 0.0, ambiguity: float = 0.0) -> None:
+        self.camera_name = camera_name
+        self.pose = pose
+        self.timestamp = timestamp
+        self.tag_count = tag_count
+        self.average_distance = average_distance
+        self.ambiguity = ambiguity
+        self.latency_ms = 0.0
+        self.processing_ms = 0.0
+
+
+class VisionQueue:
+    """
+    Bounded, lock-protected hand-off from the vision worker threads to the main loop. When the main
+    loop falls behind, the oldest estimates are dropped (and counted per camera) so memory stays flat
+    and the estimates that are kept are the freshest.
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        self._lock = threading.Lock()
+        self._estimates: deque[VisionEstimate] = deque(maxlen=capacity)
+        self.overflow_drops: dict[str, int] = {}
+
+    def put(self, estimate: VisionEstimate) -> None:
+        with self._lock:
+            if len(self._estimates) == self._estimates.maxlen:
+                dropped_camera = self._estimates[0].camera_name
+                self.overflow_drops[dropped_camera] = self.overflow_drops.get(dropped_camera, 0) + 1
+            self._estimates.append(estimate)
+
+    def drain(self) -> list[VisionEstimate]:
+        """Everything queued since the last drain, oldest capture first."""
+        with self._lock:
+            estimates = list(self._estimates)
+            self._estimates.clear()
+        estimates.sort(key=lambda estimate: estimate.timestamp) # cameras interleave; each one is already in order
+        return estimates
+
+
+class VisionWorker:
+    """
+    Owns one PhotonCamera and its PhotonPoseEstimator on a daemon thread: reads unread pipeline results,
+    estimates the robot pose and puts it on the shared VisionQueue. The main loop only drains the queue,
+    so a camera costs it one add_vision_measurement per estimate and nothing else.
+
+    Every unread frame is used, oldest first, each with its own capture timestamp. frames_received counts
+    every frame read, frames_dropped the ones read while disabled or pushed out of a full queue; frames without
+    a usable tag are neither used nor dropped. The main loop counts frames_used and frames_rejected (outliers)
+    as it fuses them.
+    """
+
+    def __init__(self, camera_name: str, robot_to_camera: Transform3d, field_layout: AprilTagFieldLayout,
+                 queue: VisionQueue, poll_period: float = 0.01) -> None:
+        self.camera_name = camera_name
+        self.enabled = True # set from the main loop (dashboard toggle)
+        self.camera = PhotonCamera(camera_name)
+        self._estimator = PhotonPoseEstimator(field_layout, robot_to_camera)
+        self._queue = queue
+        self._poll_period = poll_period # PhotonCamera's NT subscription updates every 10 ms
+        self.frames_received = 0
+        self.frames_used = 0
+        self.frames_rejected = 0
+        self._frames_dropped_disabled = 0
+        threading.Thread(target=self._run, name=f"Vision {camera_name}", daemon=True).start()
+
+    @property
+    def frames_dropped(self) -> int:
+        return self._frames_dropped_disabled + self._queue.overflow_drops.get(self.camera_name, 0)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._poll_period)
+            try:
+                self._poll()
+            except Exception as error: # one bad frame shouldn't stop the camera
+                wpilib.reportWarning(f"Vision {self.camera_name}: {error}", printTrace=False)
+
+    def _poll(self) -> None:
+        results = self.camera.getAllUnreadResults() # always read, so the FIFO can't fill with stale frames
+        self.frames_received += len(results)
+        if not self.enabled:
+            self._frames_dropped_disabled += len(results)
+            return
+        results.sort(key=lambda result: result.getTimestampSeconds())
+        for result in results:
+            if not result.hasTargets():
+                continue
+            start = time.perf_counter()
+            estimate = self._estimate(result)
+            if estimate is not None:
+                estimate.latency_ms = result.getLatencyMillis() # capture to publish, on the coprocessor's synced clock
+                estimate.processing_ms = (time.perf_counter() - start) * 1000
+                self._queue.put(estimate)
+
+    def _estimate(self, result) -> VisionEstimate | None:
+        # All visible tags solved together on the coprocessor (multi-tag enabled in the PhotonVision UI),
+        # otherwise the single tag with the lowest ambiguity
+        est = self._estimator.estimateCoprocMultiTagPose(result)
+        if est is not None:
+            tag_ids = set(result.multitagResult.fiducialIDsUsed)
+            ambiguity = 0.0
+        else:
+            est = self._estimator.estimateLowestAmbiguityPose(result)
+            if est is None:
+                return None
+            target = min((target for target in result.targets if target.poseAmbiguity != -1), key=lambda target: target.poseAmbiguity)
+            tag_ids = {target.fiducialId}
+            ambiguity = target.poseAmbiguity
+        distances = [target.getBestCameraToTarget().translation().norm() for target in result.targets if target.fiducialId in tag_ids]
+        return VisionEstimate(self.camera_name, est.estimatedPose.toPose2d(), est.timestampSeconds,
+                              len(tag_ids), sum(distances) / len(distances), ambiguity)
@@ -0,0 +1,47 @@
+import pytest
+from ntcore import NetworkTableInstance
+from subsystems.DashboardPublisher import DashboardPublisher, _ChangePublisher
+
+
+class _RecordingPublisher:
+    def __init__(self) -> None:
+        self.values = []
+
+    def set(self, value) -> None:
+        self.values.append(value)
+
+
+def test_epsilon_suppresses_small_changes():
+    recorder = _RecordingPublisher()
+    publisher = _ChangePublisher(recorder, epsilon=0.25)
+    for value in (1.0, 1.125, 0.875, 1.25, 1.5, 1.625, 1.75, 1.875):
+        publisher.set(value)
+    # Compared with the last published value, so a slow drift still gets through
+    assert recorder.values == [1.0, 1.5, 1.875]
+
+
+def test_without_epsilon_only_exact_repeats_are_skipped():
+    recorder = _RecordingPublisher()
+    publisher = _ChangePublisher(recorder)
+    for value in ("a", "a", "b", "b", "a"):
+        publisher.set(value)
+    assert recorder.values == ["a", "b", "a"]
+
+
+def test_counts_and_publishes_to_networktables():
+    skipped, published = DashboardPublisher.skipped_writes, DashboardPublisher.published_writes
+    publisher = DashboardPublisher.number("Test/Dashboard Publisher Value", epsilon=0.01)
+    assert DashboardPublisher.number("Test/Dashboard Publisher Value", epsilon=0.01) is publisher # one publisher per key
+    publisher.set(3.0)
+    publisher.set(3.005)
+    publisher.set(3.5)
+    assert DashboardPublisher.published_writes - published == 2
+    assert DashboardPublisher.skipped_writes - skipped == 1
+    entry = NetworkTableInstance.getDefault().getTable("SmartDashboard").getEntry("Test/Dashboard Publisher Value")
+    assert entry.getDouble(0.0) == 3.5
+
+
+def test_epsilon_mismatch_raises():
+    DashboardPublisher.number("Test/Dashboard Publisher Epsilon", epsilon=0.05)
+    with pytest.raises(ValueError):
+        DashboardPublisher.number("Test/Dashboard Publisher Epsilon")
@@ -0,0 +1,23 @@
+from phoenix6 import StatusCode
+from subsystems.DeviceStartup import DeviceStartup
+
+
+def test_exception_fails_only_that_device():
+    calls = []
+
+    def broken() -> StatusCode:
+        calls.append("broken")
+        raise RuntimeError("CAN bus unavailable")
+
+    startup = DeviceStartup(max_workers=2, retries=2)
+    startup.add("Test Broken", broken)
+    startup.add("Test Working", lambda: StatusCode.OK)
+    assert not startup.wait_all(timeout_seconds=5.0) # reported, not raised
+    assert calls == ["broken"] * 3 # retried like a failed status
+
+
+def test_retries_until_ok():
+    statuses = iter([StatusCode.CONFIG_FAILED, StatusCode.OK])
+    startup = DeviceStartup(retries=2)
+    startup.add("Test Flaky", lambda: next(statuses))
+    assert startup.wait_all(timeout_seconds=5.0)
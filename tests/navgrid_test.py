@@ -0,0 +1,59 @@
+import math
+import random
+import pytest
+from wpimath.geometry import Translation2d
+from subsystems.NavGrid import NavGrid
+
+
+def _navgrid_json(grid, node_size=0.5):
+    return {"nodeSizeMeters": node_size, "grid": grid,
+            "field_size": {"x": len(grid[0]) * node_size, "y": len(grid) * node_size}}
+
+
+def _brute_force_clearance(grid, row, column, node_size):
+    distances = [math.hypot(row - other_row, column - other_column)
+                 for other_row, cells in enumerate(grid) for other_column, blocked in enumerate(cells) if blocked]
+    return min(distances) * node_size
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_clearance_matches_brute_force(seed):
+    generator = random.Random(seed)
+    grid = [[generator.random() < 0.15 for _ in range(23)] for _ in range(11)]
+    grid[0][0] = True # at least one obstacle
+    navgrid = NavGrid.compile(_navgrid_json(grid))
+    for row in range(11):
+        for column in range(23):
+            x, y = (column + 0.5) * 0.5, (row + 0.5) * 0.5
+            assert navgrid.is_free(x, y) == (not grid[row][column])
+            assert navgrid.clearance(x, y) == pytest.approx(_brute_force_clearance(grid, row, column, 0.5), abs=1e-5)
+
+
+def test_off_the_field_is_blocked():
+    navgrid = NavGrid.compile(_navgrid_json([[False, True], [False, False]]))
+    assert not navgrid.is_free(-0.1, 0.25)
+    assert not navgrid.is_free(0.25, 1.1)
+    assert navgrid.clearance(5.0, 5.0) == 0.0
+
+
+def test_segment_is_free():
+    grid = [[False] * 10 for _ in range(5)]
+    grid[2][5] = True
+    navgrid = NavGrid.compile(_navgrid_json(grid))
+    assert not navgrid.segment_is_free(Translation2d(0.25, 1.25), Translation2d(4.75, 1.25))
+    assert navgrid.segment_is_free(Translation2d(0.25, 0.25), Translation2d(4.75, 0.25))
+
+
+def test_sidecar_round_trip(tmp_path):
+    grid = [[(row * 7 + column) % 5 == 0 for column in range(9)] for row in range(4)]
+    navgrid = NavGrid.compile(_navgrid_json(grid))
+    path = str(tmp_path / "navgrid.bin")
+    navgrid.write_sidecar(path, b"h" * 20)
+    loaded = NavGrid._read_sidecar(path, b"h" * 20)
+    assert loaded is not None
+    assert NavGrid._read_sidecar(path, b"x" * 20) is None # navgrid.json changed since
+    for row in range(4):
+        for column in range(9):
+            x, y = (column + 0.5) * 0.5, (row + 0.5) * 0.5
+            assert loaded.is_free(x, y) == navgrid.is_free(x, y)
+            assert loaded.clearance(x, y) == pytest.approx(navgrid.clearance(x, y))
@@ -0,0 +1,41 @@
+import json
+import math
+import pytest
+from wpimath.geometry import Translation2d
+from subsystems.ShotSolver import ShotSolver
+from subsystems.ShotTable import ShotTable
+
+
+@pytest.fixture
+def shot_table(tmp_path):
+    path = tmp_path / "shot_table.json"
+    path.write_text(json.dumps({"points": [
+        {"range_m": 1.0, "shooter_rps": 40.0, "time_of_flight_s": 0.5},
+        {"range_m": 6.0, "shooter_rps": 90.0, "time_of_flight_s": 1.5},
+    ]}))
+    return ShotTable(str(path))
+
+
+def test_standing_still_aims_at_the_target(shot_table):
+    solution = ShotSolver(shot_table).solve(Translation2d(1.0, 4.0), 0.0, 0.0, 4.0, 4.0)
+    assert (solution.virtual_target_x, solution.virtual_target_y) == pytest.approx((4.0, 4.0))
+    assert solution.range_m == pytest.approx(3.0)
+    assert solution.time_of_flight_s == pytest.approx(0.9)
+    assert solution.shooter_rps == pytest.approx(60.0)
+    assert solution.iterations == 1
+
+
+def test_moving_converges_to_a_consistent_virtual_target(shot_table):
+    robot = Translation2d(1.0, 4.0)
+    solution = ShotSolver(shot_table, max_iterations=20, tolerance_m=1e-4).solve(robot, 1.0, 2.0, 4.0, 4.0)
+    # The ball flies for time_of_flight_s from the virtual target's range and drifts onto the real target
+    assert solution.virtual_target_x == pytest.approx(4.0 - 1.0 * solution.time_of_flight_s, abs=1e-3)
+    assert solution.virtual_target_y == pytest.approx(4.0 - 2.0 * solution.time_of_flight_s, abs=1e-3)
+    assert solution.range_m == pytest.approx(math.hypot(solution.virtual_target_x - 1.0, solution.virtual_target_y - 4.0))
+    assert solution.time_of_flight_s == pytest.approx(shot_table.lookup("time_of_flight_s", solution.range_m))
+    assert 1 < solution.iterations < 20
+
+
+def test_stops_at_the_iteration_cap(shot_table):
+    solution = ShotSolver(shot_table, max_iterations=2, tolerance_m=1e-9).solve(Translation2d(1.0, 4.0), 3.0, 3.0, 4.0, 4.0)
+    assert solution.iterations == 2
@@ -0,0 +1,55 @@
+import json
+import os
+import pytest
+from subsystems.ShotTable import ShotTable
+
+
+def _write_table(path, points, modified_time):
+    path.write_text(json.dumps({"points": points}))
+    os.utime(path, (modified_time, modified_time))
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    path = tmp_path / "shot_table.json"
+    _write_table(path, [
+        {"range_m": 4.0, "shooter_rps": 60.0, "time_of_flight_s": 1.0},
+        {"range_m": 2.0, "shooter_rps": 40.0, "time_of_flight_s": 0.6}, # out of order on purpose
+        {"range_m": 3.0, "shooter_rps": 45.0, "time_of_flight_s": 0.8},
+    ], 1000.0)
+    return path
+
+
+def test_interpolates_between_points(table_path):
+    table = ShotTable(str(table_path))
+    assert table.lookup("shooter_rps", 2.0) == pytest.approx(40.0)
+    assert table.lookup("shooter_rps", 2.5) == pytest.approx(42.5)
+    assert table.lookup("shooter_rps", 3.75) == pytest.approx(56.25)
+    assert table.lookup("time_of_flight_s", 3.5) == pytest.approx(0.9)
+
+
+def test_clamps_outside_the_calibrated_range(table_path):
+    table = ShotTable(str(table_path))
+    assert table.lookup("shooter_rps", 0.5) == pytest.approx(40.0)
+    assert table.lookup("shooter_rps", 9.0) == pytest.approx(60.0)
+    assert table.lookup("unknown_column", 3.0) == 0.0
+
+
+def test_reloads_only_when_the_file_changes(table_path):
+    table = ShotTable(str(table_path))
+    table_path.write_text(json.dumps({"points": [{"range_m": 2.0, "shooter_rps": 70.0}]}))
+    os.utime(table_path, (1000.0, 1000.0)) # same mtime: not re-read
+    table.reload_if_changed()
+    assert table.lookup("shooter_rps", 2.0) == pytest.approx(40.0)
+
+    _write_table(table_path, [{"range_m": 2.0, "shooter_rps": 70.0}, {"range_m": 4.0, "shooter_rps": 80.0}], 2000.0)
+    table.reload_if_changed()
+    assert table.lookup("shooter_rps", 3.0) == pytest.approx(75.0)
+    assert table.lookup("time_of_flight_s", 3.0) == 0.0
+
+
+def test_keeps_the_previous_table_on_a_bad_edit(table_path):
+    table = ShotTable(str(table_path))
+    _write_table(table_path, [{"range_m": 2.0, "shooter_rps": 70.0}, {"range_m": 2.0, "shooter_rps": 80.0}], 2000.0)
+    table.reload_if_changed()
+    assert table.lookup("shooter_rps", 2.5) == pytest.approx(42.5)
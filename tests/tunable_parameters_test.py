@@ -0,0 +1,74 @@
+import time
+import pytest
+from ntcore import NetworkTableInstance
+from subsystems.TunableParameters import TunableBoolean, TunableNumber, TunableParameters
+
+
+@pytest.fixture
+def make_tunable():
+    tunables = []
+
+    def make(key: str, default: float, on_change, tunable_class=TunableNumber) -> TunableNumber:
+        tunables.append(tunable_class(key, default, on_change))
+        return tunables[-1]
+
+    yield make
+    # A listener left behind outlives the NT instance the robot tests reset
+    for tunable in tunables:
+        NetworkTableInstance.getDefault().removeListener(tunable._listener)
+    TunableParameters.drain()
+
+
+def _drain_after_listener(timeout_seconds: float = 1.0) -> None:
+    # NT listeners run on their own thread; wait for them to queue before draining
+    deadline = time.monotonic() + timeout_seconds
+    while TunableParameters._changes.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    TunableParameters.drain()
+
+
+def test_drain_applies_only_the_newest_value_per_key(make_tunable):
+    applied = []
+    first = make_tunable("Test/Tunable First", 1.0, applied.append)
+    second = make_tunable("Test/Tunable Second", 2.0, applied.append)
+    _drain_after_listener() # the published defaults
+    applied.clear()
+
+    for value in (3.0, 4.0, 5.0):
+        TunableParameters._changes.put((first, value))
+    TunableParameters._changes.put((second, 6.0))
+    assert TunableParameters.drain() == 2
+    assert first.value == 5.0 and second.value == 6.0
+    assert applied == [5.0, 6.0]
+    assert TunableParameters.drain() == 0
+
+
+def test_unchanged_value_does_not_call_back(make_tunable):
+    applied = []
+    tunable = make_tunable("Test/Tunable Unchanged", 1.0, applied.append)
+    _drain_after_listener()
+    TunableParameters._changes.put((tunable, 1.0))
+    TunableParameters.drain()
+    assert applied == []
+
+
+def test_dashboard_edit_reaches_the_callback(make_tunable):
+    applied = []
+    tunable = make_tunable("Test/Tunable Dashboard", 1.0, applied.append)
+    _drain_after_listener()
+    tunable._entry.setDouble(7.5) # as if edited on the dashboard
+    _drain_after_listener()
+    assert tunable.value == 7.5
+    assert applied == [7.5]
+
+
+def test_boolean_dashboard_edit_reaches_the_callback(make_tunable):
+    applied = []
+    tunable = make_tunable("Test/Tunable Boolean", True, applied.append, TunableBoolean)
+    _drain_after_listener()
+    assert tunable._entry.getBoolean(False)
+    tunable._entry.setBoolean(False)
+    _drain_after_listener()
+    assert tunable.value is False
+    assert applied == [False]
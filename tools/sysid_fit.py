@@ -0,0 +1,216 @@
+"""
+Offline SysId fitter for the drivetrain and the SS_Kraken mechanisms, run on a laptop instead of the SysId GUI.
+
+Convert the hoot log first, then fit:
+    ./owlet -f wpilog input.hoot output.wpilog
+    python tools/sysid_fit.py output.wpilog
+
+Drive and steer motors are fit over the quasistatic/dynamic segments that the drivetrain's SysId
+routines mark in SysIdTranslation_State / SysIdSteer_State. The rotation routine (segments that
+log Rotational_Rate) fits the Pigeon's yaw rate and gives heading PID gains. SS_Kraken mechanisms
+have no SysId routine, so they are fit over every stretch where the motor was driven. Each fit is
+the discrete OLS SysId uses, x[k+1] = a x[k] + b u[k] + c sign(x[k]), vectorized over resampled segments.
+Gains are printed ready to paste into tuner_constants_2026_GF.py or the SS_Kraken arguments.
+"""
+import argparse
+import math
+import os
+import re
+import sys
+import numpy as np
+from wpiutil.log import DataLogReader
+from wpimath.controller import LinearQuadraticRegulator_1_1, LinearQuadraticRegulator_2_1
+from wpimath.system.plant import LinearSystemId
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generated.tuner_constants_2026_GF import TunerConstants
+
+KRAKEN_IDS = {"Shooter": 3, "Feeder": 1, "Intake": 4} # RobotContainer's SS_Kraken device ids
+DRIVE_IDS = (TunerConstants._front_left_drive_motor_id, TunerConstants._front_right_drive_motor_id,
+             TunerConstants._back_left_drive_motor_id, TunerConstants._back_right_drive_motor_id)
+STEER_IDS = (TunerConstants._front_left_steer_motor_id, TunerConstants._front_right_steer_motor_id,
+             TunerConstants._back_left_steer_motor_id, TunerConstants._back_right_steer_motor_id)
+NOMINAL_VOLTS = 12.0 # SS_Kraken's VelocityDutyCycle gains are duty cycle per rps
+TALONFX_PERIOD_S = 0.001 # onboard closed loop
+HEADING_PERIOD_S = 0.004 # swerve control thread at 250 Hz
+_SIGNAL_PATTERN = re.compile(r"(TalonFX|Pigeon2)-(\d+)[^/]*/(MotorVoltage|Velocity|AngularVelocityZWorld)$")
+
+
+# -------------------------
+# Log reading
+# -------------------------
+def read_log(path: str) -> tuple[dict, dict]:
+    """Returns ({(device, id, signal): (times, values)}, {name: [(time, string)]}) for the entries the fits use."""
+    numeric, strings, entries = {}, {}, {}
+    for record in DataLogReader(path):
+        if record.isStart():
+            start = record.getStartData()
+            match = _SIGNAL_PATTERN.search(start.name)
+            if match:
+                entries[start.entry] = ("numeric", (match.group(1), int(match.group(2)), match.group(3)), start.type)
+            elif start.name.endswith("Rotational_Rate"):
+                entries[start.entry] = ("numeric", ("Rotation", 0, "Rate"), start.type)
+            elif start.name.endswith("_State") and start.type == "string":
+                entries[start.entry] = ("string", start.name.rsplit("/", 1)[-1], start.type)
+            continue
+        entry = entries.get(record.getEntry())
+        if entry is None or record.isControl():
+            continue
+        kind, key, entry_type = entry
+        timestamp = record.getTimestamp() / 1e6
+        if kind == "string":
+            strings.setdefault(key, []).append((timestamp, record.getString()))
+        else:
+            value = record.getFloat() if entry_type == "float" else record.getInteger() if entry_type == "int64" else record.getDouble()
+            times, values = numeric.setdefault(key, ([], []))
+            times.append(timestamp)
+            values.append(value)
+    return {key: (np.asarray(times), np.asarray(values, dtype=float)) for key, (times, values) in numeric.items()}, strings
+
+
+def state_segments(states: list[tuple[float, str]]) -> list[tuple[float, float]]:
+    """Time ranges of the quasistatic/dynamic tests in a SysId state entry."""
+    segments = []
+    for (start, state), (end, _) in zip(states, states[1:] + [(math.inf, "none")]):
+        if state.startswith(("quasistatic", "dynamic")):
+            segments.append((start, end))
+    return segments
+
+
+def driven_segments(times: np.ndarray, volts: np.ndarray, min_volts: float = 0.5, max_gap_s: float = 0.1) -> list[tuple[float, float]]:
+    driven_times = times[np.abs(volts) > min_volts]
+    if driven_times.size < 2:
+        return []
+    breaks = np.flatnonzero(np.diff(driven_times) > max_gap_s)
+    starts = np.concatenate(([driven_times[0]], driven_times[breaks + 1]))
+    ends = np.concatenate((driven_times[breaks], [driven_times[-1]]))
+    return list(zip(starts, ends))
+
+
+# -------------------------
+# Fitting
+# -------------------------
+class Fit:
+    def __init__(self, ks: float, kv: float, ka: float, r_squared: float, samples: int) -> None:
+        self.ks, self.kv, self.ka = ks, kv, ka
+        self.r_squared = r_squared
+        self.samples = samples
+
+
+def fit_feedforward(input_signal: tuple, velocity_signal: tuple, segments: list, dt: float,
+                    min_velocity: float = 0.1) -> Fit | None:
+    """OLS over every segment resampled at dt: input held between samples, velocity interpolated.
+    Samples slower than min_velocity are dropped, since static friction holds there instead of the model."""
+    input_times, inputs = input_signal
+    velocity_times, velocities = velocity_signal
+    rows, targets = [], []
+    for start, end in segments:
+        start, end = max(start, input_times[0], velocity_times[0]), min(end, input_times[-1], velocity_times[-1])
+        grid = np.arange(start, end, dt)
+        if grid.size < 3:
+            continue
+        velocity = np.interp(grid, velocity_times, velocities)
+        held_input = inputs[np.clip(np.searchsorted(input_times, grid, side="right") - 1, 0, inputs.size - 1)]
+        moving = np.abs(velocity[:-1]) > min_velocity
+        rows.append(np.column_stack((velocity[:-1], held_input[:-1], np.sign(velocity[:-1])))[moving])
+        targets.append(velocity[1:][moving])
+    if not rows:
+        return None
+    x, y = np.concatenate(rows), np.concatenate(targets)
+    if y.size < 3:
+        return None
+    (alpha, beta, gamma), *_ = np.linalg.lstsq(x, y, rcond=None)
+    if not 0.0 < alpha < 1.0 or beta <= 0.0:
+        return None # not a stable first-order response: wrong signals or too little data
+    residual = y - x @ np.array((alpha, beta, gamma))
+    r_squared = 1.0 - residual.var() / y.var()
+    kv = (1.0 - alpha) / beta
+    return Fit(-gamma / beta, kv, -kv * dt / math.log(alpha), r_squared, y.size)
+
+
+def velocity_feedback(fit: Fit, velocity_tolerance: float, max_effort: float) -> float:
+    plant = LinearSystemId.identifyVelocitySystemMeters(fit.kv, fit.ka)
+    return LinearQuadraticRegulator_1_1(plant, (velocity_tolerance,), (max_effort,), TALONFX_PERIOD_S).K(0, 0)
+
+
+def position_feedback(fit: Fit, position_tolerance: float, velocity_tolerance: float, max_effort: float) -> tuple[float, float]:
+    plant = LinearSystemId.identifyPositionSystemMeters(fit.kv, fit.ka)
+    gains = LinearQuadraticRegulator_2_1(plant, (position_tolerance, velocity_tolerance), (max_effort,), HEADING_PERIOD_S).K()
+    return gains[0], gains[1]
+
+
+def sample_period(times: np.ndarray) -> float:
+    return float(np.clip(np.median(np.diff(times)), 0.001, 0.02))
+
+
+# -------------------------
+# Report
+# -------------------------
+def fit_motors(label: str, motor_ids: tuple, signals: dict, segments_for, velocity_tolerance: float, max_effort: float,
+               duty_cycle: bool = False) -> None:
+    fits = []
+    for motor_id in motor_ids:
+        volts, velocity = signals.get(("TalonFX", motor_id, "MotorVoltage")), signals.get(("TalonFX", motor_id, "Velocity"))
+        if volts is None or velocity is None:
+            print(f"# {label} TalonFX-{motor_id}: MotorVoltage/Velocity not in the log")
+            continue
+        fit = fit_feedforward(volts, velocity, segments_for(volts), sample_period(velocity[0]))
+        if fit is None:
+            print(f"# {label} TalonFX-{motor_id}: no usable segments")
+            continue
+        print(f"# {label} TalonFX-{motor_id}: kS={fit.ks:.4f} V, kV={fit.kv:.4f} V/rps, kA={fit.ka:.4f} V/(rps/s), "
+              f"r²={fit.r_squared:.3f}, {fit.samples} samples")
+        fits.append(fit)
+    if not fits:
+        return
+    # Modules share one set of gains: average them
+    mean = Fit(*(float(np.mean([getattr(fit, gain) for fit in fits])) for gain in ("ks", "kv", "ka", "r_squared")), sum(fit.samples for fit in fits))
+    kp = velocity_feedback(mean, velocity_tolerance, max_effort)
+    if duty_cycle:
+        print(f"{label}: kp={kp / NOMINAL_VOLTS:.4f}, kv={mean.kv / NOMINAL_VOLTS:.5f}, ks={mean.ks / NOMINAL_VOLTS:.5f}, ka={mean.ka / NOMINAL_VOLTS:.5f},")
+    else:
+        print(f"{label} = configs.Slot0Configs().with_k_p({kp:.4f}).with_k_i(0).with_k_d(0)"
+              f".with_k_s({mean.ks:.4f}).with_k_v({mean.kv:.4f}).with_k_a({mean.ka:.4f})")
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("wpilog", help="hoot log converted with owlet -f wpilog")
+    parser.add_argument("--kraken", action="append", default=[], metavar="NAME=ID", help="SS_Kraken mechanisms (default: Shooter, Feeder, Intake)")
+    parser.add_argument("--velocity-tolerance", type=float, default=1.0, help="LQR max velocity error, rps")
+    parser.add_argument("--max-effort", type=float, default=7.0, help="LQR max control effort, volts")
+    parser.add_argument("--heading-tolerance", type=float, default=math.radians(2.0), help="LQR max heading error, rad")
+    parser.add_argument("--heading-rate-tolerance", type=float, default=0.5, help="LQR max yaw rate error, rad/s")
+    parser.add_argument("--max-rotation-rate", type=float, default=4.0, help="LQR max heading controller output, rad/s")
+    args = parser.parse_args()
+    krakens = dict((name, int(motor_id)) for name, motor_id in (kraken.split("=") for kraken in args.kraken)) or KRAKEN_IDS
+
+    signals, states = read_log(args.wpilog)
+    translation = state_segments(states.get("SysIdTranslation_State", []))
+    steer_and_rotation = state_segments(states.get("SysIdSteer_State", []))
+    rotation_rate = signals.get(("Rotation", 0, "Rate"))
+    # The steer and rotation routines share SysIdSteer_State; rotation tests are the ones logging Rotational_Rate
+    is_rotation = lambda segment: rotation_rate is not None and np.any((rotation_rate[0] >= segment[0]) & (rotation_rate[0] < segment[1]))
+    rotation = [segment for segment in steer_and_rotation if is_rotation(segment)]
+    steer = [segment for segment in steer_and_rotation if not is_rotation(segment)]
+
+    fit_motors("_drive_gains", DRIVE_IDS, signals, lambda volts: translation, args.velocity_tolerance, args.max_effort)
+    fit_motors("_steer_gains", STEER_IDS, signals, lambda volts: steer, args.velocity_tolerance, args.max_effort)
+    for name, motor_id in krakens.items():
+        fit_motors(name, (motor_id,), signals, lambda volts: driven_segments(*volts), args.velocity_tolerance, args.max_effort, duty_cycle=True)
+
+    yaw_rate = signals.get(("Pigeon2", TunerConstants._pigeon_id, "AngularVelocityZWorld"))
+    if rotation and yaw_rate is not None:
+        yaw_rate_rad = (yaw_rate[0], np.radians(yaw_rate[1]))
+        fit = fit_feedforward(rotation_rate, yaw_rate_rad, rotation, sample_period(yaw_rate[0]))
+        if fit is None:
+            print("# Heading: no usable rotation segments")
+        else:
+            kp, kd = position_feedback(fit, args.heading_tolerance, args.heading_rate_tolerance, args.max_rotation_rate)
+            print(f"# Heading: yaw rate per commanded rate kV={fit.kv:.3f}, kA={fit.ka:.3f} s, r²={fit.r_squared:.3f}")
+            print(f".with_heading_pid({kp:.3f}, 0.0, {kd:.3f})")
+
+
+if __name__ == "__main__":
+    main()